@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Iterator, Optional
+import hashlib
 
 from src.lib.identity import Identity
 from src.lib.identity_parser import IdentityParser
@@ -63,6 +64,7 @@ class DeclaredNamesTable:
         self._bad_reference_names: list[str] = []
         self._group_names: list[str] = []
         self.raw_correction_last_names: dict[str, str] = {}
+        self._source_hash = hashlib.blake2b(digest_size=16)
 
         self._line_number: int = 0
         if declared_names_file is not None:
@@ -78,6 +80,7 @@ class DeclaredNamesTable:
 
     def add_correct_name_line(self, line: str) -> None:
         self._line_number += 1
+        self._source_hash.update(("D%s\n" % line).encode("utf-8"))
         if line == "" or line.isspace():
             return
 
@@ -237,6 +240,7 @@ class DeclaredNamesTable:
 
     def add_reference_name_line(self, line: str) -> None:
         self._line_number += 1
+        self._source_hash.update(("R%s\n" % line).encode("utf-8"))
         if line == "" or line.isspace():
             return
 
@@ -328,6 +332,10 @@ class DeclaredNamesTable:
     def get_bad_reference_names(self) -> list[str]:
         return self._bad_reference_names
 
+    def get_fingerprint(self) -> bytes:
+        """Returns a hash of all the lines from which the table was built."""
+        return self._source_hash.digest()
+
     def get_variant_identities(self, primary_name: str) -> Optional[list[Identity]]:
         try:
             primary = self._primaries_by_name[primary_name]
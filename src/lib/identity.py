@@ -4,8 +4,15 @@ from typing import Any, Optional, Union
 
 class Identity:
     class Property:
+        _properties_by_name: dict[str, Identity.Property] = {}
+
         def __init__(self, name: str):
             self.name = name
+            Identity.Property._properties_by_name.setdefault(name, self)
+
+        def __reduce__(self) -> tuple[Any, ...]:
+            # Properties are compared by identity, so unpickle to the same instance.
+            return (_get_property, (self.name,))
 
         def __str__(self) -> str:
             return self.name
@@ -82,6 +89,19 @@ class Identity:
     def clear_raw_names(self):
         self._raw_names = None
 
+    def clone(self) -> Identity:
+        """Returns an uncataloged copy of this uncataloged identity."""
+        clone = Identity(self.last_name, self.initial_names, self.name_suffix)
+        clone.raw_name = self.raw_name
+        clone.uncertain = self.uncertain
+        if self._properties is not None:
+            clone._properties = list(self._properties)
+        if isinstance(self._raw_names, list):
+            clone._raw_names = list(self._raw_names)
+        else:
+            clone._raw_names = self._raw_names
+        return clone
+
     def get_first_name(self) -> Optional[str]:
         if self.initial_names is None:
             return None
@@ -218,3 +238,7 @@ class Identity:
     def set_raw_name(self, new_raw_name: str) -> None:
         self.raw_name = new_raw_name
         self._raw_names = new_raw_name
+
+
+def _get_property(name: str) -> Identity.Property:
+    return Identity.Property._properties_by_name[name]
@@ -1,10 +1,11 @@
+import pickle
 import pytest
 import textwrap
 from typing import Any, Callable, Optional, Type
 
 from src.lib.parse_error import ParseError
 from src.lib.identity import Identity
-from src.lib.declared_names_table import DeclaredNamesTable
+from src.lib.declared_names_table import DeclaredNamesTable, DECLARED_VARIANT
 
 
 class TestKnownNamesTable:
@@ -370,6 +371,23 @@ class TestKnownNamesTable:
             ),
         )
 
+    def test_fingerprint(self):
+
+        table1 = _create_table("Parson, Jimmy\nJohnson, Fred")
+        table2 = _create_table("Parson, Jimmy\nJohnson, Fred")
+        table3 = _create_table("Parson, Jimmy\nJohnson, Freddie")
+        assert table1.get_fingerprint() == table2.get_fingerprint()
+        assert table1.get_fingerprint() != table3.get_fingerprint()
+
+    def test_pickled_properties(self):
+
+        table = _create_table("Johnson, Fred\n- Johnson, F.")
+        identity = _identity("Johnson", "F.")
+        table.add_properties(identity)
+        assert DECLARED_VARIANT in identity.get_properties()
+        unpickled = pickle.loads(pickle.dumps(identity))
+        assert unpickled.get_properties()[0] is DECLARED_VARIANT
+
 
 def _create_table(name_list_str: str) -> DeclaredNamesTable:
 
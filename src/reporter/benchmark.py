@@ -0,0 +1,167 @@
+from __future__ import annotations
+from typing import Any
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+import src.util.args as args
+from src.util.report_writer import MemoryReportWriter
+from james_table import JamesTable
+from main import Norm
+from record_filter import AllRecordsFilter
+from synthetic_csv import SyntheticExport
+
+# Benchmark suite that times loading the table, summarizing it, consolidating its
+# names, and generating each report, on synthetic exports of increasing size. The
+# timings are written to a JSON file so that runs can be compared.
+
+DEFAULT_ROW_COUNTS = [10000, 100000, 1000000]
+DEFAULT_RESULTS_FILE = "benchmark-results.json"
+BENCHMARKED_REPORTS = "A AC C D DC F G L M N O P QL QN QT R T U V W X Y Z 0".split()
+
+# fmt: off
+USAGE = (
+    "Times the table phases and reports on synthetic exports of several sizes.\n"
+    "  args: [-n=<row-counts>] [-o=<results-file>] [-r=<report-codes>] [-s=<seed>] <work-dir>\n"
+    "\n"
+    "-n=<row-counts> comma-delimited numbers of rows to benchmark\n"
+        "(default %s)\n"
+    "-o=<results-file> JSON file to which to write the timings\n"
+        "(default %s)\n"
+    "-r=<report-codes> comma-delimited codes of the reports to time (default all)\n"
+    "-s=<seed> random seed for generating the synthetic exports (default 1)\n"
+    "<work-dir> is the directory in which to generate the synthetic exports, where\n"
+    "  they are kept for reuse by later runs\n"
+    % (",".join(str(c) for c in DEFAULT_ROW_COUNTS), DEFAULT_RESULTS_FILE)
+)
+# fmt: on
+
+
+class Benchmark:
+    """Main program for benchmarking the table and the reports."""
+
+    def __init__(self):
+        self._work_dir = "unspecified"
+        self._row_counts = DEFAULT_ROW_COUNTS
+        self._results_file = DEFAULT_RESULTS_FILE
+        self._report_codes = BENCHMARKED_REPORTS
+        self._seed = 1
+
+    def main(self) -> None:
+        options: args.OptionsDict = {
+            "-n": self._parse_row_counts,
+            "-o": self._parse_results_file,
+            "-r": self._parse_report_codes,
+            "-s": self._parse_seed,
+            0: self._parse_work_dir,
+            None: self._parse_no_arguments,
+        }
+        try:
+            args.parse_args(options)
+        except args.ArgException as e:
+            if e.message:
+                print(e.message)
+            print()
+            print(USAGE)
+            sys.exit(2)
+
+        results: dict[str, Any] = {
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": self._seed,
+            "scales": [],
+        }
+        for row_count in self._row_counts:
+            results["scales"].append(self.run_scale(row_count))
+            with open(self._results_file, "w") as file:
+                json.dump(results, file, indent=2)
+        print("Wrote %s" % self._results_file)
+
+    def run_scale(self, row_count: int) -> dict[str, Any]:
+        """Times the phases and reports on a synthetic export of the given number
+        of rows, returning the timings in seconds. Reports are generated in turn
+        on the same table, as the report daemon would, each after its own summary
+        of the records that its filter selects."""
+
+        specimens_file = self._get_specimens_file(row_count)
+        print("%d rows:" % row_count)
+        phases: dict[str, float] = {}
+
+        start_time = time.perf_counter()
+        table = _create_norm(specimens_file, []).load_table()
+        phases["load"] = _show_time("load", start_time)
+        start_time = time.perf_counter()
+        table.summarize(AllRecordsFilter())
+        phases["summarize"] = _show_time("summarize", start_time)
+        start_time = time.perf_counter()
+        table.revise_names(unify_names_by_sound=True, merge_with_reference_names=True)
+        phases["consolidate"] = _show_time("consolidate", start_time)
+
+        reports: dict[str, dict[str, Any]] = {}
+        for report_code in self._report_codes:
+            reports[report_code] = _time_report(table, specimens_file, report_code)
+        return {"rows": row_count, "phases": phases, "reports": reports}
+
+    def _get_specimens_file(self, row_count: int) -> str:
+        export_dir = os.path.join(
+            self._work_dir, "rows-%d-seed-%d" % (row_count, self._seed)
+        )
+        specimens_file = os.path.join(export_dir, "specimens.csv")
+        if not os.path.exists(specimens_file):
+            print("Generating %s..." % specimens_file)
+            SyntheticExport(row_count, self._seed).write(export_dir)
+        return specimens_file
+
+    def _parse_report_codes(self, arg: str) -> None:
+        self._report_codes = [code.strip().upper() for code in arg.split(",")]
+
+    def _parse_results_file(self, arg: str) -> None:
+        self._results_file = args.expand_filename(arg)
+
+    def _parse_row_counts(self, arg: str) -> None:
+        try:
+            self._row_counts = [int(count) for count in arg.split(",")]
+        except ValueError:
+            raise args.ArgException("Invalid row counts '%s'" % arg)
+
+    def _parse_seed(self, arg: str) -> None:
+        try:
+            self._seed = int(arg)
+        except ValueError:
+            raise args.ArgException("Invalid seed '%s'" % arg)
+
+    def _parse_work_dir(self, arg: str) -> None:
+        self._work_dir = args.expand_filename(arg)
+
+    def _parse_no_arguments(self, _arg: str) -> None:
+        raise args.ArgException()
+
+
+def _create_norm(specimens_file: str, report_args: list[str]) -> Norm:
+    norm = Norm()
+    norm.parse_args(["main.py", specimens_file] + report_args)
+    return norm
+
+
+def _show_time(name: str, start_time: float) -> float:
+    seconds = time.perf_counter() - start_time
+    print("  %-12s %8.3f s" % (name, seconds))
+    return seconds
+
+
+def _time_report(
+    table: JamesTable, specimens_file: str, report_code: str
+) -> dict[str, Any]:
+    start_time = time.perf_counter()
+    out = MemoryReportWriter()
+    norm = _create_norm(specimens_file, ["-r" + report_code])
+    norm.create_report(table).write_to(out)
+    return {"seconds": _show_time("report " + report_code, start_time)}
+
+
+if __name__ == "__main__":
+    Benchmark().main()
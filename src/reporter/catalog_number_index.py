@@ -0,0 +1,51 @@
+from __future__ import annotations
+from typing import Iterator, TYPE_CHECKING
+from bisect import bisect_left, bisect_right
+
+if TYPE_CHECKING:
+    from src.reporter.specimen_record import SpecimenRecord
+
+CatalogNumberRange = tuple[int, int]  # inclusive first and last numbers
+
+
+class CatalogNumberIndex:
+    """Index of the records by catalog number, kept as the sorted distinct
+    catalog numbers so that gaps, duplicates, and ranges are found without
+    probing every integer up to the maximum catalog number."""
+
+    def __init__(self, records_by_catalog_number: dict[int, list[SpecimenRecord]]):
+        self._records_by_catalog_number = records_by_catalog_number
+        self._catalog_numbers = sorted(records_by_catalog_number.keys())
+
+    def get_catalog_numbers(self) -> list[int]:
+        """Returns the distinct catalog numbers in ascending order."""
+        return self._catalog_numbers
+
+    def get_records(self, catalog_number: int) -> list[SpecimenRecord]:
+        """Returns the records having the given catalog number."""
+        return self._records_by_catalog_number.get(catalog_number, [])
+
+    def iter_duplicate_groups(self) -> Iterator[tuple[int, list[SpecimenRecord]]]:
+        """Yields each catalog number that multiple records share, along with
+        those records, in ascending order of catalog number."""
+        for catalog_number in self._catalog_numbers:
+            records = self._records_by_catalog_number[catalog_number]
+            if len(records) > 1:
+                yield catalog_number, records
+
+    def iter_missing_ranges(self) -> Iterator[CatalogNumberRange]:
+        """Yields the ranges of catalog numbers that no record has, starting from
+        catalog number 1 and ending at the maximum catalog number."""
+        last_found_number = 0
+        for catalog_number in self._catalog_numbers:
+            if catalog_number > last_found_number + 1:
+                yield (last_found_number + 1, catalog_number - 1)
+            last_found_number = catalog_number
+
+    def iter_records_in_range(self, first: int, last: int) -> Iterator[SpecimenRecord]:
+        """Yields the records whose catalog numbers are in the inclusive range,
+        in ascending order of catalog number."""
+        start = bisect_left(self._catalog_numbers, first)
+        end = bisect_right(self._catalog_numbers, last)
+        for catalog_number in self._catalog_numbers[start:end]:
+            yield from self._records_by_catalog_number[catalog_number]
@@ -0,0 +1,167 @@
+from __future__ import annotations
+from typing import Optional
+import difflib
+import os
+import sys
+
+import src.util.args as args
+from report_executor import ReportExecutor, ReportJob
+
+# Regression check that loads the specimen table once, generates the reports of
+# the check set in parallel, and compares each with its file in the check/ dir.
+
+CHECK_DIR = "check"
+
+# File name in the check dir and the main.py arguments of each checked report.
+CHECKED_REPORTS: list[tuple[str, list[str]]] = [
+    ("agents-c.txt", ["-c", "-rA"]),
+    ("lat_long-c.txt", ["-c", "-rC"]),
+    ("dictionaries.txt", ["-rD"]),
+    ("foreign_words-c.txt", ["-c", "-rF"]),
+    ("labels-c.txt", ["-c", "-rL"]),
+    ("labels-c-p.txt", ["-c", "-rL", "-p"]),
+    ("labels-mashed-c.txt", ["-c", "-rM"]),
+    ("labels-mashed-c-p.txt", ["-c", "-rM", "-p"]),
+    ("labels-no-fit-c.txt", ["-c", "-rN"]),
+    ("problems-c.txt", ["-c", "-rP"]),
+    ("remarks-c.txt", ["-c", "-rR"]),
+    ("tss.csv", ["-rT"]),
+    ("name_cat_nums-c.txt", ["-c", "-rU"]),
+    ("initial_cat_nums-c.txt", ["-c", "-rV"]),
+    ("taxa_by_dups-c.txt", ["-c", "-rY"]),
+    ("dups_by_taxa-c.txt", ["-c", "-rZ"]),
+    ("zeros_by_taxa-c.txt", ["-c", "-r0"]),
+]
+
+# fmt: off
+USAGE = (
+    "Checks the reports against the reports previously generated into %s/.\n"
+    "  args: [-g] [-j=<processes>] <specimen_csv>\n"
+    "\n"
+    "-g generate the reports into %s/ instead of checking them\n"
+    "-j=<processes> maximum number of reports to generate at once\n"
+        "(default the number of CPUs)\n"
+    "<specimen_csv> is the path to a CSV file of specimens\n"
+    "\n"
+    "Stops at the first report that doesn't match, showing a unified diff.\n"
+    % (CHECK_DIR, CHECK_DIR)
+)
+# fmt: on
+
+
+class ReportChecker:
+    """Main program for checking the reports for regressions."""
+
+    def __init__(self):
+        self._specimen_csv_file = "unspecified"
+        self._generating = False
+        self._process_count = os.cpu_count() or 1
+
+    def main(self) -> None:
+        options: args.OptionsDict = {
+            "-g": self._parse_generating,
+            "-j": self._parse_process_count,
+            0: self._parse_specimen_csv,
+            None: self._parse_no_arguments,
+        }
+        try:
+            args.parse_args(options)
+        except args.ArgException as e:
+            if e.message:
+                print(e.message)
+            print()
+            print(USAGE)
+            sys.exit(2)
+
+        executor = ReportExecutor(self._specimen_csv_file, self._process_count)
+        executor.load_table()
+        if self._generating:
+            os.makedirs(CHECK_DIR, exist_ok=True)
+        sys.exit(0 if self._run_reports(executor) else 1)
+
+    def _run_reports(self, executor: ReportExecutor) -> bool:
+        # Generate the reports into the check dir, or else generate each into memory
+        # and compare it with the check dir's copy within its process, starting no
+        # more reports once one fails. Then show the outcome of each report in
+        # check-set order, stopping at the first failure.
+
+        jobs: list[ReportJob] = []
+        for file_name, report_args in CHECKED_REPORTS:
+            if self._generating:
+                jobs.append(ReportJob(os.path.join(CHECK_DIR, file_name), report_args))
+            else:
+                jobs.append(
+                    ReportJob(
+                        None, report_args, _ReportComparer(file_name, report_args)
+                    )
+                )
+        executor.run(jobs, stop_at_failure=True)
+        for (file_name, report_args), job in zip(CHECKED_REPORTS, jobs):
+            if not job.succeeded():
+                # Jobs start in order, so the first to not succeed ran and failed.
+                assert job.exit_status is not None
+                print("%s (%s) failed:" % (file_name, " ".join(report_args)))
+                print(job.error)
+                return False
+            print(
+                "%s %s (%.1f s)"
+                % (
+                    "Generated" if self._generating else "Checked",
+                    file_name,
+                    job.seconds,
+                )
+            )
+        print("All %d reports %s." % (len(CHECKED_REPORTS), self._get_outcome()))
+        return True
+
+    def _get_outcome(self) -> str:
+        if self._generating:
+            return "generated into %s/" % CHECK_DIR
+        return "match %s/" % CHECK_DIR
+
+    def _parse_generating(self, _arg: str) -> None:
+        self._generating = True
+
+    def _parse_process_count(self, arg: str) -> None:
+        try:
+            self._process_count = int(arg)
+        except ValueError:
+            raise args.ArgException("-j requires a number of processes")
+        if self._process_count < 1:
+            raise args.ArgException("-j requires at least one process")
+
+    def _parse_specimen_csv(self, arg: str) -> None:
+        self._specimen_csv_file = args.expand_filename(arg)
+
+    def _parse_no_arguments(self, _arg: str) -> None:
+        raise args.ArgException()
+
+
+class _ReportComparer:
+    """Compares a report generated in memory with the check dir's copy, returning
+    a unified diff of any differences."""
+
+    def __init__(self, file_name: str, report_args: list[str]):
+        self._file_name = file_name
+        self._report_args = report_args
+
+    def __call__(self, text: str) -> Optional[str]:
+        check_file = os.path.join(CHECK_DIR, self._file_name)
+        try:
+            with open(check_file, "r", encoding="utf-8") as file:
+                check_text = file.read()
+        except FileNotFoundError:
+            return "%s not found; generate it with -g" % check_file
+        if text == check_text:
+            return None
+        diff = difflib.unified_diff(
+            check_text.splitlines(keepends=True),
+            text.splitlines(keepends=True),
+            check_file,
+            "%s (%s)" % (self._file_name, " ".join(self._report_args)),
+        )
+        return "".join(diff)
+
+
+if __name__ == "__main__":
+    ReportChecker().main()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+from typing import Any, Union
+from decimal import Decimal
+
+
+class Coordinate:
+    """Latitude or longitude held as a fixed-point integer number of units, where
+    each unit is 10^-digits degrees, so that `digits` is the coordinate's precision.
+    A coordinate compares, hashes, prints, and rounds exactly as the Decimal of the
+    text it was parsed from, but with integer operations, converting to a Decimal
+    only in the rare cases that Decimal would print in exponential notation."""
+
+    __slots__ = ("units", "digits", "negative")
+
+    def __init__(self, units: int, digits: int, negative: bool = False):
+        self.units = units
+        self.digits = digits  # negative for units of 10^|digits| degrees
+        self.negative = negative or units < 0  # distinguishes -0.0 from 0.0
+
+    @classmethod
+    def parse(cls, s: str) -> Coordinate:
+        """Returns the coordinate of the text, raising decimal.InvalidOperation
+        if the text is not a decimal number. Plain decimal numbers are parsed
+        directly into integers; other text is parsed as Decimal would parse it."""
+        whole, dot, fraction = s.partition(".")
+        negative = whole[:1] == "-"
+        if negative or whole[:1] == "+":
+            whole = whole[1:]
+        if (
+            dot == ""
+            or not (whole == "" or whole.isdecimal())
+            or not (fraction == "" or fraction.isdecimal())
+            or whole == fraction == ""
+        ):
+            return cls.from_decimal(Decimal(s))
+        units = int(whole + fraction)
+        return cls(-units if negative else units, len(fraction), negative)
+
+    @classmethod
+    def from_decimal(cls, dec: Decimal) -> Coordinate:
+        sign, digit_tuple, exponent = dec.as_tuple()
+        assert isinstance(exponent, int), "Coordinate can't be %s" % dec
+        units = int("".join(str(digit) for digit in digit_tuple))
+        return cls(-units if sign else units, -exponent, sign == 1)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (Coordinate, int)):
+            return NotImplemented
+        return self._compare(other) == 0
+
+    def __float__(self) -> float:
+        if self.digits < 0:
+            return float(self.units * 10**-self.digits)
+        return self.units / 10**self.digits
+
+    def __ge__(self, other: Union[Coordinate, int]) -> bool:
+        return self._compare(other) >= 0
+
+    def __gt__(self, other: Union[Coordinate, int]) -> bool:
+        return self._compare(other) > 0
+
+    def __hash__(self) -> int:
+        units = self.units
+        digits = self.digits
+        if units == 0:
+            return hash((0, 0))
+        while units % 10 == 0:
+            units //= 10
+            digits -= 1
+        return hash((units, digits))
+
+    def __le__(self, other: Union[Coordinate, int]) -> bool:
+        return self._compare(other) <= 0
+
+    def __lt__(self, other: Union[Coordinate, int]) -> bool:
+        return self._compare(other) < 0
+
+    def __neg__(self) -> Coordinate:
+        return Coordinate(-self.units, self.digits, not self.negative)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Coordinate, (self.units, self.digits, self.negative))
+
+    def __repr__(self) -> str:
+        return "Coordinate('%s')" % str(self)
+
+    def __str__(self) -> str:
+        if self._is_exponential():
+            return str(self.to_decimal())
+        digit_str = str(abs(self.units))
+        sign = "-" if self.negative else ""
+        if self.digits == 0:
+            return sign + digit_str
+        digit_str = digit_str.rjust(self.digits + 1, "0")
+        return "%s%s.%s" % (sign, digit_str[: -self.digits], digit_str[-self.digits :])
+
+    def round(self, digits: int) -> Coordinate:
+        """Returns the coordinate rounded half-even to the given number of digits,
+        keeping trailing zeros, as formatting a Decimal with that many digits does."""
+        magnitude = abs(self.units)
+        if digits >= self.digits:
+            magnitude *= 10 ** (digits - self.digits)
+        else:
+            unit = 10 ** (self.digits - digits)
+            magnitude, remainder = divmod(magnitude, unit)
+            if remainder * 2 > unit or remainder * 2 == unit and magnitude % 2 == 1:
+                magnitude += 1
+        return Coordinate(
+            -magnitude if self.negative else magnitude, digits, self.negative
+        )
+
+    def strip_zeros(self) -> tuple[Coordinate, int]:
+        """Returns the coordinate without trailing fractional zeros, along with its
+        resulting number of fractional digits."""
+        if self.digits == 0 or self._is_exponential():
+            # Strip zeros from the printed Decimal, as for other coordinates.
+            s = str(self.to_decimal())
+            i = len(s)
+            while i > 0 and s[i - 1] == "0":
+                i -= 1
+            s = s[0:i]
+            dot_offset = s.find(".")
+            return (
+                Coordinate.from_decimal(Decimal(s)),
+                0 if dot_offset < 0 else len(s) - dot_offset - 1,
+            )
+        units = self.units
+        digits = self.digits
+        while digits > 0 and units % 10 == 0:
+            units //= 10
+            digits -= 1
+        return (Coordinate(units, digits, self.negative), digits)
+
+    def to_decimal(self) -> Decimal:
+        digit_tuple = tuple(int(digit) for digit in str(abs(self.units)))
+        return Decimal((1 if self.negative else 0, digit_tuple, -self.digits))
+
+    def _is_exponential(self) -> bool:
+        # Returns whether Decimal would print the coordinate in exponential notation.
+        return self.digits < 0 or (
+            self.digits > 6 and len(str(abs(self.units))) - self.digits <= -6
+        )
+
+    def _compare(self, other: Union[Coordinate, int]) -> int:
+        if isinstance(other, int):
+            other = Coordinate(other, 0)
+        digits = max(self.digits, other.digits)
+        units1 = self.units * 10 ** (digits - self.digits)
+        units2 = other.units * 10 ** (digits - other.digits)
+        return (units1 > units2) - (units1 < units2)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+from typing import Optional, Sequence
+
+from src.reporter.specimen_record import SpecimenRecord
+from src.reporter.record_issue import IssueCode
+
+# Checks of the parsed collection dates against the Collection Year, Collection
+# Month, and Collection Day columns, done for many records at once after they
+# are loaded rather than record by record as each record is parsed. Further
+# checks of the dates across the table belong here too.
+
+# Name of each compared part of the date, in the order compared.
+DATE_PART_NAMES = ["Year", "Month", "Day"]
+
+
+def check_collection_dates(records: Sequence[SpecimenRecord]) -> None:
+    """Adds a problem to each record having a Collection Year, Month, or Day
+    column that disagrees with its parsed start date. Only the first disagreeing
+    column of a record is reported. Empty and invalid columns are not compared."""
+
+    for record in records:
+        if record.date_time is None or record.date_time.start_date is None:
+            continue
+        if record.date_columns == (0, 0, 0):
+            continue  # no columns to compare
+        start_date = record.date_time.start_date
+        parsed_values: tuple[Optional[int], ...] = (
+            start_date.year,
+            start_date.month,
+            start_date.day,
+        )
+        for part_name, column_value, parsed_value in zip(
+            DATE_PART_NAMES, record.date_columns, parsed_values
+        ):
+            if column_value != 0 and parsed_value is not None:
+                if column_value != parsed_value:
+                    record.add_problem(
+                        IssueCode.DATE_COLUMN_DISAGREES,
+                        column_value,
+                        part_name.lower(),
+                        parsed_value,
+                        field=part_name,
+                    )
+                    break
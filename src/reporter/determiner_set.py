@@ -8,13 +8,33 @@ if TYPE_CHECKING:
 from src.lib.declared_names_table import DeclaredNamesTable
 from src.lib.identity import Identity
 from src.reporter.name_column_parser import NameColumnParser
+from src.reporter.record_issue import IssueCode, RecordIssue
+
+_DeterminerParse = tuple[
+    Optional[list[Identity]], Optional[str], list[RecordIssue], list[RecordIssue]
+]
+
+PARSE_CACHE_SIZE = 1 << 16  # max distinct determiner strings whose parses are kept
+
+# Corrections that allow for parsing the year and don't require warnings.
+CORRECTIONS = [
+    ("1j982", "1982"),
+    ("/07/77", "/1977"),
+    ("/;", "/"),
+    ("; :", ";"),
+    ("29008", "2008"),
+    ("1006", "2006"),
+    ("2986", "1986"),
+    ("2989", "1989"),
+    ("Shell1y", "Shelley"),
+]
 
 
 class DeterminerSet:
 
     NUMBER_REGEX = re.compile(r"\d+")
 
-    MONTH_TERMS = [
+    MONTH_TERMS = {
         "january",
         "february",
         "march",
@@ -50,7 +70,7 @@ class DeterminerSet:
         "oct.",
         "nov.",
         "dec.",
-    ]
+    }
 
     checked_record_ids = [
         2567,
@@ -65,6 +85,12 @@ class DeterminerSet:
         44724,
     ]
 
+    # Parse of each raw string, made with the table of declared names given, as
+    # determiners, year, problems, and warnings. Many records share these strings.
+    # Holds at most PARSE_CACHE_SIZE strings, dropping the earliest parsed first.
+    _parses: dict[str, _DeterminerParse] = {}
+    _parses_table: Optional[DeclaredNamesTable] = None
+
     def __init__(
         self,
         determiners: Optional[list[Identity]] = None,
@@ -88,41 +114,54 @@ class DeterminerSet:
         raw_text: str,
     ) -> DeterminerSet:
 
+        # Parse each raw string once per table of declared names, giving each
+        # record its own copies of the identities, as the catalog counts them.
+
+        if declared_names_table is not DeterminerSet._parses_table:
+            DeterminerSet._parses = {}
+            DeterminerSet._parses_table = declared_names_table
+        parse = DeterminerSet._parses.get(raw_text)
+        if parse is None:
+            parse = self._parse(declared_names_table, raw_text)
+            if len(DeterminerSet._parses) >= PARSE_CACHE_SIZE:
+                del DeterminerSet._parses[next(iter(DeterminerSet._parses))]
+            DeterminerSet._parses[raw_text] = parse
+
+        determiners, self.year, problems, warnings = parse
+        if determiners is not None:
+            self.determiners = [identity.clone() for identity in determiners]
+        record.add_issues(problems, warnings)
+        return self
+
+    @classmethod
+    def _parse(
+        cls, declared_names_table: DeclaredNamesTable, raw_text: str
+    ) -> _DeterminerParse:
+
         raw_text = raw_text.strip()
         if raw_text == "":
-            return self
+            return (None, None, [], [])
 
         # Apply corrections that allow for parsing the year and don't require warnings.
 
         if raw_text[-1] == "/":
             if len(raw_text) == 1:
-                return self
+                return (None, None, [], [])
             raw_text = raw_text[0:-1]
 
-        corrections = {
-            "1j982": "1982",
-            "/07/77": "/1977",
-            "/;": "/",
-            "; :": ";",
-            "29008": "2008",
-            "1006": "2006",
-            "2986": "1986",
-            "2989": "1989",
-            "Shell1y": "Shelley",
-        }
-        for mistake, correction in corrections.items():
+        for mistake, correction in CORRECTIONS:
             raw_text = raw_text.replace(mistake, correction)
 
         # Extract the year, ignoring any indication of month.
 
+        year: Optional[str] = None
         if raw_text[-1].isdigit():
             offset = len(raw_text) - 1
             while offset >= 0 and raw_text[offset].isdigit():
                 offset -= 1
             digits = raw_text[offset + 1 :]
-            year = int(digits)
-            if year >= 1900 and year <= date.today().year:
-                self.year = digits
+            if 1900 <= int(digits) <= date.today().year:
+                year = digits
                 raw_text = raw_text[0 : offset + 1].strip().replace("/", ";")
                 last_semicolon_offset = raw_text.rfind(";")
                 if last_semicolon_offset != -1:
@@ -131,7 +170,7 @@ class DeterminerSet:
                         drop_last_term = True
                     else:
                         last_term = raw_text[last_semicolon_offset + 1 :].strip()
-                        if last_term.lower() in self.MONTH_TERMS:
+                        if last_term.lower() in cls.MONTH_TERMS:
                             drop_last_term = True
                         else:
                             drop_last_term = True
@@ -142,13 +181,23 @@ class DeterminerSet:
                     if drop_last_term:
                         raw_text = raw_text[0:last_semicolon_offset]
 
-        numbers = self.NUMBER_REGEX.findall(raw_text)
+        numbers = cls.NUMBER_REGEX.findall(raw_text)
         if numbers:
-            record.add_problem(
-                "unexpected number(s) %s in determiner" % str(numbers)[1:-1]
+            problem = RecordIssue.create(
+                IssueCode.UNEXPECTED_NUMBERS, "determiner", (str(numbers)[1:-1],)
             )
-        else:
-            parser = NameColumnParser(raw_text, declared_names_table)
-            self.determiners = parser.parse()
-            record.save_problems(parser, "determiner")
-        return self
+            return (None, year, [problem], [])
+        parser = NameColumnParser(raw_text, declared_names_table)
+        determiners = parser.parse()
+        return (
+            determiners,
+            year,
+            [
+                RecordIssue.create(IssueCode.NAME_ERROR, "determiner", (error,))
+                for error in parser.get_errors()
+            ],
+            [
+                RecordIssue.create(IssueCode.NAME_WARNING, "determiner", (warning,))
+                for warning in parser.get_warnings()
+            ],
+        )
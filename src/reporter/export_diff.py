@@ -0,0 +1,129 @@
+from __future__ import annotations
+from typing import Iterator, Optional
+
+from src.util.any_csv import get_row_value, hash_row, iter_csv
+from src.reporter.james_table import END_CAT_NUM
+
+ID_COLUMN = "ID"
+EXTRA_FIELDS_LABEL = "(extra fields)"  # column of fields beyond the header's
+BATCH_RECORD_COUNT = 5000  # max modified records whose rows are held at once
+
+FieldChange = tuple[str, str, str]  # column name, prior value, revised value
+_RowPair = tuple[int, dict[str, str], dict[str, str]]  # ID, prior row, revised row
+
+
+class ExportDiff:
+    """Differences between a prior and a revised CSV export of the spreadsheet,
+    keyed by the ID column. The exports are compared by streaming them and keeping
+    only a hash of each row. The field changes of the modified records are then
+    found by streaming the exports again, a pair of rows at a time when both
+    exports are in ascending order of ID, or else reading the rows of at most
+    BATCH_RECORD_COUNT modified records per pass over the exports. Rows whose IDs
+    are not integers are skipped, keeping their IDs as invalid IDs."""
+
+    def __init__(self, prior_filename: str, revised_filename: str):
+        self.prior_filename = prior_filename
+        self.revised_filename = revised_filename
+        self.invalid_prior_ids: list[str] = []
+        self.invalid_revised_ids: list[str] = []
+
+        prior_hashes, prior_in_order = _hash_rows(
+            prior_filename, self.invalid_prior_ids
+        )
+        revised_hashes, revised_in_order = _hash_rows(
+            revised_filename, self.invalid_revised_ids
+        )
+        self._in_id_order = prior_in_order and revised_in_order
+
+        self.added_ids = sorted(revised_hashes.keys() - prior_hashes.keys())
+        self.removed_ids = sorted(prior_hashes.keys() - revised_hashes.keys())
+        self.modified_ids = sorted(
+            id
+            for id, row_hash in revised_hashes.items()
+            if id in prior_hashes and prior_hashes[id] != row_hash
+        )
+
+    def get_changed_ids(self) -> set[int]:
+        """Returns the IDs of the records that were added or modified."""
+        return set(self.added_ids).union(self.modified_ids)
+
+    def iter_field_changes(self) -> Iterator[tuple[int, list[FieldChange]]]:
+        """Yields the ID of each modified record along with the changes to its
+        fields, in ascending order of ID. Columns present in only one of the
+        exports are treated as empty in the other."""
+
+        if self._in_id_order:
+            row_pairs = self._iter_row_pairs_in_order()
+        else:
+            row_pairs = self._iter_row_pairs_in_batches()
+        for id, prior_row, revised_row in row_pairs:
+            changes: list[FieldChange] = []
+            for column in revised_row.keys() | prior_row.keys():
+                prior_value = get_row_value(prior_row, column)
+                revised_value = get_row_value(revised_row, column)
+                if prior_value != revised_value:
+                    label = EXTRA_FIELDS_LABEL if column is None else column
+                    changes.append((label, prior_value, revised_value))
+            changes.sort(key=lambda change: change[0])
+            yield id, changes
+
+    def _iter_row_pairs_in_order(self) -> Iterator[_RowPair]:
+        # Pairs the rows of the modified records while streaming both exports,
+        # which have the modified records in the same order, as both are in
+        # ascending order of ID.
+        modified_ids = set(self.modified_ids)
+        prior_rows = _iter_id_rows(self.prior_filename)
+        for id, revised_row in _iter_id_rows(self.revised_filename):
+            if id in modified_ids:
+                prior_row = next(row for i, row in prior_rows if i == id)
+                yield id, prior_row, revised_row
+
+    def _iter_row_pairs_in_batches(self) -> Iterator[_RowPair]:
+        for start in range(0, len(self.modified_ids), BATCH_RECORD_COUNT):
+            batch_ids = self.modified_ids[start : start + BATCH_RECORD_COUNT]
+            batch_id_set = set(batch_ids)
+            # Like the hashes, keep the last row of any duplicate ID.
+            prior_rows = {
+                id: row
+                for id, row in _iter_id_rows(self.prior_filename)
+                if id in batch_id_set
+            }
+            revised_rows = {
+                id: row
+                for id, row in _iter_id_rows(self.revised_filename)
+                if id in batch_id_set
+            }
+            for id in batch_ids:
+                yield id, prior_rows[id], revised_rows[id]
+
+
+def _hash_rows(filename: str, invalid_ids: list[str]) -> tuple[dict[int, bytes], bool]:
+    # Returns the hash of each row by ID, along with whether the IDs strictly
+    # ascend through the file.
+    row_hashes: dict[int, bytes] = {}
+    in_order = True
+    prior_id: Optional[int] = None
+    for id, row in _iter_id_rows(filename, invalid_ids):
+        if prior_id is not None and id <= prior_id:
+            in_order = False
+        prior_id = id
+        row_hashes[id] = hash_row(row)
+    return row_hashes, in_order
+
+
+def _iter_id_rows(
+    filename: str, invalid_ids: Optional[list[str]] = None
+) -> Iterator[tuple[int, dict[str, str]]]:
+    # Yields the ID and row of each row having an integer ID, adding the IDs of
+    # any other rows to the given list. Short rows lack values for some columns.
+    for row in iter_csv(filename):
+        if (row.get("Catalog Number") or "").strip() == END_CAT_NUM:
+            return
+        raw_id = row.get(ID_COLUMN) or ""
+        try:
+            id = int(raw_id)
+        except ValueError:
+            if invalid_ids is not None:
+                invalid_ids.append(raw_id)
+            continue
+        yield id, row
@@ -1,7 +1,5 @@
 from __future__ import annotations
-from typing import Callable, Optional, Tuple
-import pyphonetics  # type: ignore
-import Levenshtein  # type: ignore
+from typing import Any, Callable, Optional, Tuple
 
 from src.lib.identity import Identity
 from src.lib.declared_names_table import (
@@ -25,8 +23,11 @@ class IdentityCatalog:
     names of the same identity or a list of different people sharing a portion of
     their names in common."""
 
-    rsoundex = pyphonetics.RefinedSoundex()  # type: ignore
-    lein = pyphonetics.Lein()  # type: ignore
+    # Phonetic algorithms, created on first use, as pyphonetics is slow to import
+    # and only reports that unify names by sound need them.
+
+    rsoundex: Any = None
+    lein: Any = None
 
     class _NameNode:
         """A node representing a component of an identity name for inclusion in a
@@ -830,6 +831,11 @@ class IdentityCatalog:
         # RefinedSoundex seems to be the most discriminat, but it occassionall goofs,
         # so I'm joining it with the liberal Lein algorithm to undo the goofs.
 
+        if IdentityCatalog.rsoundex is None:
+            import pyphonetics  # type: ignore
+
+            IdentityCatalog.rsoundex = pyphonetics.RefinedSoundex()  # type: ignore
+            IdentityCatalog.lein = pyphonetics.Lein()  # type: ignore
         try:
             sound_code1: str = self.rsoundex.phonetics(name)  # type: ignore
             sound_code2: str = self.lein.phonetics(name)  # type: ignore
@@ -839,6 +845,7 @@ class IdentityCatalog:
         return "%s/%s" % (sound_code1, sound_code2)
 
     def _unify_last_names_by_sound(self) -> None:
+        import Levenshtein  # type: ignore  # imported on first use, as slow to import
 
         # Assign a sound code to each identity for how its last name is pronounced,
         # and group the identities by the pronunciations of their last names.
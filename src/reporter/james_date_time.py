@@ -1,6 +1,7 @@
 from __future__ import annotations
 from datetime import date
-from typing import Any, Callable, Optional
+import functools
+from typing import Any, Callable, Optional, Union
 
 from src.lib.partial_date import PartialDate
 from src.lib.date_token import DateToken
@@ -10,9 +11,16 @@ import re
 
 _StateFunc = Callable[[DateToken], Any]
 
+PARSE_CACHE_SIZE = 1 << 16  # max distinct date/time strings whose parses are kept
+
+# Normalization of each date/time for each raw date/time string, keyed by the ID
+# of the date/time and the raw string, dropping the earliest made first.
+_normalizations: dict[tuple[int, str], tuple[JamesDateTime, str]] = {}
+
 
 class JamesDateTime:
-    """Represents the date/time(s) at which a specimen was collected."""
+    """Represents the date/time(s) at which a specimen was collected. Instances
+    returned by parse() are shared and must not be modified."""
 
     US_DATE_REGEX = re.compile(r"^(\d\d?)/(\d\d?)/(\d\d(?:\d\d)?)")
     BAD_US_DATE_REGEX = re.compile(r"^(\d\d?/\d\d?)[-.](\d\d\d\d)$")
@@ -64,6 +72,15 @@ class JamesDateTime:
             s = "%s/%s" % (match.group(1), match.group(2))
         return s
 
+    @classmethod
+    def parse(cls, s: str) -> JamesDateTime:
+        """Returns the date/time that the string represents, shared with all other
+        parses of the string, or raises the ParseError that the string produces."""
+        parse = _parse_date_time(s)
+        if isinstance(parse, str):
+            raise ParseError(parse)
+        return parse
+
     def load(self, s: str) -> JamesDateTime:
 
         if s == "":
@@ -132,6 +149,24 @@ class JamesDateTime:
         return self
 
     def normalize(self, raw_date_time: str) -> str:
+        # Records sharing the date/time tend to share the raw date/time too. The
+        # normalizations are cached apart from the date/time, which parse() may
+        # share and so must not be modified. Each cache entry keeps its date/time
+        # alive, so that no other date/time can take on its ID.
+        key = (id(self), raw_date_time)
+        entry = _normalizations.get(key)
+        if entry is None:
+            entry = (self, self._normalize(raw_date_time))
+            if len(_normalizations) >= PARSE_CACHE_SIZE:
+                del _normalizations[next(iter(_normalizations))]
+            _normalizations[key] = entry
+        return entry[1]
+
+    def with_end_date(self, end_date: Optional[PartialDate]) -> JamesDateTime:
+        """Returns a copy of the date/time having the given end date."""
+        return JamesDateTime(self.start_date, end_date, self.season, self.part_of_day)
+
+    def _normalize(self, raw_date_time: str) -> str:
 
         assert self.start_date is not None
         suffix: Optional[str] = None
@@ -445,3 +480,14 @@ class JamesDateTime:
             DateToken.TO_ROMAN_MONTHS[date.month],
             date.year,
         )
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date_time(s: str) -> Union[JamesDateTime, str]:
+    # Returns the date/time parsed from the raw string, or the message of the
+    # ParseError that parsing it raised. Many records share collection dates, one
+    # trip yielding many vials, so recently seen strings are not parsed again.
+    try:
+        return JamesDateTime().load(s)
+    except ParseError as e:
+        return e.message
@@ -1,21 +1,32 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Iterator, Optional, TYPE_CHECKING
+import os
+import pickle
 import re
 
 from src.lib.declared_names_table import DeclaredNamesTable
 from src.lib.partial_date import PartialDate
 from src.lib.identity import Identity
-from src.util.any_csv import load_csv
+from src.util.any_csv import hash_row, iter_csv, load_csv
 from src.reporter.lat_long_table import LatLongTable
 from src.reporter.record_filter import RecordFilter
 from src.reporter.specimen_record import SpecimenRecord
+from src.reporter.taxa import TaxaTree
+from src.reporter.catalog_number_index import CatalogNumberIndex
+from src.reporter.date_checks import check_collection_dates
 from src.reporter.identity_catalog import IdentityCatalog
+from src.reporter.record_issue import IssueIndex
+
+if TYPE_CHECKING:
+    from src.reporter.record_columns import RecordColumns
 
 StrCountDict = dict[str, int]
 IdentityDict = dict[str, Identity]
 
 END_CAT_NUM = "_END_"
 EMPTY_TERM = "(blank)"
+PARSED_RECORDS_FORMAT = 5  # increment when pickled records would be incompatible
+STREAMED_CHECK_COUNT = 1000  # number of streamed records to check at once
 
 
 class JamesTable:
@@ -29,9 +40,13 @@ class JamesTable:
     ):
         self._lat_longs_filename = lat_longs_filename
         self._records_filename = records_filename
-        self._summarized = False
+        self.streaming = False
         self._revised_names = False
         self._lat_longs: Optional[LatLongTable] = None
+        self._taxa_tree: Optional[TaxaTree] = None
+        self._catalog_number_index: Optional[CatalogNumberIndex] = None
+        self._record_columns: Optional[RecordColumns] = None
+        self._issue_index: Optional[IssueIndex] = None
 
         # Records and automatically-computed stats.
 
@@ -43,39 +58,9 @@ class JamesTable:
 
         # Initialize summary data.
 
-        self.catalog_numbers: dict[Optional[int], bool] = {}
-        self.james_ids: dict[int, bool] = {}
-        self.phyla: StrCountDict = {}
-        self.classes: StrCountDict = {}
-        self.subclasses: StrCountDict = {}
-        self.orders: StrCountDict = {}
-        self.suborders: StrCountDict = {}
-        self.infraorders: StrCountDict = {}
-        self.families: StrCountDict = {}
-        self.subfamilies: StrCountDict = {}
-        self.genera: StrCountDict = {}
-        self.species: StrCountDict = {}
-        self.subspecies: StrCountDict = {}
-        self.genus_species: StrCountDict = {}
-        self.species_subspecies: StrCountDict = {}
-        self.authors: StrCountDict = {}
-        self.continents: StrCountDict = {}
-        self.countries: StrCountDict = {}
-        self.states: StrCountDict = {}
-        self.counties: StrCountDict = {}
-        self.localities: StrCountDict = {}
-        self.lowercaseLocalities: dict[str, list[str]] = {}
-        self.localityCounties: dict[str, list[str | None]] = {}
-        self.countyLocalities: dict[str | None, list[str]] = {}
-        self.owners: StrCountDict = {}
-        self.localityOwners: dict[str, list[str | None]] = {}
-        self.microhabitats: StrCountDict = {}
-        self.type_statuses: StrCountDict = {}
-        self.collections: StrCountDict = {}
-        self.seasons: StrCountDict = {}
-        self.parts_of_month: StrCountDict = {}
-        self.parts_of_day: StrCountDict = {}
-        self.total_specimen_count: int = 0
+        self._summary_filter: Optional[RecordFilter] = None
+        self._collected_agents = False
+        self._init_summary()
 
         self.raw_names_by_collection: dict[Optional[str], dict[str, bool]] = {}
         self.identity_catalog = IdentityCatalog(declared_names_table)
@@ -86,33 +71,117 @@ class JamesTable:
             return None
         return re.sub(r"\([^)]*\)", "", s).strip()
 
-    def load(self) -> None:
+    def get_catalog_number_index(self) -> CatalogNumberIndex:
+        """Returns an index of the records by catalog number, building it on
+        first request."""
+        if self._catalog_number_index is None:
+            self._catalog_number_index = CatalogNumberIndex(
+                self.catalog_numbers_to_records
+            )
+        return self._catalog_number_index
+
+    def get_issue_index(self) -> IssueIndex:
+        """Returns an index of the IDs of the records having each kind of problem
+        or warning, building it on first request. Not available when streaming."""
+        assert not self.streaming, "Streamed records have no issue index"
+        if self._issue_index is None:
+            self._issue_index = IssueIndex(self.records)
+        return self._issue_index
+
+    def get_record_columns(self) -> RecordColumns:
+        """Returns a columnar view of the numeric and categorical fields of all the
+        table's records, building it on first request. Not available when streaming."""
+        assert not self.streaming, "Streamed records have no columnar view"
+        if self._record_columns is None:
+            # imported on first use, as NumPy is slow to import
+            from src.reporter.record_columns import RecordColumns
+
+            self._record_columns = RecordColumns(self.records)
+        return self._record_columns
+
+    def get_taxa_tree(self) -> TaxaTree:
+        """Returns the taxonomic tree of all the table's records, building it on
+        first request."""
+        if self._taxa_tree is None:
+            self._taxa_tree = TaxaTree(self.records)
+        return self._taxa_tree
+
+    def iter_records(self) -> Iterator[SpecimenRecord]:
+        """Returns an iterator over the table's records. When streaming, each record
+        is parsed from the CSV file on request and is not retained by the table."""
+        if self.streaming:
+            return self._stream_records()
+        return iter(self.records)
+
+    def load(
+        self, streaming: bool = False, parsed_records_filename: Optional[str] = None
+    ) -> None:
+        """Loads the lat/long reference table and, unless streaming, all records.
+        A streaming table collects neither records nor statistics, so it only
+        supports single-pass reports. When given a file of parsed records, reuses
+        the records parsed from unchanged rows on the prior load, and saves the
+        newly parsed records to the file for the next load."""
+        self.load_lat_longs()
+        self.load_records(streaming, parsed_records_filename)
+
+    def load_lat_longs(self) -> None:
+        """Loads the lat/long reference table, if there is one."""
         if self._lat_longs_filename is not None:
             self._lat_longs = LatLongTable(self._lat_longs_filename)
             self._lat_longs.load()
-        load_csv(self._records_filename, self._receive_row)
+
+    def load_records(
+        self, streaming: bool = False, parsed_records_filename: Optional[str] = None
+    ) -> None:
+        """Loads the records as load() does, after the lat/long table is loaded."""
+        self.streaming = streaming
+        if not streaming:
+            if parsed_records_filename is None:
+                load_csv(self._records_filename, self._receive_row)
+                check_collection_dates(self.records)
+            else:
+                self._load_incrementally(parsed_records_filename)
+
+    def reload_names(self, declared_names_table: DeclaredNamesTable) -> None:
+        """Re-parses the names of the records using a revised table of declared names,
+        leaving the rest of the records as they are, and starts a new catalog of
+        identities, to be consolidated anew on the next revision of names."""
+        self.declared_names_table = declared_names_table
+        for record in self.records:
+            record.reparse_names(declared_names_table)
+        self._issue_index = None
+        self.identity_catalog = IdentityCatalog(declared_names_table)
+        self._collected_agents = False
+        self._revised_names = False
 
     def revise_names(
         self, unify_names_by_sound: bool, merge_with_reference_names: bool
     ) -> None:
         if self._revised_names:
             return
-        assert self._summarized, "Must call summarize() before revising names."
+        assert self._collected_agents, "Must call summarize() before revising names."
         self.identity_catalog.correct_and_consolidate(
             unify_names_by_sound, merge_with_reference_names
         )
         self._revised_names = True
 
     def summarize(self, record_filter: RecordFilter) -> None:
-        if self._summarized:
-            return
-        for record in self.records:
-            if record is not None:
-                if record_filter.test(record):
+        """Collects statistics on the records that pass the filter, replacing any
+        statistics collected for a different filter, and collects the agents of all
+        records into the identity catalog, if not already collected."""
+        if record_filter is not self._summary_filter:
+            if self._summary_filter is not None:
+                self._init_summary()
+            for record in self.records:
+                if record is not None and record_filter.test(record):
                     self.catalog_numbers[record.catalog_number] = True
                     self._collect_record(record)
-                self._collect_agents(record)
-        self._summarized = True
+            self._summary_filter = record_filter
+        if not self._collected_agents:
+            for record in self.records:
+                if record is not None:
+                    self._collect_agents(record)
+            self._collected_agents = True
 
     def _collect_record(self, record: SpecimenRecord) -> None:
 
@@ -213,6 +282,105 @@ class JamesTable:
         except KeyError:
             dictionary[s] = 1
 
+    def _init_summary(self) -> None:
+        self.catalog_numbers: dict[Optional[int], bool] = {}
+        self.james_ids: dict[int, bool] = {}
+        self.phyla: StrCountDict = {}
+        self.classes: StrCountDict = {}
+        self.subclasses: StrCountDict = {}
+        self.orders: StrCountDict = {}
+        self.suborders: StrCountDict = {}
+        self.infraorders: StrCountDict = {}
+        self.families: StrCountDict = {}
+        self.subfamilies: StrCountDict = {}
+        self.genera: StrCountDict = {}
+        self.species: StrCountDict = {}
+        self.subspecies: StrCountDict = {}
+        self.genus_species: StrCountDict = {}
+        self.species_subspecies: StrCountDict = {}
+        self.authors: StrCountDict = {}
+        self.continents: StrCountDict = {}
+        self.countries: StrCountDict = {}
+        self.states: StrCountDict = {}
+        self.counties: StrCountDict = {}
+        self.localities: StrCountDict = {}
+        self.lowercaseLocalities: dict[str, list[str]] = {}
+        self.localityCounties: dict[str, list[str | None]] = {}
+        self.countyLocalities: dict[str | None, list[str]] = {}
+        self.owners: StrCountDict = {}
+        self.localityOwners: dict[str, list[str | None]] = {}
+        self.microhabitats: StrCountDict = {}
+        self.type_statuses: StrCountDict = {}
+        self.collections: StrCountDict = {}
+        self.seasons: StrCountDict = {}
+        self.parts_of_month: StrCountDict = {}
+        self.parts_of_day: StrCountDict = {}
+        self.total_specimen_count: int = 0
+
+    def _load_incrementally(self, parsed_records_filename: str) -> None:
+
+        # Get the records parsed on the prior load, keyed by the fingerprints of
+        # their rows. They're only valid for the same lat/long table, but if only
+        # the declared names differ, their names can be re-parsed. An unreadable
+        # file is treated as having no records, to be replaced.
+
+        lat_longs_fingerprint = b""
+        if self._lat_longs is not None:
+            lat_longs_fingerprint = self._lat_longs.get_fingerprint()
+        names_fingerprint = self.declared_names_table.get_fingerprint()
+        prior_records: dict[bytes, SpecimenRecord] = {}
+        prior_names_fingerprint = b""
+        try:
+            with open(parsed_records_filename, "rb") as file:
+                (
+                    format,
+                    prior_lat_longs_fingerprint,
+                    prior_names_fingerprint,
+                    prior_records,
+                ) = pickle.load(file)
+            if (
+                format != PARSED_RECORDS_FORMAT
+                or prior_lat_longs_fingerprint != lat_longs_fingerprint
+            ):
+                prior_records = {}
+        except Exception:
+            prior_records = {}
+
+        # Load the records, parsing only the rows that have changed.
+
+        parsed_records: dict[bytes, SpecimenRecord] = {}
+        new_records: list[SpecimenRecord] = []
+        for row in iter_csv(self._records_filename):
+            if row["Catalog Number"].strip() == END_CAT_NUM:
+                break
+            fingerprint = hash_row(row)
+            record = prior_records.pop(fingerprint, None)
+            if record is None:
+                record = self._create_record(row)
+                new_records.append(record)
+            elif prior_names_fingerprint != names_fingerprint:
+                record.reparse_names(self.declared_names_table)
+            self._add_record(record)
+            parsed_records[fingerprint] = record
+
+        check_collection_dates(new_records)
+
+        # Save the records before consolidating names alters their identities.
+
+        temp_filename = parsed_records_filename + ".tmp"
+        with open(temp_filename, "wb") as file:
+            pickle.dump(
+                (
+                    PARSED_RECORDS_FORMAT,
+                    lat_longs_fingerprint,
+                    names_fingerprint,
+                    parsed_records,
+                ),
+                file,
+                pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp_filename, parsed_records_filename)
+
     def _receive_row(self, row: dict[str, str]) -> bool:
 
         # Quit prematurely if there are no more records.
@@ -223,12 +391,50 @@ class JamesTable:
 
         # Create a record for the line and log its data.
 
-        record = SpecimenRecord(
+        self._add_record(self._create_record(row))
+        return True
+
+    def _add_record(self, record: SpecimenRecord) -> None:
+        if record.catalog_number is not None or record.has_specimen():
+            self.records.append(record)
+        else:
+            self.empty_record_ids.append(record.id)
+
+        # Collect catalog number statistics.
+
+        cat_num = record.catalog_number
+        if cat_num is not None and cat_num > 0:
+            if cat_num in self.catalog_numbers_to_records:
+                self.catalog_numbers_to_records[cat_num].append(record)
+            else:
+                self.catalog_numbers_to_records[cat_num] = [record]
+            if self.max_catalog_number < cat_num:
+                self.max_catalog_number = cat_num
+
+    def _stream_records(self) -> Iterator[SpecimenRecord]:
+        # Parse the records in batches, to check the batch's dates all at once.
+
+        records: list[SpecimenRecord] = []
+        for row in iter_csv(self._records_filename):
+            if row["Catalog Number"].strip() == END_CAT_NUM:
+                break
+            record = self._create_record(row)
+            if record.catalog_number is not None or record.has_specimen():
+                records.append(record)
+                if len(records) == STREAMED_CHECK_COUNT:
+                    check_collection_dates(records)
+                    yield from records
+                    records = []
+        check_collection_dates(records)
+        yield from records
+
+    def _create_record(self, row: dict[str, str]) -> SpecimenRecord:
+        return SpecimenRecord(
             self._lat_longs,
             self.declared_names_table,
             row["ID"].strip(),
             row["Proofed-JR"].strip(),
-            raw_catalog_number,
+            row["Catalog Number"].strip(),
             row["Phylum"].strip(),
             row["Class"].strip(),
             row["Subclass"].strip(),
@@ -272,23 +478,6 @@ class JamesTable:
             row["area"].strip(),
         )
 
-        if record.catalog_number is not None or record.has_specimen():
-            self.records.append(record)
-        else:
-            self.empty_record_ids.append(record.id)
-
-        # Collect catalog number statistics.
-
-        cat_num = record.catalog_number
-        if cat_num is not None and cat_num > 0:
-            if cat_num in self.catalog_numbers_to_records:
-                self.catalog_numbers_to_records[cat_num].append(record)
-            else:
-                self.catalog_numbers_to_records[cat_num] = [record]
-            if self.max_catalog_number < cat_num:
-                self.max_catalog_number = cat_num
-        return True
-
 
 def _combine(term1: str | None, term2: str | None) -> str | None:
     if term2 is None:
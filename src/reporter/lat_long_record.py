@@ -1,8 +1,12 @@
 from __future__ import annotations
-from typing import Optional
-from decimal import Decimal, InvalidOperation
+from typing import Any, Optional
+from decimal import InvalidOperation
 import re
 
+from src.util.report_writer import ReportWriter
+from src.reporter.coordinate import Coordinate
+from src.reporter.record_issue import IssueCode, RecordIssue
+
 
 class LatLongRecord:
 
@@ -17,8 +21,8 @@ class LatLongRecord:
     ):
         # Issues lists must come first to allow for logging issues.
 
-        self._problems: Optional[list[str]] = None
-        self._warnings: Optional[list[str]] = None
+        self._problems: Optional[list[RecordIssue]] = None
+        self._warnings: Optional[list[RecordIssue]] = None
         self.remarks: list[str] = []
 
         # Load from raw data.
@@ -30,52 +34,78 @@ class LatLongRecord:
         self.trust_longitude_precision = False
         self.longitude = self._parse_longitude(raw_longitude)
 
-    def add_problem(self, description: str) -> None:
+    def add_problem(
+        self, code: IssueCode, *args: Any, field: Optional[str] = None
+    ) -> None:
+        issue = RecordIssue.create(code, field, args)
         if self._problems is None:
-            self._problems = [description]
+            self._problems = [issue]
         else:
-            self._problems.append(description)
+            self._problems.append(issue)
 
-    def add_warning(self, description: str) -> None:
+    def add_warning(
+        self, code: IssueCode, *args: Any, field: Optional[str] = None
+    ) -> None:
+        issue = RecordIssue.create(code, field, args)
         if self._warnings is None:
-            self._warnings = [description]
+            self._warnings = [issue]
         else:
-            self._warnings.append(description)
+            self._warnings.append(issue)
+
+    def add_issues(
+        self, problems: list[RecordIssue], warnings: list[RecordIssue]
+    ) -> None:
+        if problems:
+            if self._problems is None:
+                self._problems = list(problems)
+            else:
+                self._problems.extend(problems)
+        if warnings:
+            if self._warnings is None:
+                self._warnings = list(warnings)
+            else:
+                self._warnings.extend(warnings)
 
     def get_multi_id(self) -> str:
         cat_num = self.catalog_number
         cat_num_str = str(cat_num) if cat_num is not None else "NONE"
         return "%d/%s" % (self.id, cat_num_str)
 
-    def print_all_problems(self) -> bool:
+    def get_problems(self) -> list[RecordIssue]:
+        return self._problems if self._problems else []
+
+    def get_warnings(self) -> list[RecordIssue]:
+        return self._warnings if self._warnings else []
+
+    def print_all_problems(self, out: Optional[ReportWriter] = None) -> bool:
         if self._problems is None:
             return False
-        self._print_issues(self._problems)
+        self._print_issues(self._problems, out)
         return True
 
-    def print_all_warnings(self) -> bool:
+    def print_all_warnings(self, out: Optional[ReportWriter] = None) -> bool:
         if self._warnings is not None:
-            self._print_issues(self._warnings)
+            self._print_issues(self._warnings, out)
             return True
         return False
 
     def _parse_catalog_number(self, s: str) -> Optional[int]:
         cat_num = self._parse_int("catalog number", s)
         if cat_num is None or cat_num < 1 or cat_num > 300000:
-            self.add_problem("invalid catalog number '%s'" % s)
+            self.add_problem(IssueCode.INVALID_CATALOG_NUMBER, s)
         return cat_num
 
     def _parse_int(self, field_name: str, s: str) -> Optional[int]:
         try:
             return int(s)
         except ValueError:
-            self.add_problem("%s '%s' is not an integer" % (field_name, s))
+            self.add_problem(IssueCode.NOT_AN_INTEGER, s, field=field_name)
             return None
 
     def _parse_int_or_0(self, field_name: str, s: str) -> Optional[int]:
         return self._parse_int(field_name, s if s != "" else "0")
 
-    def _parse_latitude(self, s: str) -> Optional[Decimal]:
+    def _parse_latitude(self, s: str) -> Optional[Coordinate]:
         if s == "":
             return None
         if (
@@ -92,13 +122,13 @@ class LatLongRecord:
         if latitude is None:
             return None
         if latitude < -90 or latitude > 90:
-            self.add_problem("latitude '%s' out of range" % s)
+            self.add_problem(IssueCode.LATITUDE_OUT_OF_RANGE, s)
         return latitude
 
-    def _parse_longitude(self, s: str) -> Optional[Decimal]:
+    def _parse_longitude(self, s: str) -> Optional[Coordinate]:
         if s == "":
             if self.latitude is not None:
-                self.add_problem("latitude specified but not also longitude")
+                self.add_problem(IssueCode.LATITUDE_WITHOUT_LONGITUDE)
             return None
         if (
             s[0] == "-"
@@ -114,12 +144,12 @@ class LatLongRecord:
         if longitude is None:
             return None
         if longitude < -180 or longitude > 180:
-            self.add_problem("longitude '%s' out of range" % s)
+            self.add_problem(IssueCode.LONGITUDE_OUT_OF_RANGE, s)
         if self.latitude is None:
-            self.add_problem("longitude specified but not also latitude")
+            self.add_problem(IssueCode.LONGITUDE_WITHOUT_LATITUDE)
         return longitude
 
-    def _parse_lat_long(self, field_name: str, s: str) -> Optional[Decimal]:
+    def _parse_lat_long(self, field_name: str, s: str) -> Optional[Coordinate]:
         original_s = s
         if s.startswith(", -"):
             s = s[2:]
@@ -149,14 +179,14 @@ class LatLongRecord:
             assert s.find(".") == s.rfind(".")
             if s != original_s:
                 self.remarks.append("lat/long: [%s]" % original_s)
-            return Decimal(s)
+            return Coordinate.parse(s)
         except (AssertionError, InvalidOperation):
-            self.add_problem("%s '%s' is not a valid decimal" % (field_name, s))
+            self.add_problem(IssueCode.INVALID_DECIMAL, s, field=field_name)
             return None
 
     def _parse_non_empty(self, field_name: str, s: str) -> Optional[str]:
         if s == "":
-            self.add_problem("%s is empty" % field_name)
+            self.add_problem(IssueCode.EMPTY_FIELD, field=field_name)
             return None
         return s
 
@@ -169,6 +199,12 @@ class LatLongRecord:
             s = s[0:offset]
         return re.sub(r"[\t ]+", " ", s)
 
-    def _print_issues(self, issues: list[str]) -> None:
+    def _print_issues(
+        self, issues: list[RecordIssue], out: Optional[ReportWriter] = None
+    ) -> None:
         multi_id = self.get_multi_id()
-        print("* %s %s: %s" % (self.MULTI_ID_LABEL, multi_id, "; ".join(issues)))
+        descriptions = "; ".join(str(issue) for issue in issues)
+        print(
+            "* %s %s: %s" % (self.MULTI_ID_LABEL, multi_id, descriptions),
+            file=out,
+        )
@@ -1,28 +1,173 @@
 from __future__ import annotations
 from typing import Optional
+from array import array
+import bisect
+import hashlib
+import struct
 
 from src.util.any_csv import load_csv
+from src.reporter.coordinate import Coordinate
 from src.reporter.lat_long_record import LatLongRecord
 
+INDEX_FORMAT = 1  # increment when the layout of the index file changes
+
+# Header of the index file: magic number, format, hash of the CSV, record count.
+_HEADER = struct.Struct("=4sH16sQ")
+_MAGIC = b"LLIX"
+
+# Bits of each record's flags.
+_HAS_LATITUDE = 1
+_NEGATIVE_LATITUDE = 2
+_HAS_LONGITUDE = 4
+_NEGATIVE_LONGITUDE = 8
+
+_LatLong = tuple[Optional[Coordinate], Optional[Coordinate]]
+
 
 class LatLongTable:
+    """Table of the reference coordinates of records by record ID, held compactly
+    as a sorted array of IDs and parallel arrays of coordinate units, digits, and
+    flags, looked up by binary search. Parsing the CSV builds a binary index file
+    of these arrays next to it, named after the CSV with an `.index` suffix, and
+    later loads read the arrays straight from the index file until the CSV
+    changes. Coordinates too large for the arrays are kept in a dictionary, and
+    no index file is written for a CSV having them."""
+
     def __init__(self, csv_filename: str):
         self._csv_filename = csv_filename
-        self._records: dict[int, LatLongRecord] = {}
+        self._index_filename = csv_filename + ".index"
+        self._fingerprint = b""
+        self._ids = array("q")
+        self._latitude_units = array("q")
+        self._longitude_units = array("q")
+        self._latitude_digits = array("b")
+        self._longitude_digits = array("b")
+        self._flags = array("B")
+        self._oversized: dict[int, _LatLong] = {}
 
     def load(self) -> None:
-        load_csv(self._csv_filename, self._receive_row)
+        self._fingerprint = _hash_file(self._csv_filename)
+        if self._read_index():
+            return
+        lat_longs: dict[int, _LatLong] = {}
+
+        def receive_row(row: dict[str, str]) -> bool:
+            record = LatLongRecord(
+                row["id"], row["cat_num"], row["latitude"], row["longitude"]
+            )
+            if record.latitude is not None or record.longitude is not None:
+                lat_longs[record.id] = (record.latitude, record.longitude)
+            return True
+
+        load_csv(self._csv_filename, receive_row)
+        for record_id in sorted(lat_longs.keys()):
+            self._append(record_id, lat_longs[record_id])
+        if not self._oversized:
+            self._write_index()
+
+    def get_coordinates(self, record_id: int) -> Optional[_LatLong]:
+        """Returns the reference latitude and longitude of the record, either of
+        which may be None, or None if the table has no coordinates for the record."""
+        i = bisect.bisect_left(self._ids, record_id)
+        if i == len(self._ids) or self._ids[i] != record_id:
+            return self._oversized.get(record_id)
+        flags = self._flags[i]
+        latitude: Optional[Coordinate] = None
+        if flags & _HAS_LATITUDE:
+            latitude = Coordinate(
+                self._latitude_units[i],
+                self._latitude_digits[i],
+                flags & _NEGATIVE_LATITUDE != 0,
+            )
+        longitude: Optional[Coordinate] = None
+        if flags & _HAS_LONGITUDE:
+            longitude = Coordinate(
+                self._longitude_units[i],
+                self._longitude_digits[i],
+                flags & _NEGATIVE_LONGITUDE != 0,
+            )
+        return (latitude, longitude)
+
+    def get_fingerprint(self) -> bytes:
+        """Returns a hash of the CSV from which the table was loaded."""
+        return self._fingerprint
 
-    def get_by_id(self, record_id: int) -> Optional[LatLongRecord]:
+    def __len__(self) -> int:
+        return len(self._ids) + len(self._oversized)
+
+    def _append(self, record_id: int, lat_long: _LatLong) -> None:
+        latitude, longitude = lat_long
+        if not (_fits(latitude) and _fits(longitude)):
+            self._oversized[record_id] = lat_long
+            return
+        flags = 0
+        if latitude is not None:
+            flags |= _HAS_LATITUDE | (_NEGATIVE_LATITUDE if latitude.negative else 0)
+        if longitude is not None:
+            flags |= _HAS_LONGITUDE | (_NEGATIVE_LONGITUDE if longitude.negative else 0)
+        self._ids.append(record_id)
+        self._latitude_units.append(0 if latitude is None else latitude.units)
+        self._latitude_digits.append(0 if latitude is None else latitude.digits)
+        self._longitude_units.append(0 if longitude is None else longitude.units)
+        self._longitude_digits.append(0 if longitude is None else longitude.digits)
+        self._flags.append(flags)
+
+    def _get_arrays(self) -> list[array[int]]:
+        return [
+            self._ids,
+            self._latitude_units,
+            self._longitude_units,
+            self._latitude_digits,
+            self._longitude_digits,
+            self._flags,
+        ]
+
+    def _read_index(self) -> bool:
+        # Loads the arrays from the index file, returning False if the file is
+        # missing, unreadable, or was not built from the current CSV.
+        try:
+            with open(self._index_filename, "rb") as file:
+                magic, format, fingerprint, count = _HEADER.unpack(
+                    file.read(_HEADER.size)
+                )
+                if (
+                    magic != _MAGIC
+                    or format != INDEX_FORMAT
+                    or fingerprint != self._fingerprint
+                ):
+                    return False
+                for values in self._get_arrays():
+                    values.fromfile(file, count)
+            return True
+        except (OSError, EOFError, ValueError, struct.error):
+            for values in self._get_arrays():
+                del values[:]
+            return False
+
+    def _write_index(self) -> None:
+        # The index only speeds up later loads, so failing to write it is harmless.
         try:
-            return self._records[record_id]
-        except KeyError:
-            return None
-
-    def _receive_row(self, row: dict[str, str]) -> bool:
-        record = LatLongRecord(
-            row["id"], row["cat_num"], row["latitude"], row["longitude"]
-        )
-        if record.latitude is not None or record.longitude is not None:
-            self._records[record.id] = record
-        return True
+            with open(self._index_filename, "wb") as file:
+                file.write(
+                    _HEADER.pack(
+                        _MAGIC, INDEX_FORMAT, self._fingerprint, len(self._ids)
+                    )
+                )
+                for values in self._get_arrays():
+                    values.tofile(file)
+        except OSError:
+            pass
+
+
+def _fits(coordinate: Optional[Coordinate]) -> bool:
+    return coordinate is None or (
+        -(1 << 63) <= coordinate.units < (1 << 63) and -128 <= coordinate.digits < 128
+    )
+
+
+def _hash_file(filename: str) -> bytes:
+    file_hash = hashlib.blake2b(digest_size=16)
+    with open(filename, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 16), b""):
+            file_hash.update(chunk)
+    return file_hash.digest()
@@ -1,32 +1,93 @@
 from __future__ import annotations
+from typing import Any, Optional
+import difflib
+import importlib
 import os
+import sys
+import time
+import traceback
 
 import src.util.args as args
+from src.util.report_writer import *
+from src.util.phase_profiler import PhaseProfiler
 from src.lib.declared_names_table import DeclaredNamesTable
+from export_diff import ExportDiff
 from james_table import JamesTable
 from record_filter import *
-from reports.report import *
-from reports.agents_report import *
-from reports.county_localities import *
-from reports.dictionary_report import *
-from reports.dups_by_taxa_report import *
-from reports.foreign_word_report import *
-from reports.initial_only_cat_nums_report import *
-from reports.label_report import *
-from reports.lat_long_report import *
-from reports.listed_names_cat_nums_report import *
-from reports.name_cat_nums_report import *
-from reports.name_check_report import *
-from reports.no_specimens_by_taxa import *
-from reports.oddities_report import *
-from reports.problem_report import *
-from reports.remarks_report import *
-from reports.specify_workbench_report import *
-from reports.taxa_by_dups_report import *
-from reports.taxa_check_report import *
-from reports.taxa_report import *
-from reports.tss_csv_report import *
-from reports.normalized_csv_report import *
+from reports.report import Report
+
+WATCH_INTERVAL_SECONDS = 1.0  # how often to check for revised names files
+
+# Module and class of the report for each report code. A report's module is only
+# imported when the report is requested, sparing other reports its imports.
+REPORT_CLASSES: dict[str, tuple[str, str]] = {
+    "A": ("reports.agents_report", "AgentsReport"),
+    "AC": ("reports.agents_report", "AgentsReport"),
+    "C": ("reports.lat_long_report", "LatLongReport"),
+    "D": ("reports.dictionary_report", "DictionaryReport"),
+    "DC": ("reports.county_localities", "CountyLocalitiesReport"),
+    "E": ("reports.export_diff_report", "ExportDiffReport"),
+    "F": ("reports.foreign_word_report", "ForeignWordReport"),
+    "G": ("reports.coordinate_conflicts_report", "CoordinateConflictsReport"),
+    "L": ("reports.label_report", "LabelReport"),
+    "M": ("reports.label_report", "LabelReport"),
+    "N": ("reports.normalized_csv_report", "NormalizedCsvReport"),
+    "O": ("reports.oddities_report", "OdditiesReport"),
+    "P": ("reports.problem_report", "ProblemReport"),
+    "QL": ("reports.locality_check_report", "LocalityCheckReport"),
+    "QN": ("reports.name_check_report", "NameCheckReport"),
+    "QT": ("reports.taxa_check_report", "TaxaCheckReport"),
+    "R": ("reports.remarks_report", "RemarksReport"),
+    "T": ("reports.tss_csv_report", "TssCsvReport"),
+    "U": ("reports.listed_names_cat_nums_report", "ListedNamesCatNumsReport"),
+    "V": ("reports.initial_only_cat_nums_report", "InitialOnlyCatNumsReport"),
+    "W": ("reports.specify_workbench_report", "SpecifyWorkbenchReport"),
+    "X": ("reports.taxa_report", "TaxaReport"),
+    "Y": ("reports.taxa_by_dups_report", "TaxaByDupsReport"),
+    "Z": ("reports.dups_by_taxa_report", "DupsByTaxaReport"),
+    "0": ("reports.no_specimens_by_taxa", "NoSpecimensByTaxaReport"),
+}
+
+# fmt: off
+USAGE = (
+    "Normalizes James' cave data spreadsheet.\n"
+    "  args: [-c|-f|-n|-t|-x] [-d=<file>] [-i] [-m[=<file>]] [-a=<count>] [-o=<file>] [-p] [-r<report-letters>] [-s] [-w] <specimen_csv>\n"
+    "\n"
+    "-a=<count> profile as with -m, also tracing memory allocations to show the\n"
+        "peak traced memory of each phase and the top <count> allocation sites\n"
+    "-c restrict report to just cave data\n"
+    "-d=<prior-csv> restrict report to records added or modified since this\n"
+        "prior export of the specimens, which report E compares in full\n"
+    "-f=<family-name> restrict report to just cave records in this family\n"
+    "-i reuse the records parsed from rows unchanged since the last -i run,\n"
+        "which are kept in '<specimen_csv>.parsed'\n"
+    "-m[=<pstats-file>] profile the run, showing the wall time and peak memory\n"
+        "of each phase on stderr, and save cProfile stats to any given file\n"
+    "-n restrict report to just non-cave data\n"
+    "-o=<output-file> write the report to this file instead of stdout,\n"
+        "gzip-compressed if the name ends in '.gz'\n"
+    "-p create a printable report (of labels)\n"
+    "-r reports to print: A=agents, F=foreign characters, C=lat/long coords,\n"
+        "D=dictionaries, E=export changes, G=coordinate conflicts, L=labels,\n"
+        "M=mashed labels, N=normalized CSV, O=oddities,\n"
+        "P=problems, QL=locality check, QN=name check, QT=taxa check,\n"
+        "R=remarks, T=TSS CSV, U=cat nums for names, V=cat nums for initials,\n"
+        "W=CSV for Specify Workbench, X=taxa, Y=taxa by dups, Z=dups by taxon,\n"
+        "0=0 specimen counts by taxa, AC=collectors, DC=localities per county\n"
+    "-s stream records through the report without loading the whole table\n"
+        "(only for single-pass reports C, E, and R)\n"
+    "-t restrict report to just Texas cave data\n"
+    "-w watch the declared and reference names files, showing how the report\n"
+        "changes each time they change (e.g. with -rA)\n"
+    "-x=<taxa-file> restrict report to just the taxa in this file\n"
+    "-y=<proofed-tag> restrict report to just records with this proofed tag\n"
+    "<specimen_csv> is the path to a CSV file of specimens. 'reference-lat-longs.csv'\n"
+    "  is expected to be in the same directory, providing lat/long accuracy info.\n"
+    "\n"
+    "<min-max> = <min-required-label-lines>-<max-usable-label-lines>\n"
+    "Use cat num. '_END_' to end table before the end of the CSV file.\n"
+)
+# fmt: on
 
 
 class Norm:
@@ -43,145 +104,294 @@ class Norm:
         self._jar_group_uniques: Optional[list[str]] = None
         self._make_printable = False
         self._restricted_to_texas = False
+        self._streaming = False
+        self._incremental = False
+        self._output_file: Optional[str] = None
+        self._watching = False
+        self._prior_csv_file: Optional[str] = None
+        self._export_diff: Optional[ExportDiff] = None
+        self._profiling = False
+        self._pstats_file: Optional[str] = None
+        self._allocation_count = 0
 
     def main(self) -> None:
-        # fmt: off
-        info = (
-            "Normalizes James' cave data spreadsheet.\n"
-            "  args: [-c|-f|-n|-t|-x] [-r<report-letters>] [-p] <specimen_csv>\n"
-            "\n"
-            "-c restrict report to just cave data\n"
-            "-f=<family-name> restrict report to just cave records in this family\n"
-            "-n restrict report to just non-cave data\n"
-            "-p create a printable report (of labels)\n"
-            "-r reports to print: A=agents, F=foreign characters, C=lat/long coords,\n"
-                "D=dictionaries, L=labels, M=mashed labels, N=normalized CSV, O=oddities,\n"
-                "P=problems, QN=name check, QT=taxa check, R=remarks, T=TSS CSV,\n"
-                "U=cat nums for names, V=cat nums for initials,\n"
-                "W=CSV for Specify Workbench, X=taxa, Y=taxa by dups, Z=dups by taxon,\n"
-                "0=0 specimen counts by taxa, AC=collectors, DC=localities per county\n"
-            "-t restrict report to just Texas cave data\n"
-            "-x=<taxa-file> restrict report to just the taxa in this file\n"
-            "-y=<proofed-tag> restrict report to just records with this proofed tag\n"
-            "<specimen_csv> is the path to a CSV file of specimens. 'reference-lat-longs.csv'\n"
-            "  is expected to be in the same directory, providing lat/long accuracy info.\n"
-            "\n"
-            "<min-max> = <min-required-label-lines>-<max-usable-label-lines>\n"
-            "Use cat num. '_END_' to end table before the end of the CSV file.\n"
-        )
-        # fmt: on
+        out = StreamReportWriter(sys.stdout)
+        try:
+            start_time = time.perf_counter()
+            self.parse_args(sys.argv)
+            if self._profiling:
+                self._profile_report(time.perf_counter() - start_time, out)
+            else:
+                table = self.load_table()
+                self.show_report(table, out)
+        except args.ArgException as e:
+            self.print_usage(e, out)
+        out.flush()
 
+    def get_source_files(self) -> list[str]:
+        """Returns the paths of the files from which the table is loaded, with the
+        specimen and lat/long files first and the names files last."""
+        return [
+            self._specimen_csv_file,
+            self._lat_longs_csv_file,
+            self._declared_names_file,
+            self._reference_names_file,
+        ]
+
+    def is_streaming(self) -> bool:
+        return self._streaming
+
+    def is_watching(self) -> bool:
+        return self._watching
+
+    def load_declared_names(self) -> DeclaredNamesTable:
+        return DeclaredNamesTable(self._declared_names_file, self._reference_names_file)
+
+    def load_table(self) -> JamesTable:
+        table = self._create_table(self.load_declared_names())
+        table.load(self._streaming, self._get_parsed_records_file())
+        return table
+
+    def parse_args(self, argv: list[str]) -> None:
         options: args.OptionsDict = {
+            "-a": self._parse_allocation_count,
             "-c": self._parse_cave_report,
+            "-d": self._parse_prior_export,
             "-f": self._parse_cave_family_report,
+            "-i": self._parse_incremental,
+            "-m": self._parse_profiling,
             "-n": self._parse_noncave_report,
+            "-o": self._parse_output_file,
             "-p": self._parse_make_printable,
             "-r": self._parse_report_type,
+            "-s": self._parse_streaming,
             "-t": self._parse_texas_cave_report,
+            "-w": self._parse_watching,
             "-x": self._parse_taxa_filter,
             "-y": self._parse_proofed_filter,
             0: self._parse_specimen_csv,
             None: self._parse_no_arguments,
         }
-        try:
-            # Parse the input data and generate the table.
+        args.parse_args(options, argv)
 
-            args.parse_args(options)
-            decls = DeclaredNamesTable(
-                self._declared_names_file, self._reference_names_file
+        if self._prior_csv_file is not None:
+            self._export_diff = ExportDiff(
+                self._prior_csv_file, self._specimen_csv_file
             )
-            table = JamesTable(self._lat_longs_csv_file, self._specimen_csv_file, decls)
-            table.load()
-
-            # Construct the report filter.
-
-            filter = AllRecordsFilter()
-            if len(self._record_filters) == 1:
-                filter = self._record_filters[0]
-            elif len(self._record_filters) > 1:
-                filter = CompoundRecordFilter(self._record_filters)
-            if self._jar_group_uniques and self._restricted_to_texas:
-                raise args.ArgException("Can't combine -t with -x")
-
-            # Construct and show the report. Done after reading all arguments so
-            # that the filters are available.
-
-            if self._report_code == "":
-                raise args.ArgException("No report specified")
-            elif self._report_code == "A":
-                report = AgentsReport(table, filter, decls, False)
-            elif self._report_code == "AC":
-                report = AgentsReport(table, filter, decls, True)
-            elif self._report_code == "C":
-                report = LatLongReport(table, filter, True)
-            elif self._report_code == "D":
-                report = DictionaryReport(table, filter)
-            elif self._report_code == "DC":
-                report = CountyLocalitiesReport(table, filter)
-            elif self._report_code == "F":
-                report = ForeignWordReport(table, filter)
-            elif self._report_code == "L":
-                report = LabelReport(
-                    table,
-                    filter,
-                    self._jar_group_uniques,
-                    decls,
-                    LabelReport.Type.ALL,
-                    self._make_printable,
-                )
-            elif self._report_code == "M":
-                report = LabelReport(
-                    table,
-                    filter,
-                    self._jar_group_uniques,
-                    decls,
-                    LabelReport.Type.MASHED,
-                    self._make_printable,
-                )
-            elif self._report_code == "N":
-                report = NormalizedCsvReport(table, filter)
-            elif self._report_code == "O":
-                report = OdditiesReport(table, filter)
-            elif self._report_code == "P":
-                report = ProblemReport(
-                    table,
-                    filter,
-                    self._jar_group_uniques,
+            self._record_filters.append(
+                ChangedRecordsFilter(self._export_diff.get_changed_ids())
+            )
+
+    def print_usage(self, e: args.ArgException, out: ReportWriter) -> None:
+        if e.message:
+            print(e.message, file=out)
+        print(file=out)
+        print(USAGE, file=out)
+
+    def create_filter(self) -> RecordFilter:
+        """Creates the record filter that the parsed arguments request."""
+        filter: RecordFilter = AllRecordsFilter()
+        if len(self._record_filters) == 1:
+            filter = self._record_filters[0]
+        elif len(self._record_filters) > 1:
+            filter = CompoundRecordFilter(self._record_filters)
+        if self._jar_group_uniques and self._restricted_to_texas:
+            raise args.ArgException("Can't combine -t with -x")
+        return filter
+
+    def create_report(
+        self, table: JamesTable, filter: Optional[RecordFilter] = None
+    ) -> Report:
+        """Creates the report that the parsed arguments request, for the given
+        filter, if not for the filter that the arguments request."""
+
+        if filter is None:
+            filter = self.create_filter()
+        decls = table.declared_names_table
+
+        # Construct the report. Done after reading all arguments so that the
+        # filters are available.
+
+        if self._report_code == "":
+            raise args.ArgException("No report specified")
+        if self._report_code not in REPORT_CLASSES:
+            raise args.ArgException("Urecognized report type '%s'" % self._report_code)
+        report_class = _import_report_class(self._report_code)
+        if self._report_code == "A":
+            report = report_class(table, filter, decls, False)
+        elif self._report_code == "AC":
+            report = report_class(table, filter, decls, True)
+        elif self._report_code == "C":
+            report = report_class(table, filter, True)
+        elif self._report_code == "E":
+            if self._export_diff is None:
+                raise args.ArgException("Report E requires -d")
+            report = report_class(table, filter, self._export_diff)
+        elif self._report_code == "L":
+            report = report_class(
+                table,
+                filter,
+                self._jar_group_uniques,
+                decls,
+                report_class.Type.ALL,
+                self._make_printable,
+            )
+        elif self._report_code == "M":
+            report = report_class(
+                table,
+                filter,
+                self._jar_group_uniques,
+                decls,
+                report_class.Type.MASHED,
+                self._make_printable,
+            )
+        elif self._report_code == "P":
+            report = report_class(
+                table,
+                filter,
+                self._jar_group_uniques,
+            )
+        elif self._report_code == "QN":
+            report = report_class(table, filter, self._more_first_names_file)
+        elif self._report_code == "W":
+            report = report_class(table)
+        else:
+            report = report_class(table, filter)  # the other reports take only these
+
+        if self._streaming and not report.SINGLE_PASS:
+            raise args.ArgException(
+                "Report type '%s' can't stream records" % self._report_code
+            )
+        return report
+
+    def show_report(self, table: JamesTable, out: ReportWriter) -> None:
+        """Shows the report that the parsed arguments request, writing it to the
+        requested output file or else to the provided writer. In watch mode, keeps
+        showing how the report changes as the names files change."""
+
+        if self._watching:
+            self._watch_report(table, out)
+        else:
+            self._write_report(self.create_report(table), out)
+
+    def _create_table(self, declared_names_table: DeclaredNamesTable) -> JamesTable:
+        return JamesTable(
+            self._lat_longs_csv_file, self._specimen_csv_file, declared_names_table
+        )
+
+    def _get_names_file_mtimes(self) -> list[Optional[float]]:
+        mtimes: list[Optional[float]] = []
+        for file_path in (self._declared_names_file, self._reference_names_file):
+            try:
+                mtimes.append(os.path.getmtime(file_path))
+            except FileNotFoundError:
+                mtimes.append(None)
+        return mtimes
+
+    def _get_parsed_records_file(self) -> Optional[str]:
+        if self._incremental:
+            return self._specimen_csv_file + ".parsed"
+        return None
+
+    def _profile_report(self, parse_seconds: float, out: ReportWriter) -> None:
+        # Show the report as show_report() does, but in separately measured phases,
+        # and then show the measurements on stderr. Constructing a report revises
+        # the names, if the report requires it, having already summarized them.
+
+        if self._watching:
+            raise args.ArgException("Can't combine -m with -w")
+        profiler = PhaseProfiler(self._pstats_file, self._allocation_count)
+        profiler.add_phase("parse args", parse_seconds)
+        with profiler.phase("declared names"):
+            table = self._create_table(self.load_declared_names())
+        with profiler.phase("lat/long table"):
+            table.load_lat_longs()
+        with profiler.phase("CSV parse"):
+            table.load_records(self._streaming, self._get_parsed_records_file())
+        filter = self.create_filter()
+        with profiler.phase("summarize"):
+            table.summarize(filter)
+        with profiler.phase("revise names"):
+            report = self.create_report(table, filter)
+        with profiler.phase("show report"):
+            self._write_report(report, out)
+        profiler.finish(sys.stderr)
+
+    def _render_report(self, table: JamesTable) -> str:
+        memory_out = MemoryReportWriter()
+        self.create_report(table).write_to(memory_out)
+        text = memory_out.get_text()
+        if self._output_file is not None:
+            with open_report_writer(self._output_file) as file_out:
+                file_out.write(text)
+        return text
+
+    def _write_report(self, report: Report, out: ReportWriter) -> None:
+        if self._output_file is None:
+            report.write_to(out)
+        else:
+            with open_report_writer(self._output_file) as file_out:
+                report.write_to(file_out)
+
+    def _watch_report(self, table: JamesTable, out: ReportWriter) -> None:
+        # Show the report in full, and then each time the declared or reference
+        # names change, re-parse just the names, re-consolidate the identities, and
+        # show the differences from the prior report. Runs until interrupted.
+
+        if self._streaming:
+            raise args.ArgException("Can't combine -s with -w")
+        prior_text = self._render_report(table)
+        out.write(prior_text)
+        out.flush()
+        prior_mtimes = self._get_names_file_mtimes()
+        try:
+            while True:
+                time.sleep(WATCH_INTERVAL_SECONDS)
+                mtimes = self._get_names_file_mtimes()
+                if mtimes == prior_mtimes:
+                    continue
+                prior_mtimes = mtimes
+                start_time = time.time()
+                try:
+                    table.reload_names(self.load_declared_names())
+                    text = self._render_report(table)
+                except Exception:
+                    print(traceback.format_exc(), file=out)
+                    out.flush()
+                    continue
+                print(
+                    "\n==== Names revised; report regenerated in %.1f seconds ====\n"
+                    % (time.time() - start_time),
+                    file=out,
                 )
-            elif self._report_code == "QN":
-                report = NameCheckReport(table, filter, self._more_first_names_file)
-            elif self._report_code == "QT":
-                report = TaxaCheckReport(table, filter)
-            elif self._report_code == "R":
-                report = RemarksReport(table, filter)
-            elif self._report_code == "T":
-                report = TssCsvReport(table, filter)
-            elif self._report_code == "U":
-                report = ListedNamesCatNumsReport(table, filter)
-            elif self._report_code == "V":
-                report = InitialOnlyCatNumsReport(table, filter)
-            elif self._report_code == "W":
-                report = SpecifyWorkbenchReport(table)
-            elif self._report_code == "X":
-                report = TaxaReport(table, filter)
-            elif self._report_code == "Y":
-                report = TaxaByDupsReport(table, filter)
-            elif self._report_code == "Z":
-                report = DupsByTaxaReport(table, filter)
-            elif self._report_code == "0":
-                report = NoSpecimensByTaxaReport(table, filter)
-            else:
-                raise args.ArgException(
-                    "Urecognized report type '%s'" % self._report_code
+                diff_lines = list(
+                    difflib.unified_diff(
+                        prior_text.splitlines(keepends=True),
+                        text.splitlines(keepends=True),
+                        "prior report",
+                        "revised report",
+                    )
                 )
+                if diff_lines:
+                    out.write("".join(diff_lines))
+                else:
+                    print("No changes to the report.", file=out)
+                out.flush()
+                prior_text = text
+        except KeyboardInterrupt:
+            pass
 
-            report.show()
+    def _parse_allocation_count(self, arg: str) -> None:
+        try:
+            self._allocation_count = int(arg)
+        except ValueError:
+            raise args.ArgException("-a requires a number of allocation sites")
+        if self._allocation_count < 1:
+            raise args.ArgException("-a requires at least one allocation site")
+        self._profiling = True
 
-        except args.ArgException as e:
-            if e.message:
-                print(e.message)
-            print()
-            print(info)
+    def _parse_output_file(self, arg: str) -> None:
+        self._output_file = args.expand_filename(arg)
 
     def _parse_make_printable(self, arg: str) -> None:
         self._make_printable = True
@@ -202,12 +412,29 @@ class Norm:
         self._record_filters.append(TexasCaveRecordFilter())
         self._restricted_to_texas = True
 
+    def _parse_incremental(self, _arg: str) -> None:
+        self._incremental = True
+
     def _parse_noncave_report(self, _arg: str) -> None:
         self._record_filters.append(NonCaveRecordsFilter())
 
+    def _parse_profiling(self, arg: str) -> None:
+        self._profiling = True
+        if arg != "":
+            self._pstats_file = args.expand_filename(arg)
+
+    def _parse_prior_export(self, arg: str) -> None:
+        self._prior_csv_file = args.expand_filename(arg)
+
     def _parse_report_type(self, arg: str) -> None:
         self._report_code = arg.upper()
 
+    def _parse_streaming(self, _arg: str) -> None:
+        self._streaming = True
+
+    def _parse_watching(self, _arg: str) -> None:
+        self._watching = True
+
     def _parse_taxa_filter(self, arg: str) -> None:
         self._jar_group_uniques = _load_file(args.expand_filename(arg))
         self._record_filters.append(TaxaFilter(self._jar_group_uniques))
@@ -227,5 +454,10 @@ def _load_file(file_path: str) -> list[str]:
     return lines
 
 
+def _import_report_class(report_code: str) -> Any:
+    module_name, class_name = REPORT_CLASSES[report_code]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 if __name__ == "__main__":
     Norm().main()
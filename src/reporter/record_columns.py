@@ -0,0 +1,125 @@
+from __future__ import annotations
+from typing import Any, Callable, Optional, Sequence, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.reporter.specimen_record import SpecimenRecord
+from src.reporter.record_filter import RecordFilter
+
+MISSING_INT = -1  # integer column value for a missing value
+
+
+class RecordColumns:
+    """Columnar view of the numeric and categorical fields of records, holding
+    each field as a NumPy array whose elements are in the order of the records,
+    so that totals, group-bys, and filter masks can be computed without visiting
+    each record. Integer columns hold MISSING_INT for missing values, except for
+    the counts, which hold 0 as the records do for blank counts. The coordinates
+    and accuracy are floats, NaN when missing, and so are only approximations."""
+
+    class Categorical:
+        """Column of string values, each coded as the index of the value in the
+        sorted list of the distinct values, or as MISSING_INT if missing."""
+
+        def __init__(self, values: list[Optional[str]]):
+            self.categories: list[str] = sorted(
+                set(value for value in values if value is not None)
+            )
+            code_map = {category: i for i, category in enumerate(self.categories)}
+            self.codes: Any = np.array(
+                [MISSING_INT if value is None else code_map[value] for value in values],
+                dtype=np.int32,
+            )
+
+        def get_code(self, category: Optional[str]) -> int:
+            """Returns the code of the category, or MISSING_INT if None, raising
+            KeyError if the column has no such category."""
+            if category is None:
+                return MISSING_INT
+            code = np.searchsorted(self.categories, category)
+            if code == len(self.categories) or self.categories[code] != category:
+                raise KeyError(category)
+            return int(code)
+
+        def get_mask(self, category: Optional[str]) -> Any:
+            """Returns a boolean array indicating the records in the category,
+            which is empty of records if the column has no such category."""
+            try:
+                return self.codes == self.get_code(category)
+            except KeyError:
+                return np.zeros(len(self.codes), dtype=bool)
+
+        def sum_by_category(self, values: Any) -> dict[str, Any]:
+            """Returns the sum of the values of the records in each category, given
+            a column of the values, excluding the records missing the category."""
+            present = self.codes != MISSING_INT
+            sums = np.bincount(
+                self.codes[present],
+                weights=values[present],
+                minlength=len(self.categories),
+            )
+            return dict(zip(self.categories, sums.astype(values.dtype).tolist()))
+
+    def __init__(self, records: Sequence[SpecimenRecord]):
+        self.records = records
+
+        self.id = _to_int_column(records, lambda r: r.id)
+        self.catalog_number = _to_int_column(records, lambda r: r.catalog_number)
+        self.specimen_count = _to_int_column(records, lambda r: r.specimen_count, 0)
+        self.females = _to_int_column(records, lambda r: r.females, 0)
+        self.males = _to_int_column(records, lambda r: r.males, 0)
+        self.immatures = _to_int_column(records, lambda r: r.immatures, 0)
+        self.year = _to_int_column(records, _get_year)
+
+        self.latitude = _to_float_column(records, lambda r: r.latitude)
+        self.longitude = _to_float_column(records, lambda r: r.longitude)
+        self.accuracy_meters = _to_float_column(records, lambda r: r.accuracy_meters)
+
+        self.country = self.Categorical([r.country for r in records])
+        self.state = self.Categorical([r.state for r in records])
+        self.county = self.Categorical([r.county for r in records])
+        self.collection = self.Categorical(  # all of a record's collections
+            [", ".join(r.collections) for r in records]
+        )
+
+    def get_filter_mask(self, record_filter: RecordFilter) -> Any:
+        """Returns a boolean array indicating the records that pass the filter."""
+        return np.fromiter(
+            (record_filter.test(record) for record in self.records),
+            dtype=bool,
+            count=len(self.records),
+        )
+
+
+def _get_year(record: SpecimenRecord) -> Optional[int]:
+    if record.date_time is None or record.date_time.start_date is None:
+        return None
+    return record.date_time.start_date.year
+
+
+def _to_float_column(
+    records: Sequence[SpecimenRecord], get_value: Callable[[SpecimenRecord], Any]
+) -> Any:
+    return np.fromiter(
+        (
+            np.nan if value is None else float(value)
+            for value in map(get_value, records)
+        ),
+        dtype=np.float64,
+        count=len(records),
+    )
+
+
+def _to_int_column(
+    records: Sequence[SpecimenRecord],
+    get_value: Callable[[SpecimenRecord], Optional[int]],
+    missing_value: int = MISSING_INT,
+) -> Any:
+    return np.fromiter(
+        (
+            missing_value if value is None else value
+            for value in map(get_value, records)
+        ),
+        dtype=np.int64,
+        count=len(records),
+    )
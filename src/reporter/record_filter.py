@@ -45,6 +45,15 @@ class CaveFamilyRecordFilter(RecordFilter):
         )
 
 
+class ChangedRecordsFilter(RecordFilter):
+    def __init__(self, record_ids: set[int]):
+        super().__init__("Records Added or Modified Since Prior Export")
+        self._record_ids = record_ids
+
+    def test(self, record: "SpecimenRecord") -> bool:
+        return record.id in self._record_ids
+
+
 class CompoundRecordFilter(RecordFilter):
     def __init__(self, record_filters: list[RecordFilter]):
         super().__init__(" & ".join([f.name for f in record_filters]))
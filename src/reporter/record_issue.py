@@ -0,0 +1,144 @@
+from __future__ import annotations
+from typing import Any, Iterable, Optional, TYPE_CHECKING
+from enum import Enum
+
+if TYPE_CHECKING:
+    from src.reporter.lat_long_record import LatLongRecord
+
+
+class IssueCode(Enum):
+    INVALID_CATALOG_NUMBER = 1
+    NOT_AN_INTEGER = 2
+    EMPTY_FIELD = 3
+    INVALID_DECIMAL = 4
+    LATITUDE_OUT_OF_RANGE = 5
+    LONGITUDE_OUT_OF_RANGE = 6
+    LATITUDE_WITHOUT_LONGITUDE = 7
+    LONGITUDE_WITHOUT_LATITUDE = 8
+    UNKNOWN_PRECISION = 9
+    ACCURACY_DISAGREES = 10
+    UNEXPECTED_SUBSPECIES = 11
+    TAXON_CONTAINS_SPACES = 12
+    SUBSPECIES_WITHOUT_SPECIES = 13
+    AUTHORS_WITHOUT_SPECIES = 14
+    NO_SPECIMEN = 15
+    ZERO_SPECIMEN_COUNT = 16
+    INVALID_SPECIMEN_COUNT = 17
+    MISSING_COUNTRY = 18
+    MISSING_STATE = 19
+    MISSING_LOCALITY = 20
+    MISSING_CORRECT_LOCALITY = 21
+    MISSING_DATE = 22  # warning
+    INVALID_DATE = 23
+    DATE_COLUMN_DISAGREES = 24
+    NO_COLLECTORS = 25  # warning
+    NAME_ERROR = 26  # in a collector or determiner
+    NAME_WARNING = 27  # warning, in a collector or determiner
+    UNEXPECTED_NUMBERS = 28  # in a determiner
+
+    def get_label(self) -> str:
+        return self.name.lower().replace("_", " ")
+
+
+# Issues with names, as the agents report lists them.
+NAME_ISSUE_CODES = {
+    IssueCode.NAME_ERROR,
+    IssueCode.NAME_WARNING,
+    IssueCode.UNEXPECTED_NUMBERS,
+}
+
+# Template of the description of each kind of issue, formatted with the issue's
+# arguments and with the name of the field having the issue as {field}.
+_TEMPLATES: dict[IssueCode, str] = {
+    IssueCode.INVALID_CATALOG_NUMBER: "invalid catalog number '{0}'",
+    IssueCode.NOT_AN_INTEGER: "{field} '{0}' is not an integer",
+    IssueCode.EMPTY_FIELD: "{field} is empty",
+    IssueCode.INVALID_DECIMAL: "{field} '{0}' is not a valid decimal",
+    IssueCode.LATITUDE_OUT_OF_RANGE: "latitude '{0}' out of range",
+    IssueCode.LONGITUDE_OUT_OF_RANGE: "longitude '{0}' out of range",
+    IssueCode.LATITUDE_WITHOUT_LONGITUDE: "latitude specified but not also longitude",
+    IssueCode.LONGITUDE_WITHOUT_LATITUDE: "longitude specified but not also latitude",
+    IssueCode.UNKNOWN_PRECISION: "unknown {field} precision {0} (< 5 digits)",
+    IssueCode.ACCURACY_DISAGREES: (
+        "coordinateUncertaintyInMeters disagrees with accuracy in microhabitat"
+    ),
+    IssueCode.UNEXPECTED_SUBSPECIES: "Expected empty subspecies",
+    IssueCode.TAXON_CONTAINS_SPACES: "taxon '{0}' contains spaces",
+    IssueCode.SUBSPECIES_WITHOUT_SPECIES: "Supspecies given without species",
+    IssueCode.AUTHORS_WITHOUT_SPECIES: "Authors given without species",
+    IssueCode.NO_SPECIMEN: "names no specimen",
+    IssueCode.ZERO_SPECIMEN_COUNT: "specimen count is 0",
+    IssueCode.INVALID_SPECIMEN_COUNT: "invalid specimen count",
+    IssueCode.MISSING_COUNTRY: "missing country",
+    IssueCode.MISSING_STATE: "missing state in {0}",
+    IssueCode.MISSING_LOCALITY: "missing locality information",
+    IssueCode.MISSING_CORRECT_LOCALITY: "Texas specimen missing a correct locality",
+    IssueCode.MISSING_DATE: "{0}",
+    IssueCode.INVALID_DATE: "{0} ({field} '{1}')",
+    IssueCode.DATE_COLUMN_DISAGREES: "{field} column {0} disagrees with parsed {1} {2}",
+    IssueCode.NO_COLLECTORS: "no collectors",
+    IssueCode.NAME_ERROR: "{0} in {field}",
+    IssueCode.NAME_WARNING: "{0} in {field}",
+    IssueCode.UNEXPECTED_NUMBERS: "unexpected number(s) {0} in {field}",
+}
+
+
+class RecordIssue:
+    """Problem or warning found with a record, kept as its kind of issue, the name
+    of the field having the issue, and the values describing the issue, and only
+    formatted into a description when printed. Issues without values are shared
+    among records."""
+
+    __slots__ = ("code", "field", "args")
+
+    _shared: dict[tuple[IssueCode, Optional[str]], RecordIssue] = {}
+
+    def __init__(self, code: IssueCode, field: Optional[str], args: tuple[Any, ...]):
+        self.code = code
+        self.field = field
+        self.args = args
+
+    @classmethod
+    def create(
+        cls, code: IssueCode, field: Optional[str], args: tuple[Any, ...]
+    ) -> RecordIssue:
+        if args:
+            return cls(code, field, args)
+        key = (code, field)
+        issue = cls._shared.get(key)
+        if issue is None:
+            issue = cls(code, field, args)
+            cls._shared[key] = issue
+        return issue
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (RecordIssue.create, (self.code, self.field, self.args))
+
+    def __repr__(self) -> str:
+        return "RecordIssue(%s, %r, %r)" % (self.code.name, self.field, self.args)
+
+    def __str__(self) -> str:
+        return _TEMPLATES[self.code].format(*self.args, field=self.field)
+
+
+class IssueIndex:
+    """Index of the IDs of the records having each kind of problem or warning,
+    so that records can be selected and counted by kind of issue without
+    examining the issues of every record."""
+
+    def __init__(self, records: Iterable[LatLongRecord]):
+        self._record_ids_by_code: dict[IssueCode, list[int]] = {}
+        for record in records:
+            codes = set(issue.code for issue in record.get_problems())
+            codes.update(issue.code for issue in record.get_warnings())
+            for code in codes:
+                self._record_ids_by_code.setdefault(code, []).append(record.id)
+
+    def get_codes(self) -> list[IssueCode]:
+        """Returns the kinds of issues that records have, in order of code."""
+        return sorted(self._record_ids_by_code.keys(), key=lambda code: code.value)
+
+    def get_record_ids(self, code: IssueCode) -> list[int]:
+        """Returns the IDs of the records having the kind of issue, in the order
+        in which the records were indexed."""
+        return self._record_ids_by_code.get(code, [])
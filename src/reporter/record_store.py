@@ -0,0 +1,355 @@
+from __future__ import annotations
+from typing import Any, Optional, Sequence, TYPE_CHECKING
+import sqlite3
+import sys
+import time
+
+import src.util.args as args
+
+if TYPE_CHECKING:
+    from src.lib.identity import Identity
+    from src.reporter.coordinate import Coordinate
+    from src.reporter.james_table import JamesTable
+    from src.reporter.specimen_record import SpecimenRecord
+
+# Store of the parsed and name-revised records in a SQLite database, normalized
+# into records, taxa, localities, identities, and the links of records to their
+# collectors and determiners, so that ad-hoc questions can be answered by indexed
+# queries rather than by reloading the CSV file.
+
+BATCH_RECORD_COUNT = 5000  # number of records inserted per transaction
+
+SCHEMA = """
+DROP TABLE IF EXISTS record_determiners;
+DROP TABLE IF EXISTS record_collectors;
+DROP TABLE IF EXISTS records;
+DROP TABLE IF EXISTS identities;
+DROP TABLE IF EXISTS localities;
+DROP TABLE IF EXISTS taxa;
+
+CREATE TABLE taxa (
+    id INTEGER PRIMARY KEY,
+    taxon_unique TEXT NOT NULL,
+    phylum TEXT,
+    class TEXT,
+    subclass TEXT,
+    "order" TEXT,
+    suborder TEXT,
+    infraorder TEXT,
+    family TEXT,
+    subfamily TEXT,
+    genus TEXT,
+    subgenus TEXT,
+    species TEXT,
+    subspecies TEXT,
+    authors TEXT
+);
+CREATE TABLE localities (
+    id INTEGER PRIMARY KEY,
+    continent TEXT,
+    country TEXT,
+    state TEXT,
+    county TEXT,
+    locality TEXT
+);
+CREATE TABLE identities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL, -- primary name, last name first
+    last_name TEXT NOT NULL,
+    initial_names TEXT,
+    name_suffix TEXT
+);
+CREATE TABLE records (
+    id INTEGER PRIMARY KEY,
+    catalog_number INTEGER,
+    taxon_id INTEGER NOT NULL REFERENCES taxa(id),
+    locality_id INTEGER NOT NULL REFERENCES localities(id),
+    locality_on_label TEXT,
+    latitude REAL,
+    longitude REAL,
+    accuracy_meters INTEGER,
+    owner TEXT,
+    microhabitat TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    date_on_label TEXT,
+    type_status TEXT,
+    determination_year INTEGER,
+    collections TEXT,
+    specimen_count INTEGER NOT NULL,
+    females INTEGER,
+    males INTEGER,
+    immatures INTEGER,
+    notes TEXT
+);
+CREATE TABLE record_collectors (
+    record_id INTEGER NOT NULL REFERENCES records(id),
+    position INTEGER NOT NULL,
+    identity_id INTEGER NOT NULL REFERENCES identities(id),
+    PRIMARY KEY (record_id, position)
+) WITHOUT ROWID;
+CREATE TABLE record_determiners (
+    record_id INTEGER NOT NULL REFERENCES records(id),
+    position INTEGER NOT NULL,
+    identity_id INTEGER NOT NULL REFERENCES identities(id),
+    PRIMARY KEY (record_id, position)
+) WITHOUT ROWID;
+"""
+
+# Indexes are created after the rows are inserted, which is faster than
+# maintaining them during the inserts.
+INDEXES = """
+CREATE INDEX records_catalog_number ON records(catalog_number);
+CREATE INDEX records_taxon_id ON records(taxon_id);
+CREATE INDEX records_locality_id ON records(locality_id);
+CREATE INDEX taxa_taxon_unique ON taxa(taxon_unique);
+CREATE INDEX localities_county ON localities(county);
+CREATE INDEX localities_locality ON localities(locality);
+CREATE UNIQUE INDEX identities_name ON identities(name);
+CREATE INDEX record_collectors_identity_id ON record_collectors(identity_id);
+CREATE INDEX record_determiners_identity_id ON record_determiners(identity_id);
+"""
+
+# fmt: off
+USAGE = (
+    "Writes the parsed records, with revised names, to a SQLite database.\n"
+    "  args: <specimen_csv> <sqlite-file>\n"
+    "\n"
+    "<specimen_csv> is the path to a CSV file of specimens\n"
+    "<sqlite-file> is the database file to write, replacing any prior tables\n"
+)
+# fmt: on
+
+
+class RecordStore:
+    """SQLite database of records, written from a table whose names have been
+    revised and thereafter queried with SQL. Each distinct taxonomic classification,
+    locality, and primary identity is stored once and referenced by the records."""
+
+    def __init__(self, db_filename: str):
+        self._connection = sqlite3.connect(db_filename)
+        self._connection.row_factory = sqlite3.Row
+        self._taxon_ids: dict[tuple[Optional[str], ...], int] = {}
+        self._locality_ids: dict[tuple[Optional[str], ...], int] = {}
+        self._identity_ids: dict[str, int] = {}
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def query(self, sql: str, parameters: Sequence[Any] = ()) -> list[sqlite3.Row]:
+        """Returns the rows that the SQL query selects."""
+        return self._connection.execute(sql, parameters).fetchall()
+
+    def write_table(self, table: JamesTable) -> None:
+        """Replaces the stored records with those of the table, inserting them in
+        batches of BATCH_RECORD_COUNT records per transaction."""
+
+        self._connection.executescript(SCHEMA)
+        self._taxon_ids = {}
+        self._locality_ids = {}
+        self._identity_ids = {}
+        for start in range(0, len(table.records), BATCH_RECORD_COUNT):
+            self._insert_records(table.records[start : start + BATCH_RECORD_COUNT])
+        self._connection.executescript(INDEXES)
+
+    def _insert_records(self, records: list[SpecimenRecord]) -> None:
+        taxon_rows: list[tuple[Any, ...]] = []
+        locality_rows: list[tuple[Any, ...]] = []
+        identity_rows: list[tuple[Any, ...]] = []
+        record_rows: list[tuple[Any, ...]] = []
+        collector_rows: list[tuple[int, int, int]] = []
+        determiner_rows: list[tuple[int, int, int]] = []
+
+        for record in records:
+            taxon_id = self._get_id(
+                self._taxon_ids,
+                (
+                    record.taxon_unique,
+                    record.phylum,
+                    record.class_,
+                    record.subclass,
+                    record.order,
+                    record.suborder,
+                    record.infraorder,
+                    record.family,
+                    record.subfamily,
+                    record.genus,
+                    record.subgenus,
+                    record.species,
+                    record.subspecies,
+                    record.authors,
+                ),
+                taxon_rows,
+            )
+            locality_id = self._get_id(
+                self._locality_ids,
+                (
+                    record.continent,
+                    record.country,
+                    record.state,
+                    record.county,
+                    record.locality_correct,
+                ),
+                locality_rows,
+            )
+            start_date = end_date = None
+            if record.date_time is not None:
+                if record.date_time.start_date is not None:
+                    start_date = record.date_time.start_date.normalize()
+                if record.date_time.end_date is not None:
+                    end_date = record.date_time.end_date.normalize()
+            record_rows.append(
+                (
+                    record.id,
+                    record.catalog_number,
+                    taxon_id,
+                    locality_id,
+                    record.locality_on_label,
+                    _to_float(record.latitude),
+                    _to_float(record.longitude),
+                    record.accuracy_meters,
+                    record.owner,
+                    record.microhabitat,
+                    start_date,
+                    end_date,
+                    record.raw_date_time,
+                    record.type_status,
+                    _to_int(record.identifier_year.year),
+                    ", ".join(record.collections),
+                    record.specimen_count,
+                    record.females,
+                    record.males,
+                    record.immatures,
+                    record.misc_notes,
+                )
+            )
+            self._add_links(record.id, record.collectors, identity_rows, collector_rows)
+            self._add_links(
+                record.id,
+                record.identifier_year.determiners,
+                identity_rows,
+                determiner_rows,
+            )
+
+        with self._connection:  # commits the batch as one transaction
+            self._insert("taxa", taxon_rows)
+            self._insert("localities", locality_rows)
+            self._insert("identities", identity_rows)
+            self._insert("records", record_rows)
+            self._insert("record_collectors", collector_rows)
+            self._insert("record_determiners", determiner_rows)
+
+    def _add_links(
+        self,
+        record_id: int,
+        identities: Optional[list[Identity]],
+        identity_rows: list[tuple[Any, ...]],
+        link_rows: list[tuple[int, int, int]],
+    ) -> None:
+        if identities is None:
+            return
+        for position, identity in enumerate(identities):
+            primary = identity.get_master_copy().primary
+            assert primary is not None, "No primary for '%s'" % str(identity)
+            name = identity.get_lnf_primary()
+            identity_id = self._identity_ids.get(name)
+            if identity_id is None:
+                identity_id = len(self._identity_ids) + 1
+                self._identity_ids[name] = identity_id
+                identity_rows.append(
+                    (
+                        identity_id,
+                        name,
+                        primary.last_name,
+                        primary.initial_names,
+                        primary.name_suffix,
+                    )
+                )
+            link_rows.append((record_id, position, identity_id))
+
+    def _get_id(
+        self,
+        ids: dict[tuple[Optional[str], ...], int],
+        values: tuple[Optional[str], ...],
+        new_rows: list[tuple[Any, ...]],
+    ) -> int:
+        # Returns the ID of the row of the values, adding a row if there is none.
+        id = ids.get(values)
+        if id is None:
+            id = len(ids) + 1
+            ids[values] = id
+            new_rows.append((id,) + values)
+        return id
+
+    def _insert(self, table_name: str, rows: Sequence[tuple[Any, ...]]) -> None:
+        if rows:
+            self._connection.executemany(
+                "INSERT INTO %s VALUES (%s)"
+                % (table_name, ", ".join(["?"] * len(rows[0]))),
+                rows,
+            )
+
+
+class _StoreWriter:
+    """Main program for writing the records to a SQLite database."""
+
+    def __init__(self):
+        self._specimen_csv_file = "unspecified"
+        self._db_file = "unspecified"
+
+    def main(self) -> None:
+        options: args.OptionsDict = {
+            0: self._parse_specimen_csv,
+            1: self._parse_db_file,
+            None: self._parse_no_arguments,
+        }
+        try:
+            args.parse_args(options)
+        except args.ArgException as e:
+            if e.message:
+                print(e.message)
+            print()
+            print(USAGE)
+            sys.exit(2)
+
+        # imported here, as only importable when run as a script
+        from main import Norm
+        from record_filter import AllRecordsFilter
+
+        start_time = time.perf_counter()
+        norm = Norm()
+        norm.parse_args(["main.py", self._specimen_csv_file])
+        table = norm.load_table()
+        table.summarize(AllRecordsFilter())
+        table.revise_names(unify_names_by_sound=True, merge_with_reference_names=True)
+        print("Loaded the table in %.1f seconds" % (time.perf_counter() - start_time))
+
+        start_time = time.perf_counter()
+        store = RecordStore(self._db_file)
+        store.write_table(table)
+        store.close()
+        print(
+            "Wrote %d records to %s in %.1f seconds"
+            % (len(table.records), self._db_file, time.perf_counter() - start_time)
+        )
+
+    def _parse_specimen_csv(self, arg: str) -> None:
+        self._specimen_csv_file = args.expand_filename(arg)
+
+    def _parse_db_file(self, arg: str) -> None:
+        self._db_file = args.expand_filename(arg)
+
+    def _parse_no_arguments(self, _arg: str) -> None:
+        raise args.ArgException()
+
+
+def _to_float(value: Optional[Coordinate]) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+if __name__ == "__main__":
+    _StoreWriter().main()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+import json
+import os
+import socket
+import sys
+
+# Thin replacement for running main.py, which asks a running report daemon to
+# produce the report and streams it to stdout. Takes the same arguments as
+# main.py. When no daemon is listening, runs the report in this process.
+
+# The socket is kept in a directory private to the user, as the daemon serves
+# anyone able to connect, in the directory of their choosing.
+DEFAULT_SOCKET_PATH = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or os.path.expanduser("~/.cache"),
+    "norm-reports",
+    "reports.sock",
+)
+
+
+def request_report(argv: list[str], socket_path: str = DEFAULT_SOCKET_PATH) -> bool:
+    """Asks the daemon for the report that the arguments request, writing it to
+    stdout. Returns False if no daemon is listening on the socket."""
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        client.close()
+        return False
+    with client:
+        request = {"cwd": os.getcwd(), "args": argv}
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile("r", encoding="utf-8") as response:
+            while True:
+                text = response.read(1 << 16)
+                if not text:
+                    break
+                sys.stdout.write(text)
+    sys.stdout.flush()
+    return True
+
+
+if __name__ == "__main__":
+    if not request_report(sys.argv):
+        print("(no report daemon running; loading the table here)", file=sys.stderr)
+        from main import Norm
+
+        Norm().main()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+from typing import Optional
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import traceback
+
+import src.util.args as args
+from src.util.report_writer import StreamReportWriter
+from james_table import JamesTable
+from main import Norm
+from report_client import DEFAULT_SOCKET_PATH
+
+# Daemon that keeps the loaded table in memory between report requests, so that
+# repeated reports don't each re-parse the specimens and re-consolidate names.
+# Run it with an optional socket path, then request reports with report_client.py.
+
+
+class ReportDaemon:
+    """Serves report requests on a Unix socket, one request at a time. Each request
+    is a JSON line giving the client's working directory and its main.py arguments.
+    The table is reloaded when its source files change, re-parsing only the names
+    when only the declared or reference names have changed. Only the user running
+    the daemon may connect: the socket is readable and writable only by the user,
+    and where the system reports the peer's user, other users are refused."""
+
+    def __init__(self, socket_path: str):
+        self._socket_path = socket_path
+        self._table: Optional[JamesTable] = None
+        self._source_files: list[str] = []
+        self._source_mtimes: list[Optional[float]] = []
+
+    def serve(self) -> None:
+        self._remove_stale_socket()
+        os.makedirs(os.path.dirname(self._socket_path), mode=0o700, exist_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        prior_umask = os.umask(0o177)  # create the socket as 0600
+        try:
+            server.bind(self._socket_path)
+        finally:
+            os.umask(prior_umask)
+        os.chmod(self._socket_path, 0o600)
+        server.listen()
+        print("Serving reports on %s" % self._socket_path)
+        try:
+            while True:
+                connection, _ = server.accept()
+                with connection:
+                    if _is_own_peer(connection):
+                        self._serve_request(connection)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            os.remove(self._socket_path)
+
+    def _remove_stale_socket(self) -> None:
+        # Removes the socket left by a prior daemon, exiting if the file is not a
+        # socket or belongs to another user, whose daemon this would take over.
+        try:
+            status = os.lstat(self._socket_path)
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(status.st_mode):
+            sys.exit("%s exists and is not a socket" % self._socket_path)
+        if status.st_uid != os.getuid():
+            sys.exit("%s belongs to another user" % self._socket_path)
+        os.remove(self._socket_path)
+
+    def _serve_request(self, connection: socket.socket) -> None:
+        with connection.makefile("r", encoding="utf-8") as request_file:
+            request = json.loads(request_file.readline())
+        with connection.makefile("w", encoding="utf-8") as response_file:
+            out = StreamReportWriter(response_file)
+            norm = Norm()
+            try:
+                os.chdir(request["cwd"])
+                norm.parse_args(request["args"])
+                if norm.is_watching():
+                    raise args.ArgException("The report daemon can't watch (-w)")
+                if norm.is_streaming():
+                    table = norm.load_table()
+                else:
+                    table = self._get_table(norm)
+                norm.show_report(table, out)
+            except args.ArgException as e:
+                norm.print_usage(e, out)
+            except Exception:
+                # The table may have been left partially revised.
+                self._table = None
+                print(traceback.format_exc(), file=out)
+            try:
+                out.flush()
+            except BrokenPipeError:
+                pass  # client went away
+
+    def _get_table(self, norm: Norm) -> JamesTable:
+        source_files = [os.path.abspath(f) for f in norm.get_source_files()]
+        source_mtimes = [_get_mtime(f) for f in source_files]
+
+        if self._table is not None and source_files == self._source_files:
+            changed = [
+                i
+                for i, mtime in enumerate(source_mtimes)
+                if mtime != self._source_mtimes[i]
+            ]
+            if changed and min(changed) >= 2:
+                # Only the declared or reference names changed.
+                print("Reloading names...")
+                self._table.reload_names(norm.load_declared_names())
+            elif changed:
+                self._table = None
+        else:
+            self._table = None
+
+        if self._table is None:
+            print("Loading %s..." % source_files[0])
+            self._table = norm.load_table()
+        self._source_files = source_files
+        self._source_mtimes = source_mtimes
+        return self._table
+
+
+def _is_own_peer(connection: socket.socket) -> bool:
+    # Returns whether the connected process runs as this process' user, assuming
+    # so where the system doesn't report the peer's credentials.
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    credentials = struct.Struct("3i")  # pid, uid, gid
+    _, uid, _ = credentials.unpack(
+        connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, credentials.size)
+    )
+    return uid == os.getuid()
+
+
+def _get_mtime(file_path: str) -> Optional[float]:
+    try:
+        return os.stat(file_path).st_mtime
+    except FileNotFoundError:
+        return None
+
+
+if __name__ == "__main__":
+    ReportDaemon(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SOCKET_PATH).serve()
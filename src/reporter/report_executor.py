@@ -0,0 +1,220 @@
+from __future__ import annotations
+from typing import Callable, Optional
+import os
+import sys
+import tempfile
+import time
+import traceback
+
+import src.util.args as args
+from src.util.report_writer import MemoryReportWriter, StreamReportWriter
+from james_table import JamesTable
+from main import Norm, REPORT_CLASSES
+from record_filter import AllRecordsFilter
+
+# Executor that loads the specimen table and revises its names once, and then
+# generates each requested report into its own file in a forked process.
+
+# fmt: off
+USAGE = (
+    "Generates reports in parallel from a single load of the specimen table.\n"
+    "  args: [-j=<processes>] [-r=<report-codes>] <specimen_csv> <output-dir>\n"
+    "\n"
+    "-j=<processes> maximum number of reports to generate at once\n"
+        "(default the number of CPUs)\n"
+    "-r=<report-codes> comma-delimited codes of the reports to generate\n"
+        "(default all but E), each into '<output-dir>/<code>.txt'\n"
+    "<specimen_csv> is the path to a CSV file of specimens\n"
+    "<output-dir> is the directory into which to generate the reports\n"
+)
+# fmt: on
+
+
+class ReportJob:
+    """A report to generate, given the main.py arguments that select the report
+    and its filters, along with the outcome of generating it. The report is either
+    written to the output file or, given a function for checking it, generated in
+    memory and passed to the function, which returns a description of any way in
+    which the report fails the check, failing the job."""
+
+    def __init__(
+        self,
+        output_file: Optional[str],
+        report_args: list[str],
+        check_report: Optional[Callable[[str], Optional[str]]] = None,
+    ):
+        assert (output_file is None) != (check_report is None)
+        self.output_file = output_file
+        self.report_args = report_args
+        self.check_report = check_report
+        self.exit_status: Optional[int] = None  # None if not run
+        self.seconds = 0.0
+        self.error: Optional[str] = None  # traceback or check failure
+
+    def succeeded(self) -> bool:
+        return self.exit_status == 0
+
+
+class ReportExecutor:
+    """Generates reports from a table loaded once, each report in its own forked
+    process, running at most a given number of processes at once. The processes
+    share the loaded table copy-on-write, so the names are revised before forking
+    rather than once per report."""
+
+    def __init__(self, specimen_csv_file: str, process_count: int):
+        self._specimen_csv_file = specimen_csv_file
+        self._process_count = process_count
+        self._table: Optional[JamesTable] = None
+
+    def load_table(self) -> None:
+        norm = Norm()
+        norm.parse_args(["main.py", self._specimen_csv_file])
+        self._table = norm.load_table()
+        self._table.summarize(AllRecordsFilter())
+        self._table.revise_names(
+            unify_names_by_sound=True, merge_with_reference_names=True
+        )
+
+    def run(self, jobs: list[ReportJob], stop_at_failure: bool = False) -> None:
+        """Generates the reports of the jobs in order, recording the exit status,
+        duration, and any error of each job, loading the table first if not already
+        loaded. When stopping at failure, no further jobs are started once a job
+        fails, leaving them without an exit status, though the jobs already running
+        are allowed to finish."""
+
+        if self._table is None:
+            self.load_table()
+        pending_jobs = list(reversed(jobs))
+        running_jobs: dict[int, tuple[ReportJob, str, float]] = {}
+        with tempfile.TemporaryDirectory() as error_dir:
+            while pending_jobs or running_jobs:
+                while pending_jobs and len(running_jobs) < self._process_count:
+                    job = pending_jobs.pop()
+                    error_file = os.path.join(error_dir, "%d.error" % len(pending_jobs))
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    pid = os.fork()
+                    if pid == 0:
+                        exit_status = self._run_job(job, error_file)
+                        sys.stdout.flush()
+                        os._exit(exit_status)
+                    running_jobs[pid] = (job, error_file, time.perf_counter())
+                pid, wait_status = os.wait()
+                job, error_file, start_time = running_jobs.pop(pid)
+                job.seconds = time.perf_counter() - start_time
+                job.exit_status = os.waitstatus_to_exitcode(wait_status)
+                job.error = _read_error(error_file)
+                if not job.succeeded():
+                    if job.error is None:
+                        job.error = "Exited with status %d" % job.exit_status
+                    if stop_at_failure:
+                        pending_jobs = []
+
+    def _run_job(self, job: ReportJob, error_file: str) -> int:
+        # Runs in the forked process, returning the process' exit status. A failed
+        # report leaves its traceback or check failure in the error file for the
+        # parent process to collect.
+
+        assert self._table is not None
+        try:
+            norm = Norm()
+            if job.check_report is None:
+                assert job.output_file is not None
+                norm.parse_args(
+                    ["main.py", self._specimen_csv_file, "-o=" + job.output_file]
+                    + job.report_args
+                )
+                norm.show_report(self._table, StreamReportWriter(sys.stdout))
+                return 0
+            norm.parse_args(["main.py", self._specimen_csv_file] + job.report_args)
+            out = MemoryReportWriter()
+            norm.create_report(self._table).write_to(out)
+            failure = job.check_report(out.get_text())
+        except BaseException:
+            failure = traceback.format_exc()
+        if failure is None:
+            return 0
+        with open(error_file, "w", encoding="utf-8") as file:
+            file.write(failure)
+        return 1
+
+
+class _ReportRunner:
+    """Main program for generating reports in parallel."""
+
+    def __init__(self):
+        self._specimen_csv_file = "unspecified"
+        self._output_dir = "unspecified"
+        self._process_count = os.cpu_count() or 1
+        self._report_codes = [code for code in REPORT_CLASSES if code != "E"]
+
+    def main(self) -> None:
+        options: args.OptionsDict = {
+            "-j": self._parse_process_count,
+            "-r": self._parse_report_codes,
+            0: self._parse_specimen_csv,
+            1: self._parse_output_dir,
+            None: self._parse_no_arguments,
+        }
+        try:
+            args.parse_args(options)
+            for code in self._report_codes:
+                if code not in REPORT_CLASSES:
+                    raise args.ArgException("Unrecognized report type '%s'" % code)
+        except args.ArgException as e:
+            if e.message:
+                print(e.message)
+            print()
+            print(USAGE)
+            sys.exit(2)
+
+        start_time = time.perf_counter()
+        executor = ReportExecutor(self._specimen_csv_file, self._process_count)
+        executor.load_table()
+        print("Loaded the table in %.1f seconds" % (time.perf_counter() - start_time))
+        os.makedirs(self._output_dir, exist_ok=True)
+        jobs = [
+            ReportJob(os.path.join(self._output_dir, "%s.txt" % code), ["-r" + code])
+            for code in self._report_codes
+        ]
+        executor.run(jobs)
+
+        for code, job in zip(self._report_codes, jobs):
+            outcome = "generated" if job.succeeded() else "FAILED"
+            print("%-3s %8.1f s  %s %s" % (code, job.seconds, outcome, job.output_file))
+            if job.error is not None:
+                print(job.error)
+        print("Finished in %.1f seconds" % (time.perf_counter() - start_time))
+        sys.exit(0 if all(job.succeeded() for job in jobs) else 1)
+
+    def _parse_process_count(self, arg: str) -> None:
+        try:
+            self._process_count = int(arg)
+        except ValueError:
+            raise args.ArgException("-j requires a number of processes")
+        if self._process_count < 1:
+            raise args.ArgException("-j requires at least one process")
+
+    def _parse_report_codes(self, arg: str) -> None:
+        self._report_codes = [code.strip().upper() for code in arg.split(",")]
+
+    def _parse_specimen_csv(self, arg: str) -> None:
+        self._specimen_csv_file = args.expand_filename(arg)
+
+    def _parse_output_dir(self, arg: str) -> None:
+        self._output_dir = args.expand_filename(arg)
+
+    def _parse_no_arguments(self, _arg: str) -> None:
+        raise args.ArgException()
+
+
+def _read_error(error_file: str) -> Optional[str]:
+    try:
+        with open(error_file, "r", encoding="utf-8") as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
+
+
+if __name__ == "__main__":
+    _ReportRunner().main()
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from src.lib.declared_names_table import DeclaredNamesTable
+from src.util.report_writer import ReportWriter
 
 if TYPE_CHECKING:
     from src.reporter.james_table import *
@@ -26,9 +27,9 @@ class AgentsReport(Report):
 
     def show(self) -> None:
         self._print_filter_title()
-        print("\n---- collectors & determiners ----\n")
+        print("\n---- collectors & determiners ----\n", file=self.out)
 
-        print("(based on an analysis of all names in the spreadsheet)\n")
+        print("(based on an analysis of all names in the spreadsheet)\n", file=self.out)
 
         includes_synonym = False
         includes_raw_name = False
@@ -50,7 +51,8 @@ class AgentsReport(Report):
 
             # Print the variants and corrections for the primary name.
 
-            variant_identities.sort(key=lambda p: str(p))
+            # Sort a copy, as the catalog's lists keep the primary first.
+            variant_identities = sorted(variant_identities, key=lambda p: str(p))
             variant_lines: list[tuple[str, list[str]]] = []
             for identity in variant_identities:
                 identity_name = str(identity)
@@ -118,49 +120,60 @@ class AgentsReport(Report):
             # Print the collected variants for the filter-selected primaries.
 
             if show_this_primary:
-                _print_name(primary_name, self._get_name_notes(primary))
+                _print_name(self.out, primary_name, self._get_name_notes(primary))
                 for variant_line in variant_lines:
-                    _print_name(variant_line[0], variant_line[1])
+                    _print_name(self.out, variant_line[0], variant_line[1])
 
         # Print the legend.
 
-        print()
+        print(file=self.out)
         if includes_synonym:
-            print("- indictates a synonymous variant of the primary name")
+            print(
+                "- indictates a synonymous variant of the primary name", file=self.out
+            )
         if includes_raw_name:
-            print("[name] indicates raw source text, though shown space-normalized")
+            print(
+                "[name] indicates raw source text, though shown space-normalized",
+                file=self.out,
+            )
 
         # List names from data that failed to parse.
 
-        print("\n==== Errors Parsing Names in Cave Collection ====\n")
+        print("\n==== Errors Parsing Names in Cave Collection ====\n", file=self.out)
 
         problem_record_count = 0
         for record in self._filtered_records():
-            if record.print_name_problems():
+            if record.print_name_problems(self.out):
                 problem_record_count += 1
         if problem_record_count == 0:
-            print("No name parsing errors found.\n")
+            print("No name parsing errors found.\n", file=self.out)
         else:
-            print("\n  Found name parsing errors in %d records" % problem_record_count)
+            print(
+                "\n  Found name parsing errors in %d records" % problem_record_count,
+                file=self.out,
+            )
 
-        print("\n==== Warnings Parsing Names in Cave Collection ====\n")
+        print("\n==== Warnings Parsing Names in Cave Collection ====\n", file=self.out)
 
         problem_record_count = 0
         for record in self._filtered_records():
-            if record.print_name_warnings():
+            if record.print_name_warnings(self.out):
                 problem_record_count += 1
         if problem_record_count == 0:
-            print("No name parsing warnings found.\n")
+            print("No name parsing warnings found.\n", file=self.out)
         else:
             print(
-                "\n  Found name parsing warnings in %d records" % problem_record_count
+                "\n  Found name parsing warnings in %d records" % problem_record_count,
+                file=self.out,
             )
 
         # List reference names that failed to parse.
 
         bad_names = self._declared_names_table.get_bad_reference_names()
         if bad_names:
-            print("\n---- Names from Specify that failed to parse ----\n")
+            print(
+                "\n---- Names from Specify that failed to parse ----\n", file=self.out
+            )
             self._print_columns(bad_names)
 
     def _get_name_notes(self, identity: Identity) -> list[str]:
@@ -184,8 +197,8 @@ class AgentsReport(Report):
         return notes
 
 
-def _print_name(name_text: str, notes: list[str]) -> None:
+def _print_name(out: ReportWriter, name_text: str, notes: list[str]) -> None:
     if notes:
-        print(name_text.ljust(24, " "), "(%s)" % "; ".join(notes))
+        print(name_text.ljust(24, " "), "(%s)" % "; ".join(notes), file=out)
     else:
-        print(name_text)
+        print(name_text, file=out)
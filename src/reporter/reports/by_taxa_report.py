@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.reporter.james_table import *
@@ -55,9 +55,10 @@ class ByTaxaReport(Report):
                     indent_level * self.INDENT_SPACES,
                     "" if rank == "species" else rank.capitalize() + " ",
                     taxon,
-                )
+                ),
+                file=self.out,
             )
-        print()
+        print(file=self.out)
 
         entries: list[str] = []
         for record in record_group:
@@ -71,16 +72,21 @@ class ByTaxaReport(Report):
             )
         self._print_columns(entries)
 
-    def _print_taxon_groups(self, records: list[SpecimenRecord]) -> None:
+    def _print_taxon_groups(self, taxon_groups: Iterable[TaxonGroup]) -> None:
 
-        print("(Lists show catalog numbers with record IDs in parentheses and")
-        print(" the first four letters of collection names after the slash.)")
+        print(
+            "(Lists show catalog numbers with record IDs in parentheses and",
+            file=self.out,
+        )
+        print(
+            " the first four letters of collection names after the slash.)",
+            file=self.out,
+        )
 
-        iterator = TaxaIterator(records)
         first_group = False
-        for taxon_group in iterator:
+        for taxon_group in taxon_groups:
             if first_group:
                 first_group = False
             else:
-                print("\n--------")
+                print("\n--------", file=self.out)
             self._print_taxon_group(taxon_group)
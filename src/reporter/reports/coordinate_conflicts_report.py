@@ -0,0 +1,215 @@
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+from src.util.spatial_grid import SpatialGrid, get_distance_meters
+from src.reporter.coordinate import Coordinate
+
+if TYPE_CHECKING:
+    from src.reporter.james_table import *
+from src.reporter.record_filter import RecordFilter
+
+from src.reporter.reports.report import Report
+
+CLUSTER_METERS = 500  # max distance between coordinates of the same site
+NEAR_METERS = 30  # max distance between coordinates deemed the same place
+
+_LatLong = tuple[Coordinate, Coordinate]
+_LocalityKey = tuple[Optional[str], Optional[str], Optional[str], str]
+
+
+class CoordinateConflictsReport(Report):
+    """Reports the localities whose records carry coordinates that are far apart,
+    and the different localities whose records carry nearly the same coordinates.
+    The coordinates of each locality are clustered, taking coordinates within
+    CLUSTER_METERS of each other to be the same site, and coordinates outside the
+    cluster of the most records are reported as outliers. Coordinates within
+    NEAR_METERS of each other at different localities are reported as possible
+    duplicate localities. Nearby coordinates are found with a spatial grid."""
+
+    class Locality:
+        def __init__(self, key: _LocalityKey):
+            self.key = key
+            self.records_by_coordinate: dict[_LatLong, list[SpecimenRecord]] = {}
+
+        def get_name(self) -> str:
+            return ", ".join(term for term in self.key if term is not None)
+
+    def __init__(
+        self,
+        table: JamesTable,
+        record_filter: RecordFilter,
+    ):
+        super().__init__(table, record_filter)
+
+    def show(self) -> None:
+        localities: dict[_LocalityKey, CoordinateConflictsReport.Locality] = {}
+        for record in self._filtered_records():
+            if (
+                record.latitude is None
+                or record.longitude is None
+                or record.locality_correct is None
+            ):
+                continue
+            key = (
+                record.country,
+                record.state,
+                record.county,
+                record.locality_correct,
+            )
+            locality = localities.get(key)
+            if locality is None:
+                locality = self.Locality(key)
+                localities[key] = locality
+            locality.records_by_coordinate.setdefault(
+                (record.latitude, record.longitude), []
+            ).append(record)
+        sorted_localities = sorted(
+            localities.values(), key=lambda locality: _to_sort_key(locality.key)
+        )
+
+        self._print_filter_title()
+        print(
+            "\nLocalities having coordinates more than %d m from the locality's"
+            " main site:\n" % CLUSTER_METERS,
+            file=self.out,
+        )
+        for locality in sorted_localities:
+            self._show_outliers(locality)
+        print(
+            "\nDifferent localities having coordinates within %d m of each other:\n"
+            % NEAR_METERS,
+            file=self.out,
+        )
+        self._show_near_duplicates(sorted_localities)
+
+    def _show_outliers(self, locality: CoordinateConflictsReport.Locality) -> None:
+        records_by_coordinate = locality.records_by_coordinate
+        if len(records_by_coordinate) < 2:
+            return
+
+        # Cluster the coordinates by joining the clusters of each nearby pair,
+        # identifying each cluster by the index of its first coordinate.
+        coordinates = sorted(records_by_coordinate.keys())
+        clusters = list(range(len(coordinates)))
+        grid = SpatialGrid(
+            [(float(c[0]), float(c[1]), i) for i, c in enumerate(coordinates)],
+            CLUSTER_METERS,
+        )
+        for i1, i2, _ in grid.iter_pairs():
+            cluster1 = _find_cluster(clusters, i1)
+            cluster2 = _find_cluster(clusters, i2)
+            clusters[max(cluster1, cluster2)] = min(cluster1, cluster2)
+        record_counts: dict[int, int] = {}
+        for i, coordinate in enumerate(coordinates):
+            cluster = _find_cluster(clusters, i)
+            clusters[i] = cluster
+            record_counts[cluster] = record_counts.get(cluster, 0) + len(
+                records_by_coordinate[coordinate]
+            )
+        if len(record_counts) < 2:
+            return
+
+        main_cluster = max(record_counts, key=lambda cluster: record_counts[cluster])
+        main_coordinates = [
+            c for i, c in enumerate(coordinates) if clusters[i] == main_cluster
+        ]
+        site = max(main_coordinates, key=lambda c: len(records_by_coordinate[c]))
+        print(
+            "%s: main site %s, %s (%s)"
+            % (
+                locality.get_name(),
+                site[0],
+                site[1],
+                _to_record_count(record_counts[main_cluster]),
+            ),
+            file=self.out,
+        )
+        for i, coordinate in enumerate(coordinates):
+            if clusters[i] == main_cluster:
+                continue
+            meters = get_distance_meters(
+                float(site[0]),
+                float(site[1]),
+                float(coordinate[0]),
+                float(coordinate[1]),
+            )
+            self._print_segments(
+                [
+                    _to_record_label(record)
+                    for record in records_by_coordinate[coordinate]
+                ],
+                "  %s, %s is %s away: "
+                % (coordinate[0], coordinate[1], _to_distance(meters)),
+                "    ",
+            )
+        print(file=self.out)
+
+    def _show_near_duplicates(
+        self, localities: list[CoordinateConflictsReport.Locality]
+    ) -> None:
+        points: list[tuple[float, float, tuple[int, _LatLong]]] = []
+        for i, locality in enumerate(localities):
+            for coordinate in locality.records_by_coordinate:
+                points.append(
+                    (float(coordinate[0]), float(coordinate[1]), (i, coordinate))
+                )
+
+        # Keep the nearest pair of coordinates of each pair of localities.
+        nearest: dict[tuple[int, int], tuple[float, _LatLong, _LatLong]] = {}
+        for (i1, coordinate1), (i2, coordinate2), meters in SpatialGrid(
+            points, NEAR_METERS
+        ).iter_pairs():
+            if i1 == i2:
+                continue
+            if i1 > i2:
+                i1, i2 = i2, i1
+                coordinate1, coordinate2 = coordinate2, coordinate1
+            pair = nearest.get((i1, i2))
+            if pair is None or meters < pair[0]:
+                nearest[(i1, i2)] = (meters, coordinate1, coordinate2)
+
+        for (i1, i2), (meters, coordinate1, coordinate2) in sorted(nearest.items()):
+            locality1 = localities[i1]
+            locality2 = localities[i2]
+            print("%s apart:" % _to_distance(meters), file=self.out)
+            for locality, coordinate in (
+                (locality1, coordinate1),
+                (locality2, coordinate2),
+            ):
+                print(
+                    "  %s, %s at %s (%s)"
+                    % (
+                        coordinate[0],
+                        coordinate[1],
+                        locality.get_name(),
+                        _to_record_count(
+                            len(locality.records_by_coordinate[coordinate])
+                        ),
+                    ),
+                    file=self.out,
+                )
+
+
+def _find_cluster(clusters: list[int], index: int) -> int:
+    while clusters[index] != index:
+        index = clusters[index]
+    return index
+
+
+def _to_distance(meters: float) -> str:
+    if meters < 1000:
+        return "%d m" % round(meters)
+    return "%.1f km" % (meters / 1000)
+
+
+def _to_record_count(count: int) -> str:
+    return "1 record" if count == 1 else "%d records" % count
+
+
+def _to_record_label(record: SpecimenRecord) -> str:
+    if record.catalog_number is None:
+        return "ID %d" % record.id
+    return "#%d" % record.catalog_number
+
+
+def _to_sort_key(key: _LocalityKey) -> tuple[str, ...]:
+    return tuple("" if term is None else term.lower() for term in key)
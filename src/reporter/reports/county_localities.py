@@ -23,11 +23,11 @@ class CountyLocalitiesReport(Report):
         counties.sort(key=lambda county: "" if county is None else county)
         for county in counties:
             if county is None:
-                print("(no county):")
+                print("(no county):", file=self.out)
             else:
-                print(county + " County:")
+                print(county + " County:", file=self.out)
             localities = self.table.countyLocalities[county]
             localities.sort(key=lambda county: county)
             for locality in localities:
-                print("+ " + locality)
-            print()
+                print("+ " + locality, file=self.out)
+            print(file=self.out)
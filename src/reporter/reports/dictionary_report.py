@@ -42,10 +42,10 @@ class DictionaryReport(Report):
     def _show_dictionary(
         self, name: str, dictionary: Union[StrCountDict, IdentityDict]
     ):
-        print("\n---- %s dictionary ----\n" % name)
+        print("\n---- %s dictionary ----\n" % name, file=self.out)
         if dictionary:
             self._print_columns(
                 sorted(dictionary.keys(), key=lambda x: "" if x is None else x.lower())
             )
         else:
-            print("[empty]")
+            print("[empty]", file=self.out)
@@ -20,20 +20,25 @@ class DupsByTaxaReport(ByTaxaReport):
 
         # Collect all the records with duplicate catalog numbers.
 
-        dups: list[SpecimenRecord] = []
+        dup_ids: set[int] = set()
 
         for record_set in self.table.catalog_numbers_to_records.values():
             if len(record_set) > 1:
                 for record in record_set:
                     if self._record_filter.test(record):
-                        dups += record_set
+                        dup_ids.update(r.id for r in record_set)
                         break
 
         # Print the report header.
 
         self._print_filter_title()
-        print("\n==== Duplicate Catalog Numbers, Taxonomically Ordered ====\n")
-        if not dups:
-            print("No duplicates found.\n")
+        print(
+            "\n==== Duplicate Catalog Numbers, Taxonomically Ordered ====\n",
+            file=self.out,
+        )
+        if not dup_ids:
+            print("No duplicates found.\n", file=self.out)
             return
-        self._print_taxon_groups(dups)
+        self._print_taxon_groups(
+            self.table.get_taxa_tree().iter_groups(lambda r: r.id in dup_ids)
+        )
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.reporter.james_table import *
+from src.reporter.export_diff import ExportDiff
+from src.reporter.record_filter import RecordFilter
+from src.reporter.reports.report import Report
+
+
+class ExportDiffReport(Report):
+    """Lists the records added, removed, and modified between two exports of the
+    spreadsheet, with the field changes of each modified record. Reports on all
+    records of the exports, regardless of the record filter."""
+
+    SINGLE_PASS = True
+
+    def __init__(
+        self,
+        table: JamesTable,
+        record_filter: RecordFilter,
+        export_diff: ExportDiff,
+    ):
+        super().__init__(table, record_filter)
+        self._export_diff = export_diff
+
+    def show(self) -> None:
+        diff = self._export_diff
+        print(
+            "\n**** Changes from %s to %s ****"
+            % (diff.prior_filename, diff.revised_filename),
+            file=self.out,
+        )
+
+        print("\n---- IDs of added records ----\n", file=self.out)
+        self._print_ids(diff.added_ids)
+        print("\n---- IDs of removed records ----\n", file=self.out)
+        self._print_ids(diff.removed_ids)
+
+        print("\n---- modified records ----", file=self.out)
+        for id, changes in diff.iter_field_changes():
+            print("\nID %d:" % id, file=self.out)
+            for column, prior_value, revised_value in changes:
+                print(
+                    '  %s: "%s" -> "%s"' % (column, prior_value, revised_value),
+                    file=self.out,
+                )
+        if not diff.modified_ids:
+            print("\n[none]", file=self.out)
+
+        for filename, invalid_ids in (
+            (diff.prior_filename, diff.invalid_prior_ids),
+            (diff.revised_filename, diff.invalid_revised_ids),
+        ):
+            if invalid_ids:
+                print(
+                    "\n---- rows skipped for invalid IDs in %s ----\n" % filename,
+                    file=self.out,
+                )
+                self._print_columns(['"%s"' % id for id in invalid_ids])
+
+        print(
+            "\n%d added, %d removed, %d modified"
+            % (len(diff.added_ids), len(diff.removed_ids), len(diff.modified_ids)),
+            file=self.out,
+        )
+
+    def _print_ids(self, ids: list[int]) -> None:
+        if ids:
+            self._print_columns([str(id) for id in ids])
+        else:
+            print("[none]", file=self.out)
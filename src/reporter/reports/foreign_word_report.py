@@ -22,7 +22,7 @@ class ForeignWordReport(Report):
     def show(self) -> None:
 
         self._print_filter_title()
-        print("\n==== Words containing foreign characters ====\n")
+        print("\n==== Words containing foreign characters ====\n", file=self.out)
 
         words: dict[str, list[str]] = {}
         for record in self._filtered_records():
@@ -65,11 +65,12 @@ class ForeignWordReport(Report):
             for word, findings in words.items():
                 print(
                     "%s%s: %s"
-                    % (word, " " * (space_buffer - len(word)), ", ".join(findings))
+                    % (word, " " * (space_buffer - len(word)), ", ".join(findings)),
+                    file=self.out,
                 )
         else:
-            print("No foreign words found.")
-        print()
+            print("No foreign words found.", file=self.out)
+        print(file=self.out)
 
     def _add_findings(
         self,
@@ -21,7 +21,10 @@ class InitialOnlyCatNumsReport(NameCatNumsReport):
     def show(self) -> None:
 
         self._print_filter_title()
-        print("\n==== Catalog numbers for primary names only having initials ====\n")
+        print(
+            "\n==== Catalog numbers for primary names only having initials ====\n",
+            file=self.out,
+        )
 
         INITIALS_ONLY_REGEX = re.compile(
             r"^(?:[A-Z][.] ?)+(?:, ?(?:Jr.|II|III|2nd|3rd))?$"
@@ -1,12 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Callable, TYPE_CHECKING
 from datetime import date
 from decimal import Decimal
 from enum import Enum
 import os
 import re
 
-from matplotlib.afm import AFM
 from pathlib import Path
 
 from src.lib.declared_names_table import DeclaredNamesTable
@@ -39,7 +38,7 @@ class _JarGroup:
     def __init__(self):
         self.taxa_uniques: list[str] = []
         self.records: list[SpecimenRecord] = []
-        self.sort_key = ""
+        self.sort_key: TaxonSortKey = ()
         self.restriction_func: RestrictionFunc
         self.restriction_abbr = ""
 
@@ -129,6 +128,8 @@ class LabelReport(Report):
                 self._jar_groups.append(current_jar_group)
         self._taxa_sample_records: dict[str, SpecimenRecord] = {}
 
+        from matplotlib.afm import AFM  # imported here, as matplotlib is slow to import
+
         afm_path = Path("./data/AGaramondPro-Regular.afm")
         with afm_path.open("rb") as fh:
             self._font_afm = AFM(fh)
@@ -163,15 +164,17 @@ class LabelReport(Report):
             self._max_label_lines += 1
             for jar_group in self._jar_groups:
                 jar_group.records = []
-            while (
-                self._lines_in_column != self.MAX_LINES_PER_PAGE
+            self._print_blank_lines_while(  # start a new page
+                lambda: self._lines_in_column != self.MAX_LINES_PER_PAGE
                 and self._columns_on_page != self.MAX_COLUMNS_PER_PAGE
-            ):
-                self._print_line()  # start a new page
+            )
             filtered_records = self._print_records(title, filtered_records)
 
         if not self._make_printable:
-            print("\nThere are %d labels in this list.\n" % self._label_count)
+            print(
+                "\nThere are %d labels in this list.\n" % self._label_count,
+                file=self.out,
+            )
 
     def _print_records(
         self, title: str, filtered_records: list[SpecimenRecord]
@@ -185,7 +188,7 @@ class LabelReport(Report):
             self._print_line("%d lines per label" % self._max_label_lines)
             self._space_to_next_label()
         else:
-            print("\n---- %s ----\n" % title)
+            print("\n---- %s ----\n" % title, file=self.out)
         left_over_records: list[SpecimenRecord] = []
 
         # Print only the records in the indicated jars.
@@ -196,8 +199,8 @@ class LabelReport(Report):
                     for jar_group in self._jar_group_map[record.taxon_unique]:
                         if jar_group.restriction_func(record):
                             jar_group.records.append(record)
-                            if jar_group.sort_key == "":
-                                jar_group.sort_key = to_taxon_sort_key(record)
+                            if not jar_group.sort_key:
+                                jar_group.sort_key = record.taxon_key
                             self._taxa_sample_records[record.taxon_unique] = record
             self._jar_groups.sort(key=lambda g: g.sort_key)
             for jar_group in self._jar_groups:
@@ -225,7 +228,7 @@ class LabelReport(Report):
                                             )
                                         self._print_carryover_lines()
                                     if not self._make_printable:
-                                        print()
+                                        print(file=self.out)
                                     printed_header = True
                                 self._print_record_label(lines, notes)
                                 self._print_carryover_lines()
@@ -236,7 +239,10 @@ class LabelReport(Report):
 
         else:
             if self._report_type == self.Type.ALL and self._make_printable:
-                for deltas, group in TaxaIterator(filtered_records):
+                pending_ids = set(r.id for r in filtered_records)
+                for deltas, group in self.table.get_taxa_tree().iter_groups(
+                    lambda r: r.id in pending_ids
+                ):
                     printed_header = False
                     for record in group:
                         lines, notes = self._make_label_and_notes(record)
@@ -386,11 +392,11 @@ class LabelReport(Report):
             if record.latitude >= 0:
                 latitude = "%s°N" % record.latitude
             else:
-                latitude = "%s°S" % (record.latitude * -1)
+                latitude = "%s°S" % -record.latitude
             if record.longitude >= 0:
                 longitude = "%s°E" % record.longitude
             else:
-                longitude = "%s°W" % (record.longitude * -1)
+                longitude = "%s°W" % -record.longitude
             label += " |C%s^%s" % (latitude, longitude)
 
         # Add the collector names.
@@ -474,8 +480,9 @@ class LabelReport(Report):
     def _print_carryover_lines(self) -> None:
         if self._make_printable:
             if self._lines_in_column + self._max_label_lines > self.MAX_LINES_PER_PAGE:
-                while self._lines_in_column % self.MAX_LINES_PER_PAGE > 0:
-                    self._print_line()
+                self._print_blank_lines_while(
+                    lambda: self._lines_in_column % self.MAX_LINES_PER_PAGE > 0
+                )
 
     def _print_delta_taxa_label(
         self,
@@ -484,10 +491,11 @@ class LabelReport(Report):
         taxon_unique: str = "",
         restriction_abbr: str = "",
     ) -> None:
+        taxa = self.table.get_taxa_tree().get_leaf(sample).get_path()
         changed = self._print_delta_taxa_label_line(
             deltas,
             ["phylum"],
-            [clean_taxon(sample.phylum)],
+            taxa[0:1],
             taxon_unique,
             restriction_abbr,
             False,
@@ -495,7 +503,7 @@ class LabelReport(Report):
         changed = self._print_delta_taxa_label_line(
             deltas,
             ["class", "subclass"],
-            [clean_taxon(sample.class_), clean_taxon(sample.subclass)],
+            taxa[1:3],
             taxon_unique,
             restriction_abbr,
             changed,
@@ -503,11 +511,7 @@ class LabelReport(Report):
         changed = self._print_delta_taxa_label_line(
             deltas,
             ["order", "suborder", "infraorder"],
-            [
-                clean_taxon(sample.order),
-                clean_taxon(sample.suborder),
-                clean_taxon(sample.infraorder),
-            ],
+            taxa[3:6],
             taxon_unique,
             restriction_abbr,
             changed,
@@ -515,7 +519,7 @@ class LabelReport(Report):
         changed = self._print_delta_taxa_label_line(
             deltas,
             ["family", "subfamily"],
-            [clean_taxon(sample.family), clean_taxon(sample.subfamily)],
+            taxa[6:8],
             taxon_unique,
             restriction_abbr,
             changed,
@@ -523,7 +527,7 @@ class LabelReport(Report):
         self._print_delta_taxa_label_line(
             deltas,
             ["species"],
-            [to_clean_genus_species(sample.genus, sample.species, sample.subspecies)],
+            taxa[8:9],
             taxon_unique,
             restriction_abbr,
             changed,
@@ -587,19 +591,31 @@ class LabelReport(Report):
         if self._label_count % 5000 == 0:
             os.system("say %d" % self._label_count)
 
-    def _print_line(self, line: str = "") -> None:
+    def _count_line(self) -> None:
         self._lines_in_column += 1
         if self._lines_in_column > self.MAX_LINES_PER_PAGE:
             self._lines_in_column = 1
             self._columns_on_page += 1
             if self._columns_on_page > self.MAX_COLUMNS_PER_PAGE:
                 self._columns_on_page = 0
-        print(line)
+
+    def _print_blank_lines_while(self, condition: Callable[[], bool]) -> None:
+        # Pads with a single write rather than a write per blank line.
+        blank_line_count = 0
+        while condition():
+            self._count_line()
+            blank_line_count += 1
+        self.out.write("\n" * blank_line_count)
+
+    def _print_line(self, line: str = "") -> None:
+        self._count_line()
+        self.out.write(line + "\n")
 
     def _space_to_next_label(self) -> None:
         if self._make_printable:
-            while self._lines_in_column % self._max_label_lines > 0:
-                self._print_line()
+            self._print_blank_lines_while(
+                lambda: self._lines_in_column % self._max_label_lines > 0
+            )
 
     def _split_label_lines(
         self, record_id: int, label: str, compression_rule: list[_Rule]
@@ -923,7 +939,7 @@ class LabelReport(Report):
                     latitude *= -1
                 elif latitude_str[-1] != "N":
                     _invalid_label(record.id, lines, "Latitude neither N nor S")
-                if latitude != record.latitude:
+                if latitude != record.latitude.to_decimal():
                     _invalid_label(record.id, lines, "Incorrect latitude")
                 if label[len(latitude_str)] != " " and label[len(latitude_str)] != "^":
                     _invalid_label(record.id, lines, "Invalid lat/long separator")
@@ -939,7 +955,7 @@ class LabelReport(Report):
                     longitude *= -1
                 elif longitude_str[-1] != "E":
                     _invalid_label(record.id, lines, "Longitude neither E nor W")
-                if longitude != record.longitude:
+                if longitude != record.longitude.to_decimal():
                     _invalid_label(record.id, lines, "Incorrect longitude")
                 label = label[len(longitude_str) + 1 :]
                 label = _advance_label_line(label)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from decimal import Decimal
 
 if TYPE_CHECKING:
+    from src.reporter.coordinate import Coordinate
     from src.reporter.james_table import *
 from src.reporter.record_filter import RecordFilter
 
@@ -10,6 +10,9 @@ from src.reporter.reports.report import Report
 
 
 class LatLongReport(Report):
+
+    SINGLE_PASS = True
+
     def __init__(
         self,
         table: JamesTable,
@@ -41,7 +44,8 @@ class LatLongReport(Report):
                             record.country,
                             record.state,
                             locality,
-                        )
+                        ),
+                        file=self.out,
                     )
             else:
                 print(
@@ -51,10 +55,11 @@ class LatLongReport(Report):
                         str(record.catalog_number),
                         str(record.latitude),
                         str(record.longitude),
-                    )
+                    ),
+                    file=self.out,
                 )
 
-    def _to_precision(self, coord: Decimal | None):
+    def _to_precision(self, coord: Coordinate | None):
         if coord is None:
             return 100
         coordStr = str(coord)
@@ -80,5 +80,5 @@ class ListedNamesCatNumsReport(NameCatNumsReport):
         ]
 
         self._print_filter_title()
-        print("\n==== Catalog Numbers for Select Names ====\n")
+        print("\n==== Catalog Numbers for Select Names ====\n", file=self.out)
         self._print_cat_nums_for_names(names_to_find)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+import re
+
+import Levenshtein  # type: ignore
+import pyphonetics  # type: ignore
+
+if TYPE_CHECKING:
+    from src.reporter.james_table import *
+from src.reporter.record_filter import RecordFilter
+
+from src.reporter.reports.report import Report
+
+MIN_SIMILARITY = 0.8  # min fraction of characters shared by similar names
+MAX_BLOCK_LOCALITIES = 100  # larger blocks come from words too common to compare
+
+REGEX_WORD = re.compile(r"[a-z]+")
+
+
+class LocalityCheckReport(Report):
+    """Reports pairs of locality names in the same county that are similar but not
+    identical apart from letter case, such as names with typos, variant words, or
+    transposed words. To avoid comparing every pair of localities in a county,
+    localities are only compared within blocks of localities having a word that
+    sounds alike, and blocks of words common to too many localities are skipped."""
+
+    def __init__(
+        self,
+        table: JamesTable,
+        record_filter: RecordFilter,
+    ):
+        super().__init__(table, record_filter)
+        self._lein = pyphonetics.Lein()
+
+    def show(self) -> None:
+        self._print_filter_title()
+        print(
+            "\nSimilar locality names in each county, with their numbers of records:",
+            file=self.out,
+        )
+
+        record_counts: dict[Optional[str], dict[str, int]] = {}
+        for record in self._filtered_records():
+            if record.locality_correct is not None:
+                county_counts = record_counts.setdefault(record.county, {})
+                county_counts[record.locality_correct] = (
+                    county_counts.get(record.locality_correct, 0) + 1
+                )
+
+        found_one = False
+        counties = sorted(
+            record_counts.keys(), key=lambda county: "" if county is None else county
+        )
+        for county in counties:
+            county_counts = record_counts[county]
+            similar_pairs = self._find_similar_pairs(sorted(county_counts.keys()))
+            if not similar_pairs:
+                continue
+            found_one = True
+            if county is None:
+                print("\n(no county):", file=self.out)
+            else:
+                print("\n%s County:" % county, file=self.out)
+            for locality1, locality2, similarity in similar_pairs:
+                print(
+                    "  %s (%d) ~ %s (%d): %d%% similar"
+                    % (
+                        locality1,
+                        county_counts[locality1],
+                        locality2,
+                        county_counts[locality2],
+                        round(similarity * 100),
+                    ),
+                    file=self.out,
+                )
+        if not found_one:
+            print("\nNo similar locality names found.", file=self.out)
+
+    def _find_similar_pairs(
+        self, localities: list[str]
+    ) -> list[tuple[str, str, float]]:
+        # Returns the pairs of similar localities among the sorted localities of a
+        # county, in order of the localities.
+
+        blocks: dict[str, list[int]] = {}
+        for i, locality in enumerate(localities):
+            for sound_code in set(
+                self._to_sound_code(word)
+                for word in REGEX_WORD.findall(locality.lower())
+            ):
+                blocks.setdefault(sound_code, []).append(i)
+
+        candidate_pairs: set[tuple[int, int]] = set()
+        for block in blocks.values():
+            if len(block) <= MAX_BLOCK_LOCALITIES:
+                for j, i1 in enumerate(block):
+                    for i2 in block[j + 1 :]:
+                        candidate_pairs.add((i1, i2))
+
+        similar_pairs: list[tuple[str, str, float]] = []
+        for i1, i2 in sorted(candidate_pairs):
+            similarity = _get_similarity(localities[i1], localities[i2])
+            if similarity is not None:
+                similar_pairs.append((localities[i1], localities[i2], similarity))
+        return similar_pairs
+
+    def _to_sound_code(self, word: str) -> str:
+        try:
+            return self._lein.phonetics(word)  # type: ignore
+        except IndexError:
+            # If a phonetic code is not available for a character, require exact word.
+            return "=" + word
+
+
+def _get_similarity(locality1: str, locality2: str) -> Optional[float]:
+    # Returns the similarity of the locality names, comparing them both as given
+    # and with their words sorted, or None if not similar or if identical apart
+    # from letter case, as the problem report reports those.
+
+    name1 = locality1.lower()
+    name2 = locality2.lower()
+    if name1 == name2:
+        return None
+    similarity = 0.0
+    for text1, text2 in (
+        (name1, name2),
+        (_to_sorted_words(name1), _to_sorted_words(name2)),
+    ):
+        distance: int = Levenshtein.distance(text1, text2)  # type: ignore
+        similarity = max(similarity, 1 - distance / max(len(text1), len(text2), 1))
+    return similarity if similarity >= MIN_SIMILARITY else None
+
+
+def _to_sorted_words(name: str) -> str:
+    return " ".join(sorted(REGEX_WORD.findall(name)))
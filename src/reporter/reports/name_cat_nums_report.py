@@ -22,10 +22,13 @@ class NameCatNumsReport(Report):
         # + cat num means collector; - cat num means determiner
         cat_nums_by_name: dict[str, list[Optional[int]]] = {}
 
-        print("A suffix of 'c' means that the name is a collector.")
-        print("A suffix of 'd' means that the name is a determiner/identifier.")
-        print("A suffix of 'cd' means the determiner is the collector.")
-        print()
+        print("A suffix of 'c' means that the name is a collector.", file=self.out)
+        print(
+            "A suffix of 'd' means that the name is a determiner/identifier.",
+            file=self.out,
+        )
+        print("A suffix of 'cd' means the determiner is the collector.", file=self.out)
+        print(file=self.out)
 
         for record in self._filtered_records():
             if record.collectors is not None:
@@ -66,4 +69,4 @@ class NameCatNumsReport(Report):
                     found_cat_nums.append("%d/%s" % (abs_cat_nums[i], suffixes[i]))
             else:
                 found_cat_nums.append("NAME NOT FOUND")
-            print('"%s": %s' % (name, ", ".join(found_cat_nums)))
+            print('"%s": %s' % (name, ", ".join(found_cat_nums)), file=self.out)
@@ -6,6 +6,7 @@ if TYPE_CHECKING:
     from src.reporter.james_table import *
 from src.reporter.record_filter import RecordFilter
 from src.reporter.name_column_parser import NameColumnParser
+from src.util.aho_corasick import AhoCorasick
 
 from src.reporter.reports.report import Report
 
@@ -39,6 +40,10 @@ class NameCheckReport(Report):
             table.declared_names_table.raw_correction_last_names
         )
         self._preconfirmed_names_map.update(self.PRECONFIRMED_NAMES_MAP)
+        self._preconfirmed_names = list(self._preconfirmed_names_map.items())
+        self._preconfirmed_names_matcher = AhoCorasick(
+            [confirmed_raw for confirmed_raw, _ in self._preconfirmed_names]
+        )
 
         # Construct a list of first names and misspellings of first names that need
         # to be excluded from the check of last names.
@@ -75,7 +80,8 @@ class NameCheckReport(Report):
                         if len(raw_last_names) == 0:
                             print(
                                 "* no raw last names in [%s] for [%s]"
-                                % (raw_name, str(variant))
+                                % (raw_name, str(variant)),
+                                file=self.out,
                             )
                             last_name_issues = True
                         else:
@@ -99,7 +105,7 @@ class NameCheckReport(Report):
     def show(self) -> None:
 
         self._print_filter_title()
-        print("\n==== Name Check Report ====\n")
+        print("\n==== Name Check Report ====\n", file=self.out)
         count: int = 0
 
         for record in self._filtered_records():
@@ -111,7 +117,10 @@ class NameCheckReport(Report):
                 record.identifier_year.determiners,
             )
             if collector_diffs or determiner_diffs:
-                print("ID/Cat No. %d/%s:" % (record.id, str(record.catalog_number)))
+                print(
+                    "ID/Cat No. %d/%s:" % (record.id, str(record.catalog_number)),
+                    file=self.out,
+                )
                 if collector_diffs:
                     self._print_diffs(
                         "collectors", record.raw_collectors, collector_diffs
@@ -120,11 +129,11 @@ class NameCheckReport(Report):
                     self._print_diffs(
                         "determiners", record.raw_identifier_year, determiner_diffs
                     )
-                print()
+                print(file=self.out)
                 count += 1
 
         if count == 0:
-            print("Confirmed all names.\n")
+            print("Confirmed all names.\n", file=self.out)
 
     def _check_names(
         self, raw_names: str, identities: Optional[list[Identity]]
@@ -137,21 +146,7 @@ class NameCheckReport(Report):
         # original_raw_names = raw_names
         raw_names = NameColumnParser.preprocess_raw_column(raw_names)
         raw_names = NameColumnParser.preprocess_raw_name(raw_names)
-        for (confirmed_raw, confirmed_last) in self._preconfirmed_names_map.items():
-            start_offset = raw_names.find(confirmed_raw)
-            if start_offset >= 0:
-                end_offset = start_offset + len(confirmed_raw)
-                start_offset -= 1
-                while start_offset >= 0 and raw_names[start_offset] == " ":
-                    start_offset -= 1
-                if start_offset >= 0 and raw_names[start_offset] not in ",;":
-                    continue
-                end_offset += 1
-                while end_offset < len(raw_names) and raw_names[end_offset] == " ":
-                    end_offset += 1
-                if end_offset < len(raw_names) and raw_names[end_offset] not in ",;":
-                    continue
-                raw_names = raw_names.replace(confirmed_raw, confirmed_last, 1)
+        raw_names = self._replace_preconfirmed_names(raw_names)
 
         # Collect the possible last names from the prepared raw column string.
 
@@ -251,10 +246,45 @@ class NameCheckReport(Report):
             or not self._is_known_first_name(name)
         )
 
+    def _replace_preconfirmed_names(self, raw_names: str) -> str:
+
+        # Apply the preconfirmed names in order, as if testing each in turn, but
+        # only test those the matcher found in the string. A replacement can
+        # alter which of the remaining names occur, so the string is rescanned
+        # for the remaining names after each replacement.
+
+        matcher = self._preconfirmed_names_matcher
+        first_offsets = matcher.find_first_offsets(raw_names)
+        candidates = sorted(first_offsets.keys())
+        while candidates:
+            candidate = candidates.pop(0)
+            confirmed_raw, confirmed_last = self._preconfirmed_names[candidate]
+            start_offset = first_offsets[candidate]
+            match_offset = start_offset
+            end_offset = start_offset + len(confirmed_raw)
+            start_offset -= 1
+            while start_offset >= 0 and raw_names[start_offset] == " ":
+                start_offset -= 1
+            if start_offset >= 0 and raw_names[start_offset] not in ",;":
+                continue
+            end_offset += 1
+            while end_offset < len(raw_names) and raw_names[end_offset] == " ":
+                end_offset += 1
+            if end_offset < len(raw_names) and raw_names[end_offset] not in ",;":
+                continue
+            raw_names = (
+                raw_names[0:match_offset]
+                + confirmed_last
+                + raw_names[match_offset + len(confirmed_raw) :]
+            )
+            first_offsets = matcher.find_first_offsets(raw_names)
+            candidates = sorted(i for i in first_offsets.keys() if i > candidate)
+        return raw_names
+
     def _print_diffs(self, name_set: str, raw_names: str, diffs: list[str]) -> None:
-        print("* %s [%s]" % (name_set, raw_names))
+        print("* %s [%s]" % (name_set, raw_names), file=self.out)
         for diff in diffs:
-            print("  - %s" % diff)
+            print("  - %s" % diff, file=self.out)
 
     def _to_lower_last_names(self, raw_text: str) -> list[str]:
         pared_str = self.INITIAL_REGEX.sub(" ", raw_text.lower())
@@ -18,19 +18,21 @@ class NoSpecimensByTaxaReport(ByTaxaReport):
 
     def show(self) -> None:
 
-        # Collect all the records with zero specimen counts.
+        # Collect the taxa of all the records with zero specimen counts.
 
-        zeros: list[SpecimenRecord] = []
-
-        for record in self._filtered_records():
-            if record.specimen_count == 0:
-                zeros.append(record)
+        zero_groups = list(
+            self.table.get_taxa_tree().iter_groups(
+                lambda r: r.specimen_count == 0 and self._record_filter.test(r)
+            )
+        )
 
         # Print the report header.
 
         self._print_filter_title()
-        print("\n==== Zero Specimen Counts, Taxonomically Ordered ====\n")
-        if not zeros:
-            print("No vials with 0 specimens found.\n")
+        print(
+            "\n==== Zero Specimen Counts, Taxonomically Ordered ====\n", file=self.out
+        )
+        if not zero_groups:
+            print("No vials with 0 specimens found.\n", file=self.out)
             return
-        self._print_taxon_groups(zeros)
+        self._print_taxon_groups(zero_groups)
@@ -1,12 +1,11 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from decimal import Decimal
-import sys
 import csv
 
 from src.lib.identity import Identity
 
 if TYPE_CHECKING:
+    from src.reporter.coordinate import Coordinate
     from src.reporter.james_table import *
 from src.reporter.record_filter import RecordFilter
 from src.reporter.reports.report import Report
@@ -35,6 +34,7 @@ class NormalizedCsvReport(Report):
             "Genus",
             "Species",
             "Subspecies",
+            "Taxon Author",
             "Country",
             "State",
             "County",
@@ -55,7 +55,7 @@ class NormalizedCsvReport(Report):
             "Notes",
         ]
         writer = csv.DictWriter(
-            sys.stdout,
+            self.out,
             fieldnames=headers,
             delimiter=",",
             quotechar='"',
@@ -114,7 +114,7 @@ class NormalizedCsvReport(Report):
             writer.writerow(row)
 
 
-def _to_column(s: Optional[str | int | Decimal]) -> str:
+def _to_column(s: Optional[str | int | Coordinate]) -> str:
     return "" if s is None else str(s)
 
 
@@ -38,7 +38,7 @@ class OdditiesReport(Report):
         # self._show_oddities("owners", self.table.owners)
 
     def _show_oddities(self, name: str, dictionary: StrCountDict):
-        print("\n---- %s oddities ----\n" % name)
+        print("\n---- %s oddities ----\n" % name, file=self.out)
         if dictionary:
             self._print_columns(
                 sorted(
@@ -47,7 +47,7 @@ class OdditiesReport(Report):
                 )
             )
         else:
-            print("[empty]")
+            print("[empty]", file=self.out)
 
     def _get_odd_taxa(self, taxa: list[str]):
         oddities: list[str] = []
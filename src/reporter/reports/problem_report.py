@@ -23,7 +23,7 @@ class ProblemReport(Report):
 
         self._print_filter_title()
 
-        print("\n==== IDs of Empty Records ====\n")
+        print("\n==== IDs of Empty Records ====\n", file=self.out)
         messages: list[str] = []
 
         for line_num in self.table.empty_record_ids:
@@ -31,77 +31,74 @@ class ProblemReport(Report):
         if messages:
             self._print_columns(messages)
         else:
-            print("No empty records found.\n")
+            print("No empty records found.\n", file=self.out)
 
-        print("\n==== Missing Catalog Numbers (across all records) ====\n")
+        print(
+            "\n==== Missing Catalog Numbers (across all records) ====\n", file=self.out
+        )
 
         messages = []
-        last_found_cat_num = 0
-        in_missing_range = False
-        for cat_num in range(1, self.table.max_catalog_number + 1):
-            if cat_num in self.table.catalog_numbers_to_records:
-                if in_missing_range:
-                    if cat_num == last_found_cat_num + 2:
-                        messages.append(str(last_found_cat_num + 1))
-                    else:
-                        messages.append("%d-%d" % (last_found_cat_num + 1, cat_num - 1))
-                    in_missing_range = False
-                last_found_cat_num = cat_num
+        catalog_number_index = self.table.get_catalog_number_index()
+        for first, last in catalog_number_index.iter_missing_ranges():
+            if first == last:
+                messages.append(str(first))
             else:
-                in_missing_range = True
+                messages.append("%d-%d" % (first, last))
 
         if messages:
             self._print_columns(messages)
         else:
-            print("No missing catalog numbers.\n")
+            print("No missing catalog numbers.\n", file=self.out)
 
-        print("\n==== Duplicate Catalog Numbers ====\n")
-        print("(Lists show catalog numbers with record IDs in parentheses.)\n")
+        print("\n==== Duplicate Catalog Numbers ====\n", file=self.out)
+        print(
+            "(Lists show catalog numbers with record IDs in parentheses.)\n",
+            file=self.out,
+        )
 
         messages = []
-        all_catalog_numbers = sorted(self.table.catalog_numbers_to_records.keys())
         includes_records_not_in_set = False
         includes_dups_both_in_set = False
-        for cat_num in all_catalog_numbers:
+        for cat_num, records in catalog_number_index.iter_duplicate_groups():
             if cat_num in self.table.catalog_numbers:
-                records = self.table.catalog_numbers_to_records[cat_num]
-                if len(records) > 1:  # if there are duplicates
-                    records_in_set_count = 0
-                    for record in records:
-                        if self._record_filter.test(record):
-                            records_in_set_count += 1
-                    for record in records:
-                        suffix = ""
-                        if not self._record_filter.test(record):
-                            suffix = "^"
-                            includes_records_not_in_set = True
-                        if records_in_set_count > 1:
-                            suffix += "*"
-                            includes_dups_both_in_set = True
-                        messages.append("%d(%d)%s" % (cat_num, record.id, suffix))
+                records_in_set_count = 0
+                for record in records:
+                    if self._record_filter.test(record):
+                        records_in_set_count += 1
+                for record in records:
+                    suffix = ""
+                    if not self._record_filter.test(record):
+                        suffix = "^"
+                        includes_records_not_in_set = True
+                    if records_in_set_count > 1:
+                        suffix += "*"
+                        includes_dups_both_in_set = True
+                    messages.append("%d(%d)%s" % (cat_num, record.id, suffix))
         if messages:
             self._print_columns(messages)
             if includes_dups_both_in_set or includes_records_not_in_set:
-                print()
+                print(file=self.out)
             if includes_dups_both_in_set:
-                print("  * both duplicates are in the selected set")
+                print("  * both duplicates are in the selected set", file=self.out)
             if includes_records_not_in_set:
-                print("  ^ vial is not in the selected set")
+                print("  ^ vial is not in the selected set", file=self.out)
         else:
-            print("No duplicates found.\n")
+            print("No duplicates found.\n", file=self.out)
 
         # Report problems found with individual records.
 
-        print("\n==== Problems with Individual Records ====\n")
+        print("\n==== Problems with Individual Records ====\n", file=self.out)
 
         problem_record_count = 0
         for record in self._filtered_records():
-            if record is not None and record.print_all_problems():
+            if record is not None and record.print_all_problems(self.out):
                 problem_record_count += 1
         if problem_record_count == 0:
-            print("No problems found.\n")
+            print("No problems found.\n", file=self.out)
         else:
-            print("\n  Found problems in %d records" % problem_record_count)
+            print(
+                "\n  Found problems in %d records" % problem_record_count, file=self.out
+            )
 
         # Report duplicate locality names having different letter cases.
 
@@ -111,12 +108,13 @@ class ProblemReport(Report):
             if len(duplicates) > 1:
                 if not foundOne:
                     print(
-                        "\n==== Identical Locality Names with Different Lettercases ====\n"
+                        "\n==== Identical Locality Names with Different Lettercases ====\n",
+                        file=self.out,
                     )
                     foundOne = True
                 for duplicate in duplicates:
-                    print(duplicate)
-                print()
+                    print(duplicate, file=self.out)
+                print(file=self.out)
 
         # Report duplicate locality names having different owners.
 
@@ -126,14 +124,18 @@ class ProblemReport(Report):
             if len(owners) > 1:
                 if not foundOne:
                     print(
-                        "\n==== Identical Locality Names with Different Owners ====\n"
+                        "\n==== Identical Locality Names with Different Owners ====\n",
+                        file=self.out,
                     )
                     foundOne = True
                 ownersWithNones: list[str] = []
                 for owner in owners:
                     ownersWithNones.append("(blank)" if owner is None else owner)
-                print(self.table.lowercaseLocalities[lowercaseLocality][0] + ":")
-                print("   ", ", ".join(ownersWithNones))
+                print(
+                    self.table.lowercaseLocalities[lowercaseLocality][0] + ":",
+                    file=self.out,
+                )
+                print("   ", ", ".join(ownersWithNones), file=self.out)
 
         # Report duplicate locality names having different counties.
 
@@ -143,25 +145,46 @@ class ProblemReport(Report):
             if len(counties) > 1:
                 if not foundOne:
                     print(
-                        "\n==== Identical Locality Names with Different Counties ====\n"
+                        "\n==== Identical Locality Names with Different Counties ====\n",
+                        file=self.out,
                     )
                     foundOne = True
                 countiesWithNones: list[str] = []
                 for county in counties:
                     countiesWithNones.append("(blank)" if county is None else county)
-                print(self.table.lowercaseLocalities[lowercaseLocality][0] + ":")
-                print("   ", ", ".join(countiesWithNones))
+                print(
+                    self.table.lowercaseLocalities[lowercaseLocality][0] + ":",
+                    file=self.out,
+                )
+                print("   ", ", ".join(countiesWithNones), file=self.out)
 
         # Show warnings associated with each record.
 
-        print("\n==== Warnings for Individual Records ====\n")
+        print("\n==== Warnings for Individual Records ====\n", file=self.out)
 
         found_warning = False
         for record in self._filtered_records():
-            found_warning = record.print_all_warnings() or found_warning
+            found_warning = record.print_all_warnings(self.out) or found_warning
 
         if not found_warning:
-            print("No warnings generated.")
+            print("No warnings generated.", file=self.out)
+
+        # Count the records having each kind of problem or warning.
+
+        print("\n==== Records by Kind of Problem or Warning ====\n", file=self.out)
+
+        record_ids = set(record.id for record in self._filtered_records())
+        issue_index = self.table.get_issue_index()
+        found_issue = False
+        for code in issue_index.get_codes():
+            record_count = sum(
+                1 for id in issue_index.get_record_ids(code) if id in record_ids
+            )
+            if record_count > 0:
+                print("%7d %s" % (record_count, code.get_label()), file=self.out)
+                found_issue = True
+        if not found_issue:
+            print("No problems or warnings found.", file=self.out)
 
         # Collect the records associated with each warning.
 
@@ -177,7 +200,7 @@ class ProblemReport(Report):
         # Print the selected set of jars.
 
         if self._jar_group_uniques is not None:
-            print("\n==== Selected Set of Jars and Vials ====\n")
+            print("\n==== Selected Set of Jars and Vials ====\n", file=self.out)
 
             for taxon_unique in self._jar_group_uniques:
-                print(taxon_unique.strip())
+                print(taxon_unique.strip(), file=self.out)
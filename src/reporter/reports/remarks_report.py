@@ -9,19 +9,21 @@ from src.reporter.reports.report import Report
 
 
 class RemarksReport(Report):
+
+    SINGLE_PASS = True
+
     def __init__(
         self,
         table: JamesTable,
         record_filter: RecordFilter,
     ):
         super().__init__(table, record_filter)
-        table.revise_names(unify_names_by_sound=True, merge_with_reference_names=True)
 
     def show(self) -> None:
 
         self._print_filter_title()
-        print("\n==== Remarks on Individual Records ====\n")
+        print("\n==== Remarks on Individual Records ====\n", file=self.out)
 
         for record in self._filtered_records():
             if record.remarks:
-                record._print_issues(record.remarks)  # type: ignore
+                record._print_issues(record.remarks, self.out)  # type: ignore
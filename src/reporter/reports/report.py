@@ -1,21 +1,26 @@
 from __future__ import annotations
-from typing import Iterator, TYPE_CHECKING
+from typing import Iterable, Iterator, TYPE_CHECKING
 from abc import ABC, abstractmethod
 import math
-from decimal import Decimal
+import sys
 
 if TYPE_CHECKING:
+    from src.reporter.coordinate import Coordinate
     from src.reporter.james_table import *
 from src.reporter.record_filter import RecordFilter
 from src.reporter.specimen_record import SpecimenRecord
+from src.util.report_writer import ReportWriter, StreamReportWriter
 
 
 class Report(ABC):
 
     LINE_WIDTH: int = 88  # print to lines of this maximum width
+    SINGLE_PASS: bool = False  # visits each record once, needing no name revision
 
     class FilteredRecordsIterator:
-        def __init__(self, records: list[SpecimenRecord], record_filter: RecordFilter):
+        def __init__(
+            self, records: Iterable[SpecimenRecord], record_filter: RecordFilter
+        ):
             self._records_iterator = iter(records)
             self._record_filter = record_filter
 
@@ -38,6 +43,7 @@ class Report(ABC):
         self._filtered_identities: Optional[dict[str, bool]] = None
         self._filtered_raw_names: Optional[dict[str, bool]] = None
         self._filtered_collectors: Optional[dict[str, bool]] = None
+        self.out: ReportWriter = StreamReportWriter(sys.stdout)
 
         table.summarize(record_filter)
 
@@ -45,6 +51,14 @@ class Report(ABC):
     def show(self) -> None:
         pass
 
+    def write_to(self, out: ReportWriter) -> None:
+        """Shows the report into the given writer, flushing the writer when done."""
+        self.out = out
+        try:
+            self.show()
+        finally:
+            out.flush()
+
     def _append_notes(self, old_notes: Optional[str], new_notes: Optional[str]) -> str:
         if new_notes is None:
             raise Exception("New notes unexpectedly None")
@@ -53,12 +67,12 @@ class Report(ABC):
         return new_notes
 
     def _get_safe_coordinate(
-        self, record: SpecimenRecord, coord: Optional[Decimal]
-    ) -> Optional[Decimal]:
+        self, record: SpecimenRecord, coord: Optional[Coordinate]
+    ) -> Optional[Coordinate]:
         if coord is None or record.is_sensitive:
             return None
         if record.state == "Texas":
-            return Decimal("{:.2f}".format(coord))  # this rounds Decimals (not floats)
+            return coord.round(2)
         return coord
 
     def _get_safe_locality_name(self, record: SpecimenRecord) -> Optional[str]:
@@ -75,7 +89,9 @@ class Report(ABC):
         )
 
     def _filtered_records(self) -> Iterator[SpecimenRecord]:
-        return self.FilteredRecordsIterator(self.table.records, self._record_filter)
+        return self.FilteredRecordsIterator(
+            self.table.iter_records(), self._record_filter
+        )
 
     def _is_filtered_identity(self, identity: Identity) -> bool:
         if self._filtered_identities is None:
@@ -102,25 +118,19 @@ class Report(ABC):
 
         if column_count == 0:
             for message in messages:
-                print("%s", message)
+                print("%s", message, file=self.out)
         else:
             line_count = math.ceil(len(messages) / column_count)
             for i in range(line_count):
-                j = i
-                while j < len(messages):
-                    if j == i:
-                        print("", end="")  # start of line
-                    else:
-                        print(" | ", end="")
-                    message = messages[j]
+                cells: list[str] = []
+                for message in messages[i::line_count]:
                     if message is None or message == "":
                         message = EMPTY_TERM
-                    print(message.ljust(max_width, " "), end="")
-                    j += line_count
-                print()
+                    cells.append(message.ljust(max_width, " "))
+                self.out.write(" | ".join(cells) + "\n")
 
     def _print_filter_title(self) -> None:
-        print("\n**** Report of %s ****" % self._record_filter.name)
+        print("\n**** Report of %s ****" % self._record_filter.name, file=self.out)
 
     def _print_segments(
         self,
@@ -135,11 +145,11 @@ class Report(ABC):
             if not just_starting:
                 line += delimiter
             if len(line) + len(segment) > self.LINE_WIDTH:
-                print(line)
+                print(line, file=self.out)
                 line = start_of_line
             line += segment
             just_starting = False
-        print(line)
+        print(line, file=self.out)
 
     def _to_collection_list(self, collections: list[str]) -> str:
         abbrevs: list[str] = []
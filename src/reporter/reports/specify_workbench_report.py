@@ -1,9 +1,8 @@
 from __future__ import annotations
-from decimal import Decimal
 from enum import Enum
-import sys
 import csv
 
+from src.reporter.coordinate import Coordinate
 from src.reporter.james_table import *
 from src.reporter.record_filter import StrictlyTexasCaveRecordFilter
 from src.reporter.reports.report import Report
@@ -81,7 +80,7 @@ class SpecifyWorkbenchReport(Report):
             headers.append("Determiner Last Name %d" % i)
             i += 1
         writer = csv.DictWriter(
-            sys.stdout, fieldnames=headers, dialect="excel", lineterminator="\n"
+            self.out, fieldnames=headers, dialect="excel", lineterminator="\n"
         )
         writer.writeheader()
 
@@ -394,5 +393,5 @@ def _add_agent(
     )
 
 
-def _to_column(s: Optional[str | int | Decimal]) -> str:
+def _to_column(s: Optional[str | int | Coordinate]) -> str:
     return "" if s is None else str(s)
@@ -37,27 +37,30 @@ class TaxaByDupsReport(Report):
         # Print the report header.
 
         self._print_filter_title()
-        print("\n==== Duplicate Catalog Numbers with Taxa ====\n")
+        print("\n==== Duplicate Catalog Numbers with Taxa ====\n", file=self.out)
         if not dups:
-            print("No duplicates found.\n")
+            print("No duplicates found.\n", file=self.out)
             return
         print(
             "Found %d duplicated catalog numbers spanning %d records."
-            % (dup_cat_num_count, len(dups))
+            % (dup_cat_num_count, len(dups)),
+            file=self.out,
         )
         print(
-            "\n(The first four letters of collection names are shown after the slash.)"
+            "\n(The first four letters of collection names are shown after the slash.)",
+            file=self.out,
         )
 
         # List taxa_line for each catalog number.
 
         NONE = "—"  # em dash
         SEP = ", "
+        taxa_tree = self.table.get_taxa_tree()
         last_cat_num: int = -1
         for record in dups:
             assert record.catalog_number is not None
             if record.catalog_number != last_cat_num:
-                print("\nCat no. %d:" % record.catalog_number)
+                print("\nCat no. %d:" % record.catalog_number, file=self.out)
 
             taxa_line = "  ID %d/%s: " % (
                 record.id,
@@ -112,9 +115,8 @@ class TaxaByDupsReport(Report):
                 taxa_line += "'%s'" % record.subfamily
             taxa_line += SEP
 
-            genus_species = to_clean_genus_species(
-                record.genus, record.species, record.subspecies
-            )
+            genus_species = taxa_tree.get_leaf(record).taxon
+            assert genus_species is not None
             if genus_species == NO_TAXON_STR:
                 genus_species = NONE
             elif genus_species.endswith("sp."):
@@ -123,5 +125,5 @@ class TaxaByDupsReport(Report):
                 genus_species = "'%s'" % genus_species
             taxa_line += genus_species
 
-            print(taxa_line)
+            print(taxa_line, file=self.out)
             last_cat_num = record.catalog_number
@@ -19,7 +19,7 @@ class TaxaCheckReport(Report):
     NAME_REGEX = re.compile(r"^[a-zA-Z]+")
 
     def show(self) -> None:
-        print("kingdom,scientificName")
+        print("kingdom,scientificName", file=self.out)
         self._put_line("(phyla)")
         self._put_dictionary(self.table.phyla)
         self._put_line("(classes)")
@@ -61,4 +61,4 @@ class TaxaCheckReport(Report):
             self._put_line(name)
 
     def _put_line(self, taxon: str) -> None:
-        print("Animalia,%s" % taxon)
+        print("Animalia,%s" % taxon, file=self.out)
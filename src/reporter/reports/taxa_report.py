@@ -22,11 +22,13 @@ class TaxaReport(Report):
         # Print taxa in order of first occurrence in the spreadsheet.
 
         prior_taxon_uniques: dict[str, bool] = {}
-        taxa_iterator = TaxaIterator(list(self._filtered_records()))
-        for _, records in taxa_iterator:
-            taxon_unique = to_taxon_spec(records[0])
+        taxa_tree = self.table.get_taxa_tree()
+        for leaf in taxa_tree.iter_leaves():
+            if not any(self._record_filter.test(r) for r in leaf.records):
+                continue
+            taxon_unique = leaf.get_taxon_spec()
             if taxon_unique not in prior_taxon_uniques:
-                print(taxon_unique)
+                print(taxon_unique, file=self.out)
                 prior_taxon_uniques[taxon_unique] = True
 
         # Contruct a list of uniques to the left of each rank.
@@ -60,6 +62,6 @@ class TaxaReport(Report):
 
         for right_taxon, left_taxa in left_of_rank_uniques.items():
             if len(left_taxa) > 1:
-                print("\n%s:" % right_taxon)
+                print("\n%s:" % right_taxon, file=self.out)
                 for left_unique in left_taxa:
-                    print("- %s | %s" % (left_unique, right_taxon))
+                    print("- %s | %s" % (left_unique, right_taxon), file=self.out)
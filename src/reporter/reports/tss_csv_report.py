@@ -1,12 +1,11 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from decimal import Decimal
-import sys
 import csv
 
 from src.lib.identity import Identity
 
 if TYPE_CHECKING:
+    from src.reporter.coordinate import Coordinate
     from src.reporter.james_table import *
 from src.reporter.record_filter import RecordFilter, StrictlyTexasCaveRecordFilter
 from src.reporter.reports.report import Report
@@ -38,7 +37,6 @@ class TssCsvReport(Report):
             "Subfamily",
             "Genus",
             "Species/Author",
-            "Subspecies",
             "Country",
             "State",
             "County",
@@ -54,7 +52,7 @@ class TssCsvReport(Report):
             "Notes",
         ]
         writer = csv.DictWriter(
-            sys.stdout, fieldnames=headers, dialect="excel", lineterminator="\n"
+            self.out, fieldnames=headers, dialect="excel", lineterminator="\n"
         )
         writer.writeheader()
 
@@ -113,5 +111,5 @@ class TssCsvReport(Report):
         return notes
 
 
-def _to_column(s: Optional[str | int | Decimal]) -> str:
+def _to_column(s: Optional[str | int | Coordinate]) -> str:
     return "" if s is None else str(s)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import Optional, Tuple
-from decimal import Decimal
 import re
 
 # NOTE: All Texas cave coordinates are rounded to the 2nd decimal place in
@@ -10,9 +9,11 @@ import re
 from src.lib.identity import Identity
 from src.lib.declared_names_table import DeclaredNamesTable
 from src.lib.parse_error import ParseError
+from src.util.report_writer import ReportWriter
 from src.reporter.taxa import *
 from src.reporter.lat_long_table import LatLongTable
 from src.reporter.lat_long_record import LatLongRecord
+from src.reporter.record_issue import IssueCode, NAME_ISSUE_CODES
 from src.reporter.james_date_time import JamesDateTime
 from src.reporter.name_column_parser import NameColumnParser
 from src.reporter.determiner_set import DeterminerSet
@@ -97,12 +98,11 @@ class SpecimenRecord(LatLongRecord):
         # Initialize state variables.
 
         self.name_changes: Optional[list[str]] = None
-        self.sort_key: str = ""
 
         # Perform checks on assumptions.
 
         if raw_subspecies != "":
-            self.add_problem("Expected empty subspecies")
+            self.add_problem(IssueCode.UNEXPECTED_SUBSPECIES)
 
         # Load from raw data.
 
@@ -141,18 +141,28 @@ class SpecimenRecord(LatLongRecord):
         )
         self.normalized_date_time = self._normalize_date_time()
         self.raw_collectors: str = raw_collectors
+        collector_issue_start = self._count_issues()
         self.collectors = self._parse_collectors(
             declared_names_table, self.raw_collectors
         )
+        collector_issue_end = self._count_issues()
         self.females = self._parse_int_or_0("females", raw_females)
         self.males = self._parse_int_or_0("males", raw_males)
         self.immatures = self._parse_int_or_0("immatures", raw_immatures)
         self.type_status = self._parse_type_status(raw_type_status)
         self.collections = self._parse_collections(raw_collections)
         self.raw_identifier_year = raw_determiners
+        determiner_issue_start = self._count_issues()
         self.identifier_year = DeterminerSet().load(
             declared_names_table, self, self.raw_identifier_year
         )
+        # Locates the names' issues so that the names can be re-parsed in place.
+        self._name_issue_offsets = (
+            collector_issue_start
+            + collector_issue_end
+            + determiner_issue_start
+            + self._count_issues()
+        )
         self.specimen_count = self._parse_specimen_count(raw_specimen_count)
         self.misc_notes = self._parse_str_or_none(raw_notes)
         self.new_verbatim_date = raw_verbatim_date
@@ -173,12 +183,14 @@ class SpecimenRecord(LatLongRecord):
                         self.subspecies = self.subspecies.replace(
                             "(blind)", "(eyeless)"
                         )
+        self.taxon_key = to_taxon_key(self)
 
         if lat_longs is not None:
             self._revise_lat_long(lat_longs)
 
         # Validate.
 
+        self.date_columns = (0, 0, 0)  # Collection Year, Month, and Day, or 0
         self._validate(raw_day, raw_month, raw_year)
 
     def has_specimen(self) -> bool:
@@ -200,35 +212,82 @@ class SpecimenRecord(LatLongRecord):
         else:
             self.name_changes.append(log)
 
-    def print_name_problems(self) -> bool:
+    def print_name_problems(self, out: Optional[ReportWriter] = None) -> bool:
         if self._problems is None:
             return False
-        name_problems: list[str] = []
-        for problem in self._problems:
-            if problem.endswith(" in collector") or problem.endswith(" in determiner"):
-                name_problems.append(problem)
+        name_problems = [p for p in self._problems if p.code in NAME_ISSUE_CODES]
         if name_problems:
-            self._print_issues(name_problems)
+            self._print_issues(name_problems, out)
             return True
         return False
 
-    def print_name_warnings(self) -> bool:
+    def print_name_warnings(self, out: Optional[ReportWriter] = None) -> bool:
         if self._warnings is None:
             return False
-        name_warnings: list[str] = []
-        for problem in self._warnings:
-            if problem.endswith(" in collector") or problem.endswith(" in determiner"):
-                name_warnings.append(problem)
+        name_warnings = [w for w in self._warnings if w.code in NAME_ISSUE_CODES]
         if name_warnings:
-            self._print_issues(name_warnings)
+            self._print_issues(name_warnings, out)
             return True
         return False
 
+    def reparse_names(self, declared_names_table: DeclaredNamesTable) -> None:
+        """Re-parses the collectors and determiners using a revised table of declared
+        names, putting any issues found with them in place of the prior issues."""
+
+        old_problems = self._problems or []
+        old_warnings = self._warnings or []
+        (
+            collector_problem_start,
+            collector_warning_start,
+            collector_problem_end,
+            collector_warning_end,
+            determiner_problem_start,
+            determiner_warning_start,
+            determiner_problem_end,
+            determiner_warning_end,
+        ) = self._name_issue_offsets
+
+        self._problems = None
+        self._warnings = None
+        self.add_issues(
+            old_problems[0:collector_problem_start],
+            old_warnings[0:collector_warning_start],
+        )
+        collector_issue_start = self._count_issues()
+        self.collectors = self._parse_collectors(
+            declared_names_table, self.raw_collectors
+        )
+        collector_issue_end = self._count_issues()
+        self.add_issues(
+            old_problems[collector_problem_end:determiner_problem_start],
+            old_warnings[collector_warning_end:determiner_warning_start],
+        )
+        determiner_issue_start = self._count_issues()
+        self.identifier_year = DeterminerSet().load(
+            declared_names_table, self, self.raw_identifier_year
+        )
+        self._name_issue_offsets = (
+            collector_issue_start
+            + collector_issue_end
+            + determiner_issue_start
+            + self._count_issues()
+        )
+        self.add_issues(
+            old_problems[determiner_problem_end:],
+            old_warnings[determiner_warning_end:],
+        )
+
     def save_problems(self, parser: NameColumnParser, column_name: str) -> None:
         for error in parser.get_errors():
-            self.add_problem("%s in %s" % (error, column_name))
+            self.add_problem(IssueCode.NAME_ERROR, error, field=column_name)
         for warning in parser.get_warnings():
-            self.add_warning("%s in %s" % (warning, column_name))
+            self.add_warning(IssueCode.NAME_WARNING, warning, field=column_name)
+
+    def _count_issues(self) -> tuple[int, int]:
+        return (
+            0 if self._problems is None else len(self._problems),
+            0 if self._warnings is None else len(self._warnings),
+        )
 
     def _correct_foreign_chars(self, s: Optional[str]) -> Optional[str]:
         if s is None:
@@ -261,9 +320,7 @@ class SpecimenRecord(LatLongRecord):
             if accuracy1 == 0 or accuracy2 == 0:
                 accuracy1 += accuracy2
             else:
-                self.add_problem(
-                    "coordinateUncertaintyInMeters disagrees with accuracy in microhabitat"
-                )
+                self.add_problem(IssueCode.ACCURACY_DISAGREES)
                 accuracy1 = 0
         return accuracy1 if accuracy1 != 0 else None
 
@@ -277,7 +334,7 @@ class SpecimenRecord(LatLongRecord):
             end_date_time = self._parse_date_time_column("endDate", end_str)
             if end_date_time is not None:
                 if date_time.start_date != end_date_time.start_date:
-                    date_time.end_date = end_date_time.start_date
+                    date_time = date_time.with_end_date(end_date_time.start_date)
         return date_time
 
     def _parse_date_time_column(
@@ -286,15 +343,13 @@ class SpecimenRecord(LatLongRecord):
         try:
             if date_time_str == ".":
                 raise ParseError("missing date")
-            date_time = JamesDateTime()
-            date_time.load(date_time_str)
-            return date_time
+            return JamesDateTime.parse(date_time_str)
         except ParseError as e:
             if e.message.startswith("missing date"):
-                self.add_warning(e.message)
+                self.add_warning(IssueCode.MISSING_DATE, e.message)
             else:
                 self.add_problem(
-                    "%s (%s '%s')" % (e.message, column_name, date_time_str)
+                    IssueCode.INVALID_DATE, e.message, date_time_str, field=column_name
                 )
             return None
 
@@ -305,7 +360,7 @@ class SpecimenRecord(LatLongRecord):
         identities = parser.parse()
         self.save_problems(parser, "collector")
         if identities is None:
-            self.add_warning("no collectors")
+            self.add_warning(IssueCode.NO_COLLECTORS)
             return None
         return identities
 
@@ -375,7 +430,7 @@ class SpecimenRecord(LatLongRecord):
             and self.state.lower() == "texas"
             and correct_locality is None
         ):
-            self.add_problem("Texas specimen missing a correct locality")
+            self.add_problem(IssueCode.MISSING_CORRECT_LOCALITY)
         return correct_locality
 
     def _parse_locality_on_label(self, s: str) -> Optional[str]:
@@ -417,9 +472,9 @@ class SpecimenRecord(LatLongRecord):
     def _parse_specimen_count(self, s: str) -> int:
         count = 0 if s == "" else self._parse_int("specimen count", s)
         if count == 0:
-            self.add_problem("specimen count is 0")
+            self.add_problem(IssueCode.ZERO_SPECIMEN_COUNT)
         if count is None:
-            self.add_problem("invalid specimen count")
+            self.add_problem(IssueCode.INVALID_SPECIMEN_COUNT)
             count = 0
         return count
 
@@ -460,7 +515,7 @@ class SpecimenRecord(LatLongRecord):
         if " " in s:
             if s == "Acarina WRONG!" or s == "?cave species":
                 return None
-            self.add_problem("taxon '%s' contains spaces" % s)
+            self.add_problem(IssueCode.TAXON_CONTAINS_SPACES, s)
         return s
 
     def _parse_type_status(self, s: str) -> Optional[str]:
@@ -478,96 +533,62 @@ class SpecimenRecord(LatLongRecord):
         # coordinates aren't given in a way that preserves precision (such as by
         # appending N, S, E, W, or x, making the coordinate a string.)
 
-        lat_long = lat_longs.get_by_id(self.id)
+        lat_long = lat_longs.get_coordinates(self.id)
         if self.latitude is not None and not self.trust_latitude_precision:
-            if lat_long is not None and self.latitude == lat_long.latitude:
-                self.latitude = lat_long.latitude  # may change the precision
+            if lat_long is not None and self.latitude == lat_long[0]:
+                self.latitude = lat_long[0]  # may change the precision
             else:
-                self.latitude, precision = self._to_min_precision(self.latitude)
+                self.latitude, precision = self.latitude.strip_zeros()
                 if precision < 5:
                     self.add_problem(
-                        "unknown latitude precision %s (< 5 digits)" % self.latitude
+                        IssueCode.UNKNOWN_PRECISION, self.latitude, field="latitude"
                     )
 
         if self.longitude is not None and not self.trust_longitude_precision:
-            if lat_long is not None and self.longitude == lat_long.longitude:
-                self.longitude = lat_long.longitude  # may change the precision
+            if lat_long is not None and self.longitude == lat_long[1]:
+                self.longitude = lat_long[1]  # may change the precision
             else:
-                self.longitude, precision = self._to_min_precision(self.longitude)
+                self.longitude, precision = self.longitude.strip_zeros()
                 if precision < 5:
                     self.add_problem(
-                        "unknown longitude precision %s (< 5 digits)" % self.longitude
+                        IssueCode.UNKNOWN_PRECISION, self.longitude, field="longitude"
                     )
 
-    def _to_min_precision(self, dec: Decimal) -> tuple[Decimal, int]:
-        s = str(dec)
-        i = len(s)
-        while i > 0 and s[i - 1] == "0":
-            i -= 1
-        s = s[0:i]
-        dot_offset = s.find(".")
-        return (Decimal(s), 0 if dot_offset < 0 else len(s) - dot_offset - 1)
-
     def _validate(self, raw_day: str, raw_month: str, raw_year: str) -> None:
 
         if not self.has_specimen():
-            self.add_problem("names no specimen")
+            self.add_problem(IssueCode.NO_SPECIMEN)
 
         if self.country is None:
-            self.add_problem("missing country")
+            self.add_problem(IssueCode.MISSING_COUNTRY)
         if (
             self.country in ["USA", "Belize", "Guatemala", "Mexico"]
             and self.state is None
         ):
-            self.add_problem("missing state in %s" % self.country)
+            self.add_problem(IssueCode.MISSING_STATE, self.country)
 
         if (
             self.locality_correct is None
             and self.locality_on_label is None
             and self.county is None
         ):
-            self.add_problem("missing locality information")
+            self.add_problem(IssueCode.MISSING_LOCALITY)
+
+        # Parse the date columns for check_collection_dates() to compare with the
+        # parsed date, which it does for all records at once.
 
         if self.date_time is not None:
-            start_date = self.date_time.start_date
-            year_column = self._parse_int_or_0("Collection Year", raw_year)
-            month_column = self._parse_int_or_0("Collection Month", raw_month)
-            day_column = self._parse_int_or_0("Collection Day", raw_day)
-
-            if start_date is not None:
-                if (
-                    year_column != 0
-                    and start_date.year is not None
-                    and year_column != start_date.year
-                ):
-                    self.add_problem(
-                        "Year column %d disagrees with parsed year %d"
-                        % (year_column, start_date.year)
-                    )
-                elif (
-                    month_column != 0
-                    and start_date.month is not None
-                    and month_column != start_date.month
-                ):
-                    self.add_problem(
-                        "Month column %d disagrees with parsed month %d"
-                        % (month_column, start_date.month)
-                    )
-                elif (
-                    day_column != 0
-                    and start_date.day is not None
-                    and day_column != start_date.day
-                ):
-                    self.add_problem(
-                        "Day column %d disagrees with parsed day %d"
-                        % (day_column, start_date.day)
-                    )
+            self.date_columns = (
+                self._parse_int_or_0("Collection Year", raw_year) or 0,
+                self._parse_int_or_0("Collection Month", raw_month) or 0,
+                self._parse_int_or_0("Collection Day", raw_day) or 0,
+            )
 
         if self.species is None:
             if self.subspecies is not None:
-                self.add_problem("Supspecies given without species")
+                self.add_problem(IssueCode.SUBSPECIES_WITHOUT_SPECIES)
             elif self.authors is not None:
-                self.add_problem("Authors given without species")
+                self.add_problem(IssueCode.AUTHORS_WITHOUT_SPECIES)
 
 
 def parse_species_author(
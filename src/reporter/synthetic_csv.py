@@ -0,0 +1,349 @@
+from __future__ import annotations
+from typing import Optional
+import csv
+import os
+import random
+import sys
+
+import src.util.args as args
+
+# Generator of synthetic exports of James' spreadsheet, for benchmarking and
+# reproducing slowdowns without sharing his data. The rows use all of the columns
+# that JamesTable reads, with the kinds of name variants, Roman-numeral dates,
+# taxon strings, and coordinate formats found in the real data. A given seed and
+# row count always produce the same files.
+
+SPECIMEN_COLUMNS = [
+    "ID",
+    "Proofed-JR",
+    "Catalog Number",
+    "Phylum",
+    "Class",
+    "Subclass",
+    "Order",
+    "Suborder",
+    "Infraorder",
+    "Family",
+    "Subfamily",
+    "Genus",
+    "Species/Author",
+    "Subspecies",
+    "Species Name on Label",
+    "Continent",
+    "Country",
+    "State",
+    "County",
+    "Locality-Correct Name",
+    "Locality as on label",
+    "Datum",
+    "Latitude",
+    "Longitude",
+    "coordinateUncertaintyInMeters",
+    "Owner",
+    "Microhabitat",
+    "Date/Time",
+    "Collector",
+    "Females",
+    "Males",
+    "Immatures",
+    "Type Status",
+    "Collection",
+    "Identifier/Year",
+    "Number of Specimens",
+    "Collection Year",
+    "Collection Month",
+    "Collection Day",
+    "startDate",
+    "endDate",
+    "verbatimEventDate",
+    "misc_comments_notes",
+    "area",
+]
+LAT_LONG_COLUMNS = ["id", "cat_num", "latitude", "longitude"]
+
+# fmt: off
+# Phylum, class, subclass, order, suborder, infraorder, family, subfamily,
+# genus, species/author, subspecies.
+_TAXA = [
+    ("Arthropoda", "Arachnida", "", "Araneae", "Araneomorphae", "", "Dictynidae", "", "Cicurina", "varians Gertsch & Mulaik", ""),
+    ("Arthropoda", "Arachnida", "", "Araneae", "Araneomorphae", "", "Dictynidae", "", "Cicurina", "(Cicurella) madla Gertsch", ""),
+    ("Arthropoda", "Arachnida", "", "Araneae", "Araneomorphae", "", "Dictynidae", "", "Cicurina", "sp.", ""),
+    ("Arthropoda", "Arachnida", "", "Araneae", "Araneomorphae", "", "Linyphiidae", "Erigoninae", "Eidmannella", "pallida (Emerton)", ""),
+    ("Arthropoda", "Arachnida", "", "Araneae", "", "", "Leptonetidae", "", "Neoleptoneta", "n. sp. 3", ""),
+    ("Arthropoda", "Arachnida", "", "Opiliones", "Laniatores", "", "Phalangodidae", "", "Texella", "reddelli Goodnight & Goodnight", ""),
+    ("Arthropoda", "Arachnida", "", "Schizomida", "", "", "Hubbardiidae", "Hubbardiinae", "Stenochrus", "pecki (Rowland)", ""),
+    ("Arthropoda", "Arachnida", "Acari", "Ixodida", "", "", "Argasidae", "", "Ornithodoros", "turicata (Duges)", ""),
+    ("Arthropoda", "Insecta", "", "Coleoptera", "Adephaga", "", "Carabidae", "Platyninae", "Rhadine", "subterranea (Van Dyke)", "mitchelli Barr"),
+    ("Arthropoda", "Insecta", "", "Coleoptera", "Adephaga", "", "Carabidae", "Platyninae", "Rhadine", "n. sp.", ""),
+    ("Arthropoda", "Insecta", "", "Orthoptera", "Ensifera", "", "Rhaphidophoridae", "Ceuthophilinae", "Ceuthophilus", "secretus Scudder", ""),
+    ("Arthropoda", "Insecta", "", "Collembola", "", "", "", "", "", "", ""),
+    ("Arthropoda", "Diplopoda", "", "Polydesmida", "", "", "Cambalidae", "", "Speodesmus", "echinourus Loomis", ""),
+    ("Arthropoda", "Malacostraca", "", "Isopoda", "Cymothoida", "", "Cirolanidae", "", "Cirolanides", "texensis Benedict", ""),
+    ("Arthropoda", "Malacostraca", "", "Amphipoda", "", "", "Crangonyctidae", "", "Stygobromus", "flagellatus (Benedict)", ""),
+    ("Mollusca", "Gastropoda", "", "", "", "", "", "", "", "", ""),
+    ("Nemata", "", "", "", "", "", "", "", "", "", ""),
+    ("Platyhelminthes", "Turbellaria", "", "Tricladida", "", "", "Kenkiidae", "", "Sphalloplana", "mohri Hyman", ""),
+    ("Chordata", "Amphibia", "", "Caudata", "", "", "Plethodontidae", "", "Eurycea", "rathbuni (Stejneger)", ""),
+]
+
+# Continent, country, state, county, and the localities found in the county.
+_PLACES = [
+    ("North America", "USA", "Texas", "Bexar", ["Government Canyon Bat Cave", "Robber Baron Cave", "Madla's Cave"]),
+    ("North America", "USA", "Texas", "Travis", ["Amber Cave", "Tooth Cave", "Kretschmarr Salamander Cave"]),
+    ("North America", "USA", "Texas", "Hays", ["Ezell's Cave", "Rattlesnake Cave", "Wonder Cave"]),
+    ("North America", "USA", "Texas", "Williamson", ["Inner Space Cavern", "Bat Well", "Cobb Cavern"]),
+    ("North America", "USA", "Texas", "Kerr", ["Stowers Cave", "Bear Cave"]),
+    ("North America", "USA", "New Mexico", "Eddy", ["Carlsbad Cavern", "Lechuguilla Cave"]),
+    ("North America", "Mexico", "Tamaulipas", "Gomez Farias", ["Cueva de El Abra", "Sotano de Jos"]),
+    ("North America", "Mexico", "San Luis Potosi", "", ["Sotano de las Golondrinas", "Cueva de los Sabinos"]),
+    ("Central America", "Belize", "Cayo", "", ["Actun Tunichil Muknal", "St. Herman's Cave"]),
+]
+
+# Each agent with the variants by which the spreadsheet names the agent.
+_AGENTS = [
+    ["Reddell, James R.", "Reddell, J.", "Reddell, J. R.", "J. Reddell", "J.R. Reddell", "Reddel, J."],
+    ["Elliott, William R.", "Elliott, W. R.", "Elliott, W.R.", "W. Elliott", "Elliott, Bill"],
+    ["Mitchell, Robert W.", "Mitchell, R. W.", "R.W. Mitchell", "Mitchel, R. W."],
+    ["Fieseler, Ronald G.", "Fieseler, R.", "R. Fieseler"],
+    ["Cokendolpher, James C.", "Cokendolpher, J.", "Cokendolpher, J. C.", "J. Cokendolpher"],
+    ["Veni, George", "Veni, G.", "G. Veni"],
+    ["Reddell, Marcelina", "Reddell, M.", "M. Reddell"],
+    ["Gertsch, Willis J.", "Gertsch, W. J.", "Gertsch, W.J."],
+    ["Muchmore, William B.", "Muchmore, W. B.", "Muchmore, W."],
+    ["Barr, Thomas C., Jr.", "Barr, T. C., Jr.", "Barr, T. C."],
+]
+_ROMAN_MONTHS = ["I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X", "XI", "XII"]
+# fmt: on
+
+_OWNERS = ["", "", "", "TPWD", "Camp Bullis", "Fort Hood", "City of Austin"]
+_MICROHABITATS = [
+    "",
+    "",
+    "on guano",
+    "under rock",
+    "in dark zone",
+    "on wall near entrance",
+]
+_TYPE_STATUSES = ["", "", "", "", "", "Paratype", "Paratypes", "Holotype"]
+_COLLECTIONS = [
+    "Biospeleology",
+    "Biospeleology",
+    "Biospeleology",
+    "Biospeleology, Ento",
+    "Ento",
+]
+_NOTES = ["", "", "", "in alcohol", "pinned", "slide mount", "from Berlese sample"]
+_DATUMS = ["", "", "WGS84", "NAD27"]
+
+
+class SyntheticExport:
+    """Generates a synthetic specimen export and its reference lat/long table."""
+
+    def __init__(self, row_count: int, seed: int = 1):
+        self._row_count = row_count
+        self._random = random.Random(seed)
+
+    def write(self, dir_path: str) -> str:
+        """Writes 'specimens.csv' and 'reference-lat-longs.csv' into the directory,
+        returning the path of the specimens file."""
+
+        os.makedirs(dir_path, exist_ok=True)
+        specimens_file = os.path.join(dir_path, "specimens.csv")
+        lat_longs_file = os.path.join(dir_path, "reference-lat-longs.csv")
+        with open(specimens_file, "w", newline="", encoding="utf-8") as specimens:
+            with open(lat_longs_file, "w", newline="", encoding="utf-8") as lat_longs:
+                specimen_writer = csv.DictWriter(specimens, SPECIMEN_COLUMNS)
+                lat_long_writer = csv.DictWriter(lat_longs, LAT_LONG_COLUMNS)
+                specimen_writer.writeheader()
+                lat_long_writer.writeheader()
+                for id in range(1, self._row_count + 1):
+                    row = self._create_row(id)
+                    specimen_writer.writerow(row)
+                    if row["Latitude"] != "" and self._random.random() < 0.3:
+                        lat_long_writer.writerow(self._create_lat_long_row(row))
+        return specimens_file
+
+    def _create_row(self, id: int) -> dict[str, str]:
+        rand = self._random
+        taxon = rand.choice(_TAXA)
+        continent, country, state, county, localities = rand.choice(_PLACES)
+        locality = rand.choice(localities)
+        raw_date, year, month, day = self._create_date()
+        latitude, longitude = self._create_coordinates()
+        females = rand.choice([0, 0, 0, 1, 2, 5])
+        males = rand.choice([0, 0, 0, 1, 3])
+        immatures = rand.choice([0, 0, 1, 4, 12])
+
+        row = {column: "" for column in SPECIMEN_COLUMNS}
+        row["ID"] = str(id)
+        row["Proofed-JR"] = rand.choice(["", "", "x", "X"])
+        # Catalog numbers are mostly sequential, with gaps and duplicates.
+        row["Catalog Number"] = str(max(1, id + rand.choice([0, 0, 0, 0, 1, -1, 7])))
+        row["Phylum"] = taxon[0]
+        row["Class"] = taxon[1]
+        row["Subclass"] = taxon[2]
+        row["Order"] = taxon[3]
+        row["Suborder"] = taxon[4]
+        row["Infraorder"] = taxon[5]
+        row["Family"] = taxon[6]
+        row["Subfamily"] = taxon[7]
+        row["Genus"] = taxon[8]
+        row["Species/Author"] = taxon[9]
+        row["Subspecies"] = taxon[10]
+        if taxon[8] != "" and rand.random() < 0.1:
+            row["Species Name on Label"] = "%s %s" % (taxon[8], taxon[9].split(" ")[0])
+        row["Continent"] = continent
+        row["Country"] = country
+        row["State"] = state
+        row["County"] = county
+        row["Locality-Correct Name"] = locality
+        row["Locality as on label"] = (
+            locality if rand.random() < 0.8 else locality.replace("Cave", "cave")
+        )
+        row["Latitude"] = latitude
+        row["Longitude"] = longitude
+        if latitude != "":
+            row["Datum"] = rand.choice(_DATUMS)
+            row["coordinateUncertaintyInMeters"] = rand.choice(["", "", "10", "100"])
+        row["Owner"] = rand.choice(_OWNERS)
+        row["Microhabitat"] = rand.choice(_MICROHABITATS)
+        row["Date/Time"] = raw_date
+        row["Collector"] = self._create_agents(rand.choice([0, 1, 1, 1, 2, 2, 3]))
+        row["Females"] = str(females) if females else ""
+        row["Males"] = str(males) if males else ""
+        row["Immatures"] = str(immatures) if immatures else ""
+        row["Type Status"] = rand.choice(_TYPE_STATUSES)
+        row["Collection"] = rand.choice(_COLLECTIONS)
+        row["Identifier/Year"] = self._create_determiners()
+        row["Number of Specimens"] = str(females + males + immatures)
+        if year:
+            row["Collection Year"] = str(1900 + year)
+        if month:
+            row["Collection Month"] = str(month)
+        if day:
+            row["Collection Day"] = str(day)
+        row["misc_comments_notes"] = rand.choice(_NOTES)
+        return row
+
+    def _create_agents(self, count: int) -> str:
+        agents = self._random.sample(_AGENTS, count)
+        names = [self._random.choice(variants) for variants in agents]
+        if len(names) == 2 and self._random.random() < 0.3:
+            return " & ".join(names)
+        return "; ".join(names)
+
+    def _create_coordinates(self) -> tuple[str, str]:
+        rand = self._random
+        if rand.random() < 0.35:
+            return "", ""
+        latitude = rand.uniform(18.0, 34.0)
+        longitude = rand.uniform(88.0, 106.0)
+        # The last digit is never 0, as the precision is that of the digits shown.
+        digits = rand.choice([2, 3, 4, 4, 5, 5, 6])
+        latitude_str = "%.*f%d" % (digits - 1, latitude, rand.randint(1, 9))
+        longitude_str = "%.*f%d" % (digits - 1, longitude, rand.randint(1, 9))
+        if rand.random() < 0.8:
+            return latitude_str, "-" + longitude_str
+        return latitude_str + "N", longitude_str + "W"
+
+    def _create_date(self) -> tuple[str, int, int, int]:
+        # Returns the raw date along with its year (of the 1900s), month, and day,
+        # using 0 for values that the raw date doesn't provide.
+
+        rand = self._random
+        year = rand.randint(60, 99)
+        month = rand.randint(1, 12)
+        day = rand.randint(1, 28)
+        roman = _ROMAN_MONTHS[month - 1]
+        form = rand.random()
+        if form < 0.55:
+            return "%02d-%s-%d" % (year, roman, day), year, month, day
+        if form < 0.65:
+            return "%02d-%s-%d-%d" % (year, roman, day, day + 1), year, month, day
+        if form < 0.7:
+            next_roman = _ROMAN_MONTHS[month % 12]
+            return (
+                "%02d-%s-%d-%s-%d" % (year, roman, day, next_roman, 1),
+                year,
+                month,
+                day,
+            )
+        if form < 0.8:
+            return (
+                "%02d-%s-%d/%02d00" % (year, roman, day, rand.randint(6, 22)),
+                year,
+                month,
+                day,
+            )
+        if form < 0.88:
+            return "%d/%d/19%02d" % (month, day, year), year, month, day
+        if form < 0.95:
+            return "%02d-%s" % (year, roman), year, month, 0
+        return "", 0, 0, 0
+
+    def _create_determiners(self) -> str:
+        rand = self._random
+        if rand.random() < 0.4:
+            return ""
+        names = self._create_agents(rand.choice([1, 1, 1, 2]))
+        if rand.random() < 0.2:
+            return names
+        return "%s/%d" % (names, rand.randint(1965, 2015))
+
+    def _create_lat_long_row(self, row: dict[str, str]) -> dict[str, str]:
+        return {
+            "id": row["ID"],
+            "cat_num": row["Catalog Number"],
+            "latitude": "%.6f" % self._random.uniform(18.0, 34.0),
+            "longitude": "-%.6f" % self._random.uniform(88.0, 106.0),
+        }
+
+
+class _Generator:
+    def __init__(self):
+        self._dir_path: Optional[str] = None
+        self._row_count = 0
+        self._seed = 1
+
+    def main(self) -> None:
+        options: args.OptionsDict = {
+            "-s": self._parse_seed,
+            0: self._parse_dir_path,
+            1: self._parse_row_count,
+            None: self._parse_no_arguments,
+        }
+        try:
+            args.parse_args(options)
+            if self._dir_path is None or self._row_count == 0:
+                raise args.ArgException("Expected a directory and a row count")
+        except args.ArgException as e:
+            if e.message:
+                print(e.message)
+            print()
+            print("Writes a synthetic specimens.csv and reference-lat-longs.csv.")
+            print("  args: [-s=<seed>] <output-dir> <row-count>")
+            sys.exit(2)
+        SyntheticExport(self._row_count, self._seed).write(self._dir_path)
+
+    def _parse_dir_path(self, arg: str) -> None:
+        self._dir_path = args.expand_filename(arg)
+
+    def _parse_row_count(self, arg: str) -> None:
+        self._row_count = _parse_int(arg, "row count")
+
+    def _parse_seed(self, arg: str) -> None:
+        self._seed = _parse_int(arg, "seed")
+
+    def _parse_no_arguments(self, _arg: str) -> None:
+        raise args.ArgException()
+
+
+def _parse_int(arg: str, name: str) -> int:
+    try:
+        return int(arg)
+    except ValueError:
+        raise args.ArgException("Invalid %s '%s'" % (name, arg))
+
+
+if __name__ == "__main__":
+    _Generator().main()
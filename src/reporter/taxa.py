@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import Callable, Optional, TYPE_CHECKING, Union
+from typing import Callable, Iterable, Iterator, Optional, TYPE_CHECKING, Union
 from functools import partial
+import sys
 
 if TYPE_CHECKING:
     from src.reporter.specimen_record import SpecimenRecord
@@ -9,139 +10,180 @@ from src.util.states import States
 TaxonDelta = tuple[str, Optional[str]]
 TaxonGroup = tuple[list[TaxonDelta], list["SpecimenRecord"]]
 RestrictionFunc = Callable[["SpecimenRecord"], bool]
+TaxonSortKey = tuple[str, ...]
 
 NO_TAXON_STR = "--"
 
+TAXON_RANKS = [
+    "phylum",
+    "class",
+    "subclass",
+    "order",
+    "suborder",
+    "infraorder",
+    "family",
+    "subfamily",
+    "species",  # genus is rolled into species
+]
+
+
+class TaxonNode:
+    """Node of a TaxaTree representing a taxon at a particular rank. The nodes at the
+    species rank are the leaves, which combine genus and species and hold the records.
+    Each node aggregates the record and specimen counts of all records under it."""
+
+    def __init__(
+        self,
+        parent: Optional[TaxonNode],
+        rank: Optional[str],
+        taxon: Optional[str],
+        sort_key: TaxonSortKey,
+    ):
+        self.parent = parent
+        self.rank = rank  # None for the root
+        self.taxon = taxon  # cleaned taxon, None if not given
+        self.sort_key = sort_key  # orders the node among its siblings
+        self.record_count = 0
+        self.specimen_count = 0
+        self.records: list["SpecimenRecord"] = []  # only leaves have records
+        self._children: dict[TaxonSortKey, TaxonNode] = {}
+        self._sorted_children: Optional[list[TaxonNode]] = None
+
+    def add_child(
+        self, rank: str, taxon: Optional[str], sort_key: TaxonSortKey
+    ) -> TaxonNode:
+        child = TaxonNode(self, rank, taxon, sort_key)
+        self._children[sort_key] = child
+        self._sorted_children = None
+        return child
+
+    def get_child(self, sort_key: TaxonSortKey) -> Optional[TaxonNode]:
+        return self._children.get(sort_key)
+
+    def get_children(self) -> list[TaxonNode]:
+        if self._sorted_children is None:
+            self._sorted_children = sorted(
+                self._children.values(), key=lambda n: n.sort_key
+            )
+        return self._sorted_children
+
+    def get_path(self) -> list[Optional[str]]:
+        path: list[Optional[str]] = []
+        node = self
+        while node.parent is not None:
+            path.append(node.taxon)
+            node = node.parent
+        path.reverse()
+        return path
+
+    def get_record_ids(self) -> list[int]:
+        if self.rank == TAXON_RANKS[-1]:
+            return [r.id for r in self.records]
+        record_ids: list[int] = []
+        for child in self.get_children():
+            record_ids += child.get_record_ids()
+        return record_ids
+
+    def get_taxon_spec(self) -> str:
+        # Not a sortable key because it combines genus and species.
+        path = ["" if t is None else t for t in self.get_path()]
+        return " | ".join(path).replace("|  ", "| - ")
+
+
+class TaxaTree:
+    """Taxonomic trie of records from phylum down to genus-species. Groups of records
+    sharing a taxonomy are found by traversing the tree in taxonomic order rather
+    than by sorting and comparing the records. The tree for all records of a table
+    is built once and cached by the table."""
+
+    def __init__(self, records: Iterable["SpecimenRecord"] = ()):
+        self.root = TaxonNode(None, None, None, ())
+        self._leaves_by_record_id: dict[int, TaxonNode] = {}
+        for record in records:
+            self.add(record)
+
+    def add(self, record: "SpecimenRecord") -> TaxonNode:
+        taxon_key = record.taxon_key
+        leaf_index = len(TAXON_RANKS) - 1
+        node = self.root
+        node.record_count += 1
+        node.specimen_count += record.specimen_count
+        for i, rank in enumerate(TAXON_RANKS):
+            # The leaf is keyed by both genus and species.
+            sort_key = taxon_key[i:] if i == leaf_index else taxon_key[i : i + 1]
+            child = node.get_child(sort_key)
+            if child is None:
+                if i == leaf_index:
+                    taxon = to_clean_genus_species(
+                        record.genus, record.species, record.subspecies
+                    )
+                else:
+                    taxon = sort_key[0] if sort_key[0] != "" else None
+                child = node.add_child(rank, taxon, sort_key)
+            node = child
+            node.record_count += 1
+            node.specimen_count += record.specimen_count
+        node.records.append(record)
+        self._leaves_by_record_id[record.id] = node
+        return node
+
+    def get_leaf(self, record: "SpecimenRecord") -> TaxonNode:
+        return self._leaves_by_record_id[record.id]
+
+    def iter_groups(
+        self, predicate: Optional[RestrictionFunc] = None
+    ) -> Iterator[TaxonGroup]:
+        """Yields the records of each genus-species in taxonomic order, restricted
+        to the records satisfying the predicate, if given. Each group is paired with
+        the ranks that changed from the prior group and their new taxa. Records are
+        ordered by catalog number within each group."""
+
+        last_path: list[Optional[str]] = []
+        for leaf in self.iter_leaves():
+            if predicate is None:
+                records = leaf.records[:]
+            else:
+                records = [r for r in leaf.records if predicate(r)]
+            if not records:
+                continue
+
+            # A change in rank is a change in all the ranks below it.
+
+            path = leaf.get_path()
+            i = 0
+            while i < len(last_path) and path[i] == last_path[i]:
+                i += 1
+            deltas: list[TaxonDelta] = [
+                (TAXON_RANKS[j], path[j]) for j in range(i, len(path))
+            ]
+            last_path = path
+
+            records.sort(
+                key=lambda r: 0 if r.catalog_number is None else r.catalog_number
+            )
+            yield (deltas, records)
 
-class TaxaIterator:
+    def iter_leaves(self, node: Optional[TaxonNode] = None) -> Iterator[TaxonNode]:
+        if node is None:
+            node = self.root
+        for child in node.get_children():
+            if child.rank == TAXON_RANKS[-1]:
+                yield child
+            else:
+                yield from self.iter_leaves(child)
 
-    _UNRECOGNIZED = "!"
 
-    def __init__(self, records: list["SpecimenRecord"]):
-        self._records = records
-        self._record_index: int = 0
+class TaxaIterator:
+    """Iterates over groups of the given records in taxonomic order."""
 
-        for record in records:
-            record.sort_key = to_taxon_sort_key(record)
-        records.sort(key=lambda r: r.sort_key)
-
-        self._last_phylum: Optional[str] = self._UNRECOGNIZED
-        self._last_class: Optional[str] = self._UNRECOGNIZED
-        self._last_subclass: Optional[str] = self._UNRECOGNIZED
-        self._last_order: Optional[str] = self._UNRECOGNIZED
-        self._last_suborder: Optional[str] = self._UNRECOGNIZED
-        self._last_infraorder: Optional[str] = self._UNRECOGNIZED
-        self._last_family: Optional[str] = self._UNRECOGNIZED
-        self._last_subfamily: Optional[str] = self._UNRECOGNIZED
-        self._last_genus_species: Optional[str] = self._UNRECOGNIZED
-
-        if self._record_index < len(records):
-            record = records[self._record_index]
-            self._next_deltas = self._compute_deltas(record)
+    def __init__(self, records: list["SpecimenRecord"]):
+        self._groups = TaxaTree(records).iter_groups()
 
     def __iter__(self) -> TaxaIterator:
         return self
 
     def __next__(self) -> TaxonGroup:
-        if self._record_index == len(self._records):
-            raise StopIteration
-
-        record = self._records[self._record_index]
-        record_group: list["SpecimenRecord"] = []
-        current_deltas = self._next_deltas
-        self._next_deltas = []
-
-        while self._next_deltas == []:
-            record_group.append(record)
-            self._record_index += 1
-            if self._record_index == len(self._records):
-                break
-            record = self._records[self._record_index]
-            self._next_deltas = self._compute_deltas(record)
-
-        record_group.sort(
-            key=lambda r: 0 if r.catalog_number is None else r.catalog_number
-        )
-        return (current_deltas, record_group)
-
-    def _clear_class(self) -> None:
-        self._last_class = self._UNRECOGNIZED
-        self._clear_subclass()
-
-    def _clear_subclass(self) -> None:
-        self._last_subclass = self._UNRECOGNIZED
-        self._clear_order()
-
-    def _clear_order(self) -> None:
-        self._last_order = self._UNRECOGNIZED
-        self._clear_suborder()
-
-    def _clear_suborder(self) -> None:
-        self._last_suborder = self._UNRECOGNIZED
-        self._clear_infraorder()
-
-    def _clear_infraorder(self) -> None:
-        self._last_infraorder = self._UNRECOGNIZED
-        self._clear_family()
-
-    def _clear_family(self) -> None:
-        self._last_family = self._UNRECOGNIZED
-        self._clear_subfamily()
-
-    def _clear_subfamily(self) -> None:
-        self._last_subfamily = self._UNRECOGNIZED
-        self._clear_genus_species()
-
-    def _clear_genus_species(self) -> None:
-        self._last_genus_species = self._UNRECOGNIZED
-
-    def _compute_deltas(self, record: "SpecimenRecord") -> list[TaxonDelta]:
-        deltas: list[TaxonDelta] = []
-        taxon = clean_taxon(record.phylum)
-        if taxon != self._last_phylum:
-            deltas.append(("phylum", taxon))
-            self._last_phylum = taxon
-            self._clear_class()
-        taxon = clean_taxon(record.class_)
-        if taxon != self._last_class:
-            deltas.append(("class", taxon))
-            self._last_class = taxon
-            self._clear_subclass()
-        taxon = clean_taxon(record.subclass)
-        if taxon != self._last_subclass:
-            deltas.append(("subclass", taxon))
-            self._last_subclass = taxon
-            self._clear_order()
-        taxon = clean_taxon(record.order)
-        if taxon != self._last_order:
-            deltas.append(("order", taxon))
-            self._last_order = taxon
-            self._clear_suborder()
-        taxon = clean_taxon(record.suborder)
-        if taxon != self._last_suborder:
-            deltas.append(("suborder", taxon))
-            self._last_suborder = taxon
-            self._clear_infraorder()
-        taxon = clean_taxon(record.infraorder)
-        if taxon != self._last_infraorder:
-            deltas.append(("infraorder", taxon))
-            self._last_infraorder = taxon
-            self._clear_family()
-        taxon = clean_taxon(record.family)
-        if taxon != self._last_family:
-            deltas.append(("family", taxon))
-            self._last_family = taxon
-            self._clear_subfamily()
-        taxon = clean_taxon(record.subfamily)
-        if taxon != self._last_subfamily:
-            deltas.append(("subfamily", taxon))
-            self._last_subfamily = taxon
-            self._clear_genus_species()
-        taxon = to_clean_genus_species(record.genus, record.species, record.subspecies)
-        if taxon != self._last_genus_species:
-            deltas.append(("species", taxon))
-            self._last_genus_species = taxon
-        return deltas
+        return next(self._groups)
 
 
 def clean_or_empty_taxon(name: Optional[str]) -> str:
@@ -173,7 +215,7 @@ def clean_taxon(name: Optional[str]) -> Optional[str]:
             name = "new genus"
         elif lower_name.startswith("undescribed"):
             name = "undescribed"
-    return name
+    return name if name != "" else None
 
 
 def to_clean_genus_species(
@@ -182,7 +224,7 @@ def to_clean_genus_species(
     genus = clean_taxon(genus)
     species = clean_species(species, subspecies)
     if species is not None:
-        species = _strip_species_qualifier(species)
+        species = _strip_species_qualifier(species) or None
 
     if genus is None:
         if species is None:
@@ -199,21 +241,18 @@ def to_clean_genus_species(
     return genus_species
 
 
-def to_taxon_sort_key(record: SpecimenRecord) -> str:
+def to_taxon_key(record: SpecimenRecord) -> TaxonSortKey:
 
     # Must sort genus & species separately to put no-species designations
     # first, otherwise the 'sp.' gets sorted as if it were a species epithet.
+    # Empty (None) taxa are empty strings so that they sort before non-empty
+    # taxa. The strings are interned because so many records share them.
 
     component_taxa = _to_high_level_component_taxa(record)
     component_taxa.append(clean_or_empty_taxon(record.genus))
     species = clean_species(record.species, record.subspecies)
     component_taxa.append("" if species is None else _strip_species_qualifier(species))
-
-    # Delimit by a character that precedes all other characters, including space,
-    # so that empty (None) taxa list before non-empty taxa. Tab precedes all
-    # expected characters, while '|' follows all expected characters.
-
-    return "\t".join(component_taxa)
+    return tuple(sys.intern(taxon) for taxon in component_taxa)
 
 
 def to_taxon_spec(record: SpecimenRecord) -> str:
@@ -222,7 +261,7 @@ def to_taxon_spec(record: SpecimenRecord) -> str:
 
 
 def to_taxon_unique(
-    taxon_spec: Union[str, SpecimenRecord]
+    taxon_spec: Union[str, SpecimenRecord],
 ) -> tuple[str, RestrictionFunc, str]:
     restriction_func = _include_all
     restriction_abbr = ""
@@ -0,0 +1,45 @@
+from typing import Any
+
+from src.reporter.catalog_number_index import CatalogNumberIndex
+
+
+class TestCatalogNumberIndex:
+    def test_missing_ranges(self):
+
+        index = _index({2: [1], 3: [2], 7: [3], 9: [4], 10: [5]})
+        assert list(index.iter_missing_ranges()) == [(1, 1), (4, 6), (8, 8)]
+
+        index = _index({1: [1], 2: [2]})
+        assert list(index.iter_missing_ranges()) == []
+
+        index = _index({})
+        assert list(index.iter_missing_ranges()) == []
+
+    def test_duplicate_groups(self):
+
+        index = _index({9: [1, 2, 3], 2: [4], 5: [5, 6]})
+        groups = [(n, [r.id for r in rs]) for n, rs in index.iter_duplicate_groups()]
+        assert groups == [(5, [5, 6]), (9, [1, 2, 3])]
+
+    def test_records_in_range(self):
+
+        index = _index({1: [1], 4: [2, 3], 6: [4], 10: [5]})
+        assert [r.id for r in index.iter_records_in_range(2, 6)] == [2, 3, 4]
+        assert [r.id for r in index.iter_records_in_range(4, 4)] == [2, 3]
+        assert [r.id for r in index.iter_records_in_range(7, 9)] == []
+        assert [r.id for r in index.iter_records_in_range(0, 100)] == [1, 2, 3, 4, 5]
+        assert index.get_records(3) == []
+
+
+class _Record:
+    def __init__(self, id: int):
+        self.id = id
+
+
+def _index(record_ids_by_catalog_number: dict[int, list[int]]) -> Any:
+    return CatalogNumberIndex(
+        {
+            catalog_number: [_Record(id) for id in ids]
+            for catalog_number, ids in record_ids_by_catalog_number.items()
+        }  # type: ignore
+    )
@@ -0,0 +1,68 @@
+from decimal import Decimal, InvalidOperation
+import pytest
+
+from src.reporter.coordinate import Coordinate
+
+# Coordinate text, including text that Decimal prints in exponential notation.
+TEXTS = [
+    "29.1",
+    "-98.10",
+    "0.0",
+    "-0.0",
+    "+.5",
+    "029.10",
+    " 29.5 ",
+    "20. ",
+    "1_0.5",
+    "29.1e2",
+    "0.0000001",
+    "-0.001",
+    "0.005",
+    "0.015",
+    "-0.025",
+    "100.00",
+    "-97.8765432",
+]
+
+
+class TestCoordinate:
+    def test_matches_decimal(self):
+        for text in TEXTS:
+            dec = Decimal(text)
+            coordinate = Coordinate.parse(text)
+            assert str(coordinate) == str(dec), text
+            assert str(-coordinate) == str(dec * -1), text
+            assert float(coordinate) == float(dec), text
+            assert (coordinate >= 0) == (dec >= 0), text
+            assert str(coordinate.round(2)) == str(Decimal("{:.2f}".format(dec)))
+            assert coordinate.to_decimal() == dec
+
+    def test_comparisons(self):
+        coordinates = [Coordinate.parse(text) for text in TEXTS]
+        for coordinate1 in coordinates:
+            dec1 = coordinate1.to_decimal()
+            for coordinate2 in coordinates:
+                dec2 = coordinate2.to_decimal()
+                assert (coordinate1 == coordinate2) == (dec1 == dec2)
+                assert (coordinate1 < coordinate2) == (dec1 < dec2)
+                if coordinate1 == coordinate2:
+                    assert hash(coordinate1) == hash(coordinate2)
+        assert Coordinate.parse("-90.5") < -90
+        assert Coordinate.parse("90.0") == 90
+
+    def test_strip_zeros(self):
+        assert _strip_zeros("29.5400") == ("29.54", 2)
+        assert _strip_zeros("-98.0") == ("-98", 0)
+        assert _strip_zeros("0.000") == ("0", 0)
+        assert _strip_zeros("-0.00100") == ("-0.001", 3)
+        assert _strip_zeros("30.1234500") == ("30.12345", 5)
+
+    def test_invalid(self):
+        for text in ["", ".", "-.", "1.2.3", "--1.0", "abc.d"]:
+            with pytest.raises(InvalidOperation):
+                Coordinate.parse(text)
+
+
+def _strip_zeros(text: str) -> tuple[str, int]:
+    coordinate, digits = Coordinate.parse(text).strip_zeros()
+    return (str(coordinate), digits)
@@ -0,0 +1,50 @@
+from typing import Any, Optional
+
+from src.lib.partial_date import PartialDate
+from src.reporter.date_checks import check_collection_dates
+from src.reporter.james_date_time import JamesDateTime
+from src.reporter.record_issue import IssueCode, RecordIssue
+
+
+class TestDateChecks:
+    def test_column_disagreements(self):
+
+        records = [
+            _Record(PartialDate(1979, 9, 1), (1979, 9, 1)),
+            _Record(PartialDate(1979, 9, 1), (1980, 10, 2)),
+            _Record(PartialDate(1979, 9, 1), (0, 10, 2)),
+            _Record(PartialDate(1979, 9, 1), (0, 0, 2)),
+            _Record(PartialDate(1979, 9), (0, 9, 2)),
+            _Record(PartialDate(1979), (0, 0, 0)),
+            _Record(None, (1979, 0, 0)),
+        ]
+        check_collection_dates(records)  # type: ignore
+
+        assert [record.problems for record in records] == [
+            [],
+            ["Year column 1980 disagrees with parsed year 1979"],
+            ["Month column 10 disagrees with parsed month 9"],
+            ["Day column 2 disagrees with parsed day 1"],
+            [],
+            [],
+            [],
+        ]
+
+    def test_no_records(self):
+        check_collection_dates([])
+
+
+class _Record:
+    def __init__(
+        self, start_date: Optional[PartialDate], date_columns: tuple[int, int, int]
+    ):
+        self.date_time: Optional[JamesDateTime] = None
+        if start_date is not None:
+            self.date_time = JamesDateTime(start_date)
+        self.date_columns = date_columns
+        self.problems: list[str] = []
+
+    def add_problem(
+        self, code: IssueCode, *args: Any, field: Optional[str] = None
+    ) -> None:
+        self.problems.append(str(RecordIssue.create(code, field, args)))
@@ -613,6 +613,24 @@ class TestDates:
         assert_raises(ParseError, lambda: parse_dt("1, ,1"))
         assert_raises(ParseError, lambda: parse_dt("1,  ,1"))
 
+    def test_shared_parses(self):
+
+        dt = JamesDateTime.parse("79-IX-1/night")
+        assert dt is JamesDateTime.parse("79-IX-1/night")
+        assert dt == JamesDateTime(PartialDate(1979, 9, 1), None, None, "night")
+        state = dict(vars(dt))
+        assert dt.normalize("79-IX-1/night") == "1-IX-1979/night"
+        assert dt.normalize("") == "1-IX-1979"
+        assert dt.normalize("79-IX-1/night") == "1-IX-1979/night"
+        assert vars(dt) == state  # shared, so left unmodified
+
+        dt2 = dt.with_end_date(PartialDate(1979, 9, 3))
+        assert dt2.end_date == PartialDate(1979, 9, 3)
+        assert dt.end_date is None
+
+        assert_raises(ParseError, lambda: JamesDateTime.parse("1,,"))
+        assert_raises(ParseError, lambda: JamesDateTime.parse("1,,"))
+
 
 def parse_dt(s: str) -> JamesDateTime:
     return JamesDateTime().load(s)
@@ -0,0 +1,61 @@
+from typing import Any
+
+from src.lib.declared_names_table import DeclaredNamesTable
+from src.reporter import determiner_set
+from src.reporter.determiner_set import DeterminerSet
+from src.reporter.record_issue import RecordIssue
+
+
+class TestDeterminerSet:
+    def test_shared_parses(self):
+
+        table = DeclaredNamesTable()
+        record1 = _Record()
+        record2 = _Record()
+        set1 = DeterminerSet().load(table, record1, "Reddell, J./1990")  # type: ignore
+        set2 = DeterminerSet().load(table, record2, "Reddell, J./1990")  # type: ignore
+        assert set1.determiners is not None and set2.determiners is not None
+        assert str(set1.determiners[0]) == "Reddell, J."
+        assert set1.year == set2.year == "1990"
+        assert set1.determiners[0] is not set2.determiners[0]
+        assert set1.determiners[0].get_raw_names() == ["Reddell, J."]
+
+        set1 = DeterminerSet().load(table, record1, "Reddell 12 /1990")  # type: ignore
+        set2 = DeterminerSet().load(table, record2, "Reddell 12 /1990")  # type: ignore
+        assert set1.determiners is None
+        assert record1.problems == ["unexpected number(s) '12' in determiner"]
+        assert record2.problems == record1.problems
+
+    def test_parse_cache_size(self, monkeypatch: Any):
+
+        monkeypatch.setattr(determiner_set, "PARSE_CACHE_SIZE", 2)
+        table = DeclaredNamesTable()
+        for raw_text in ["Reddell, J./1990", "Elliott, W./1991", "Reddell, J./1992"]:
+            DeterminerSet().load(table, _Record(), raw_text)  # type: ignore
+        assert list(DeterminerSet._parses.keys()) == [
+            "Elliott, W./1991",
+            "Reddell, J./1992",
+        ]
+
+    def test_corrections(self):
+
+        record = _Record()
+        determiner_set = DeterminerSet().load(
+            DeclaredNamesTable(), record, "Shell1y, A./;1j982"  # type: ignore
+        )
+        assert determiner_set.determiners is not None
+        assert str(determiner_set.determiners[0]) == "Shelley, A."
+        assert determiner_set.year == "1982"
+        assert record.problems == []
+
+
+class _Record:
+    def __init__(self):
+        self.problems: list[str] = []
+        self.warnings: list[str] = []
+
+    def add_issues(
+        self, problems: list[RecordIssue], warnings: list[RecordIssue]
+    ) -> None:
+        self.problems.extend(str(problem) for problem in problems)
+        self.warnings.extend(str(warning) for warning in warnings)
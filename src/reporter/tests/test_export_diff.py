@@ -0,0 +1,106 @@
+from typing import Any
+
+from src.reporter import export_diff
+from src.reporter.export_diff import ExportDiff
+
+
+class TestExportDiff:
+    def test_record_changes(self, tmp_path: Any):
+
+        prior_file = _write_csv(
+            tmp_path / "prior.csv",
+            [
+                "ID,Catalog Number,Genus",
+                "1,10,Rhadine",
+                "2,20,Cicurina",
+                "3,30,Eurycea",
+            ],
+        )
+        revised_file = _write_csv(
+            tmp_path / "revised.csv",
+            ["ID,Catalog Number,Genus", "1,10,Rhadine", "3,31,Eurycia", "4,40,Texella"],
+        )
+        diff = ExportDiff(prior_file, revised_file)
+
+        assert diff.added_ids == [4]
+        assert diff.removed_ids == [2]
+        assert diff.modified_ids == [3]
+        assert diff.get_changed_ids() == {3, 4}
+        assert list(diff.iter_field_changes()) == [
+            (3, [("Catalog Number", "30", "31"), ("Genus", "Eurycea", "Eurycia")])
+        ]
+
+    def test_column_changes(self, tmp_path: Any):
+
+        prior_file = _write_csv(
+            tmp_path / "prior.csv",
+            ["ID,Catalog Number,Genus", "1,10,", "2,20,Cicurina", "3,_END_,"],
+        )
+        revised_file = _write_csv(
+            tmp_path / "revised.csv",
+            ["Catalog Number,ID,Genus,Notes", "10,1,,", "20,2,Cicurina,new"],
+        )
+        diff = ExportDiff(prior_file, revised_file)
+
+        assert diff.added_ids == []
+        assert diff.removed_ids == []
+        assert diff.modified_ids == [2]
+        assert list(diff.iter_field_changes()) == [(2, [("Notes", "", "new")])]
+
+    def test_invalid_ids(self, tmp_path: Any):
+
+        prior_file = _write_csv(
+            tmp_path / "prior.csv",
+            ["ID,Catalog Number,Genus", "1,10,Rhadine", ",11,Cicurina", "x,12,"],
+        )
+        revised_file = _write_csv(
+            tmp_path / "revised.csv",
+            ["ID,Catalog Number,Genus", "1,10,Rhadina", " ,11,Cicurina"],
+        )
+        diff = ExportDiff(prior_file, revised_file)
+
+        assert diff.invalid_prior_ids == ["", "x"]
+        assert diff.invalid_revised_ids == [" "]
+        assert diff.modified_ids == [1]
+        assert list(diff.iter_field_changes()) == [
+            (1, [("Genus", "Rhadine", "Rhadina")])
+        ]
+
+    def test_extra_fields(self, tmp_path: Any):
+
+        prior_file = _write_csv(
+            tmp_path / "prior.csv",
+            ["ID,Catalog Number,Genus", "1,10,Rhadine,x", "2,20,Cicurina"],
+        )
+        revised_file = _write_csv(
+            tmp_path / "revised.csv",
+            ["ID,Catalog Number,Genus", "1,10,Rhadine,x", "2,20,Cicurina,y,z"],
+        )
+        diff = ExportDiff(prior_file, revised_file)
+
+        assert diff.modified_ids == [2]
+        assert list(diff.iter_field_changes()) == [(2, [("(extra fields)", "", "y,z")])]
+
+    def test_unordered_exports(self, tmp_path: Any, monkeypatch: Any):
+
+        prior_file = _write_csv(
+            tmp_path / "prior.csv",
+            ["ID,Catalog Number,Genus", "3,30,Eurycea", "1,10,Rhadine", "2,20,"],
+        )
+        revised_file = _write_csv(
+            tmp_path / "revised.csv",
+            ["ID,Catalog Number,Genus", "1,11,Rhadine", "2,20,Cicurina", "3,30,"],
+        )
+        monkeypatch.setattr(export_diff, "BATCH_RECORD_COUNT", 2)
+        diff = ExportDiff(prior_file, revised_file)
+
+        assert sorted(diff.iter_field_changes()) == [
+            (1, [("Catalog Number", "10", "11")]),
+            (2, [("Genus", "", "Cicurina")]),
+            (3, [("Genus", "Eurycea", "")]),
+        ]
+
+
+def _write_csv(path: Any, lines: list[str]) -> str:
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
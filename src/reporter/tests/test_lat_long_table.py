@@ -0,0 +1,80 @@
+from typing import Any, Optional
+import os
+
+from src.reporter.lat_long_table import LatLongTable
+
+CSV_ROWS = [
+    "id,cat_num,latitude,longitude",
+    "30,3,-0.0,-98.50000",
+    "10,1,30.12300,-97.1",
+    "20,2,,",
+    "40,4,29.5,",
+]
+
+
+class TestLatLongTable:
+    def test_lookup(self, tmp_path: Any):
+
+        csv_filename = str(tmp_path / "reference-lat-longs.csv")
+        _write_csv(csv_filename, CSV_ROWS)
+        for _ in range(2):  # parses the CSV, then loads the index
+            table = LatLongTable(csv_filename)
+            table.load()
+            assert os.path.exists(csv_filename + ".index")
+            assert len(table) == 3
+            _check_coordinates(table, 10, "30.12300", "-97.1")
+            _check_coordinates(table, 30, "-0.0", "-98.50000")
+            _check_coordinates(table, 40, "29.5", None)
+            assert table.get_coordinates(20) is None
+            assert table.get_coordinates(5) is None
+            assert table.get_coordinates(50) is None
+
+    def test_oversized_coordinates(self, tmp_path: Any):
+
+        csv_filename = str(tmp_path / "reference-lat-longs.csv")
+        _write_csv(csv_filename, CSV_ROWS + ["50,5,0.000000001,98765432109876543210.5"])
+        table = LatLongTable(csv_filename)
+        table.load()
+        assert not os.path.exists(csv_filename + ".index")
+        assert len(table) == 4
+        _check_coordinates(table, 10, "30.12300", "-97.1")
+        _check_coordinates(table, 50, "1E-9", "98765432109876543210.5")
+
+    def test_index_regeneration(self, tmp_path: Any):
+
+        csv_filename = str(tmp_path / "reference-lat-longs.csv")
+        _write_csv(csv_filename, CSV_ROWS)
+        LatLongTable(csv_filename).load()
+
+        # Changing the CSV rebuilds the index.
+        _write_csv(csv_filename, CSV_ROWS + ["5,6,10.25,20.5"])
+        for _ in range(2):
+            table = LatLongTable(csv_filename)
+            table.load()
+            assert len(table) == 4
+            _check_coordinates(table, 5, "10.25", "20.5")
+
+        # A damaged index is ignored and rebuilt.
+        with open(csv_filename + ".index", "r+b") as file:
+            file.truncate(40)
+        for _ in range(2):
+            table = LatLongTable(csv_filename)
+            table.load()
+            assert len(table) == 4
+            _check_coordinates(table, 40, "29.5", None)
+
+
+def _check_coordinates(
+    table: LatLongTable,
+    record_id: int,
+    latitude: Optional[str],
+    longitude: Optional[str],
+) -> None:
+    lat_long = table.get_coordinates(record_id)
+    assert lat_long is not None
+    assert [None if c is None else str(c) for c in lat_long] == [latitude, longitude]
+
+
+def _write_csv(filename: str, rows: list[str]) -> None:
+    with open(filename, "w") as file:
+        file.write("\n".join(rows) + "\n")
@@ -0,0 +1,92 @@
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+
+from src.lib.partial_date import PartialDate
+from src.reporter.james_date_time import JamesDateTime
+from src.reporter.record_columns import MISSING_INT, RecordColumns
+from src.reporter.record_filter import RecordFilter
+
+
+class TestRecordColumns:
+    def test_columns(self):
+
+        records = [
+            _Record(1, 100, "Texas", ["Biospeleology"], PartialDate(1979), 3, "35.1"),
+            _Record(2, None, "Alabama", ["Other"], None, None, None),
+            _Record(
+                3, 102, None, ["Biospeleology", "Other"], PartialDate(1980), 2, "-1"
+            ),
+            _Record(4, 103, "Texas", ["Biospeleology"], PartialDate(1981), 5, "0"),
+        ]
+        columns = RecordColumns(records)  # type: ignore
+
+        assert columns.id.tolist() == [1, 2, 3, 4]
+        assert columns.catalog_number.tolist() == [100, MISSING_INT, 102, 103]
+        assert columns.females.tolist() == [3, 0, 2, 5]
+        assert columns.year.tolist() == [1979, MISSING_INT, 1980, 1981]
+        assert columns.latitude[0] == 35.1
+        assert np.isnan(columns.latitude[1])
+        assert np.isnan(columns.accuracy_meters).all()
+
+        assert columns.state.categories == ["Alabama", "Texas"]
+        assert columns.state.codes.tolist() == [1, 0, MISSING_INT, 1]
+        assert columns.state.get_mask("Texas").tolist() == [True, False, False, True]
+        assert not columns.state.get_mask("Utah").any()
+        assert columns.state.sum_by_category(columns.females) == {
+            "Alabama": 0,
+            "Texas": 8,
+        }
+        assert columns.collection.categories == [
+            "Biospeleology",
+            "Biospeleology, Other",
+            "Other",
+        ]
+
+        mask = columns.get_filter_mask(_DatedRecordFilter())
+        assert mask.tolist() == [True, False, True, True]
+        assert columns.females[mask].sum() == 10
+
+    def test_no_records(self):
+        columns = RecordColumns([])
+        assert len(columns.id) == 0
+        assert columns.country.categories == []
+        assert columns.country.sum_by_category(columns.males) == {}
+
+
+class _DatedRecordFilter(RecordFilter):
+    def __init__(self):
+        super().__init__("dated")
+
+    def test(self, record) -> bool:
+        return record.date_time is not None
+
+
+class _Record:
+    def __init__(
+        self,
+        id: int,
+        catalog_number: Optional[int],
+        state: Optional[str],
+        collections: list[str],
+        start_date: Optional[PartialDate],
+        females: Optional[int],
+        latitude: Optional[str],
+    ):
+        self.id = id
+        self.catalog_number = catalog_number
+        self.specimen_count = females or 0
+        self.females = females
+        self.males: Optional[int] = None
+        self.immatures: Optional[int] = None
+        self.latitude = None if latitude is None else Decimal(latitude)
+        self.longitude = None if latitude is None else Decimal(latitude)
+        self.accuracy_meters: Optional[int] = None
+        self.country = "United States"
+        self.state = state
+        self.county: Optional[str] = None
+        self.collections = collections
+        self.date_time: Optional[JamesDateTime] = None
+        if start_date is not None:
+            self.date_time = JamesDateTime(start_date)
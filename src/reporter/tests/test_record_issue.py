@@ -0,0 +1,61 @@
+import pickle
+
+from src.reporter.lat_long_record import LatLongRecord
+from src.reporter.record_issue import IssueCode, IssueIndex, RecordIssue
+
+
+class TestRecordIssue:
+    def test_descriptions(self):
+
+        record = LatLongRecord("1", "x", "95.5", "")
+        assert [str(issue) for issue in record.get_problems()] == [
+            "catalog number 'x' is not an integer",
+            "invalid catalog number 'x'",
+            "latitude '95.5' out of range",
+            "latitude specified but not also longitude",
+        ]
+        assert record.get_problems()[0].code == IssueCode.NOT_AN_INTEGER
+        assert record.get_problems()[0].field == "catalog number"
+        assert record.get_problems()[0].args == ("x",)
+        assert record.get_warnings() == []
+
+        issue = RecordIssue.create(
+            IssueCode.INVALID_DATE, "eventDate", ("bad month", "13/1/1990")
+        )
+        assert str(issue) == "bad month (eventDate '13/1/1990')"
+
+    def test_shared_issues(self):
+
+        issue1 = RecordIssue.create(IssueCode.MISSING_COUNTRY, None, ())
+        issue2 = RecordIssue.create(IssueCode.MISSING_COUNTRY, None, ())
+        assert issue1 is issue2
+        assert pickle.loads(pickle.dumps(issue1)) is issue1
+
+        issue1 = RecordIssue.create(IssueCode.MISSING_STATE, None, ("USA",))
+        issue2 = pickle.loads(pickle.dumps(issue1))
+        assert issue2 is not issue1
+        assert str(issue2) == str(issue1) == "missing state in USA"
+
+    def test_index(self):
+
+        records = [
+            LatLongRecord("1", "1", "30.5", "-97.5"),
+            LatLongRecord("2", "2", "95.5", ""),
+            LatLongRecord("3", "0", "", "-97.5"),
+            LatLongRecord("4", "4", "", "-200.5"),
+        ]
+        records[0].add_warning(IssueCode.MISSING_DATE, "missing date")
+        records[2].add_warning(IssueCode.MISSING_DATE, "missing date")
+        records[2].add_warning(IssueCode.MISSING_DATE, "missing date")
+        index = IssueIndex(records)
+        assert index.get_codes() == [
+            IssueCode.INVALID_CATALOG_NUMBER,
+            IssueCode.LATITUDE_OUT_OF_RANGE,
+            IssueCode.LONGITUDE_OUT_OF_RANGE,
+            IssueCode.LATITUDE_WITHOUT_LONGITUDE,
+            IssueCode.LONGITUDE_WITHOUT_LATITUDE,
+            IssueCode.MISSING_DATE,
+        ]
+        assert index.get_record_ids(IssueCode.LONGITUDE_WITHOUT_LATITUDE) == [3, 4]
+        assert index.get_record_ids(IssueCode.MISSING_DATE) == [1, 3]
+        assert index.get_record_ids(IssueCode.NO_COLLECTORS) == []
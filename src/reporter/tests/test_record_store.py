@@ -0,0 +1,69 @@
+from typing import Any
+
+from src.lib.declared_names_table import DeclaredNamesTable
+import src.reporter.record_store as record_store
+from src.reporter.james_table import JamesTable
+from src.reporter.record_filter import AllRecordsFilter
+from src.reporter.record_store import RecordStore
+from src.reporter.synthetic_csv import SyntheticExport
+
+
+class TestRecordStore:
+    def test_write_and_query(self, tmp_path: Any, monkeypatch: Any):
+
+        specimens_file = SyntheticExport(300).write(str(tmp_path))
+        table = JamesTable(
+            str(tmp_path / "reference-lat-longs.csv"),
+            specimens_file,
+            DeclaredNamesTable(),
+        )
+        table.load()
+        table.summarize(AllRecordsFilter())
+        table.revise_names(unify_names_by_sound=False, merge_with_reference_names=False)
+        monkeypatch.setattr(record_store, "BATCH_RECORD_COUNT", 70)
+
+        store = RecordStore(str(tmp_path / "records.db"))
+        store.write_table(table)
+        store.write_table(table)  # replaces the prior tables
+        (count,) = store.query("SELECT COUNT(*) FROM records")[0]
+        assert count == len(table.records)
+
+        record = next(r for r in table.records if r.collectors and r.county)
+        collector = record.collectors[0].get_lnf_primary()
+        rows = store.query(
+            "SELECT r.id FROM records r"
+            " JOIN localities l ON l.id = r.locality_id"
+            " JOIN record_collectors rc ON rc.record_id = r.id"
+            " JOIN identities i ON i.id = rc.identity_id"
+            " WHERE i.name = ? AND l.county = ?",
+            (collector, record.county),
+        )
+        assert sorted(row["id"] for row in rows) == sorted(
+            r.id
+            for r in table.records
+            if r.county == record.county
+            and r.collectors
+            and collector in [c.get_lnf_primary() for c in r.collectors]
+        )
+
+        rows = store.query(
+            "SELECT t.taxon_unique FROM records r JOIN taxa t ON t.id = r.taxon_id"
+            " WHERE r.id = ?",
+            (record.id,),
+        )
+        assert rows[0]["taxon_unique"] == record.taxon_unique
+
+        rows = store.query(
+            "SELECT DISTINCT typeof(determination_year) FROM records"
+            " WHERE determination_year IS NOT NULL"
+        )
+        assert [tuple(row) for row in rows] == [("integer",)]
+        (count,) = store.query(
+            "SELECT COUNT(*) FROM records WHERE determination_year > 1990"
+        )[0]
+        assert count == sum(
+            1
+            for r in table.records
+            if r.identifier_year.year is not None and int(r.identifier_year.year) > 1990
+        )
+        store.close()
@@ -0,0 +1,31 @@
+from typing import Any
+
+from src.lib.declared_names_table import DeclaredNamesTable
+from src.reporter.james_table import JamesTable
+from src.reporter.synthetic_csv import SyntheticExport
+
+
+class TestSyntheticCsv:
+    def test_repeatable(self, tmp_path: Any):
+
+        file1 = SyntheticExport(50, seed=7).write(str(tmp_path / "a"))
+        file2 = SyntheticExport(50, seed=7).write(str(tmp_path / "b"))
+        file3 = SyntheticExport(50, seed=8).write(str(tmp_path / "c"))
+        with open(file1) as f1, open(file2) as f2, open(file3) as f3:
+            text1 = f1.read()
+            assert text1 == f2.read()
+            assert text1 != f3.read()
+
+    def test_loadable(self, tmp_path: Any):
+
+        specimens_file = SyntheticExport(200).write(str(tmp_path))
+        table = JamesTable(
+            str(tmp_path / "reference-lat-longs.csv"),
+            specimens_file,
+            DeclaredNamesTable(),
+        )
+        table.load()
+        assert len(table.records) + len(table.empty_record_ids) == 200
+        assert any(r.collectors for r in table.records)
+        assert any(r.normalized_date_time for r in table.records)
+        assert any(r.latitude is not None for r in table.records)
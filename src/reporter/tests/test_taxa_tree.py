@@ -0,0 +1,111 @@
+from typing import Any, Optional
+
+from src.reporter.taxa import TaxaTree, NO_TAXON_STR, to_taxon_key
+
+
+class TestTaxaTree:
+    def test_group_order_and_deltas(self):
+
+        r1 = _record(1, 30, "Arthropoda", "Insecta", "Coleoptera", "Rhadine", "n. sp.")
+        r2 = _record(2, 20, "Arthropoda", "Arachnida", "Araneae", "Cicurina", None)
+        r3 = _record(3, 10, "Arthropoda", "Arachnida", "Araneae", "Cicurina", "varians")
+        r4 = _record(4, 5, "Arthropoda", "Arachnida", "Araneae", "Cicurina", None)
+        r5 = _record(5, 1, "Mollusca", None, None, None, None)
+        tree = TaxaTree([r1, r2, r3, r4, r5])
+
+        groups = list(tree.iter_groups())
+        assert [[r.id for r in g[1]] for g in groups] == [[4, 2], [3], [1], [5]]
+
+        deltas = groups[0][0]
+        assert len(deltas) == 9
+        assert deltas[0] == ("phylum", "Arthropoda")
+        assert deltas[-1] == ("species", "Cicurina sp.")
+        assert groups[1][0] == [("species", "Cicurina varians")]
+        assert groups[2][0][0] == ("class", "Insecta")
+        assert len(groups[2][0]) == 8
+        assert groups[3][0][0] == ("phylum", "Mollusca")
+        assert groups[3][0][-1] == ("species", NO_TAXON_STR)
+
+    def test_restricted_groups(self):
+
+        r1 = _record(1, 30, "Arthropoda", "Insecta", "Coleoptera", "Rhadine", None)
+        r2 = _record(2, 20, "Arthropoda", "Arachnida", "Araneae", "Cicurina", None)
+        r3 = _record(3, 10, "Arthropoda", "Insecta", "Coleoptera", "Rhadine", None)
+        tree = TaxaTree([r1, r2, r3])
+
+        groups = list(tree.iter_groups(lambda r: r.id != 2))
+        assert len(groups) == 1
+        assert [r.id for r in groups[0][1]] == [3, 1]
+        assert len(groups[0][0]) == 9  # all ranks reported for first group
+
+    def test_aggregates(self):
+
+        r1 = _record(1, 30, "Arthropoda", "Insecta", "Coleoptera", "Rhadine", None, 4)
+        r2 = _record(2, 20, "Arthropoda", "Arachnida", "Araneae", "Cicurina", None, 2)
+        r3 = _record(3, 10, "Arthropoda", "Insecta", "Coleoptera", "Rhadine", None, 1)
+        tree = TaxaTree([r1, r2, r3])
+
+        assert tree.root.record_count == 3
+        assert tree.root.specimen_count == 7
+        arthropoda = tree.root.get_child(("Arthropoda",))
+        assert arthropoda is not None
+        insecta = arthropoda.get_child(("Insecta",))
+        assert insecta is not None
+        assert insecta.record_count == 2
+        assert insecta.specimen_count == 5
+        assert insecta.get_record_ids() == [1, 3]
+
+        leaf = tree.get_leaf(r1)
+        assert leaf.taxon == "Rhadine sp."
+        assert leaf is tree.get_leaf(r3)
+        assert leaf.get_taxon_spec() == (
+            "Arthropoda | Insecta | - | Coleoptera | - | - | - | - | Rhadine sp."
+        )
+
+    def test_blank_taxa(self):
+
+        r1 = _record(1, 10, "Arthropoda", "Insecta", "Coleoptera", "Rhadine", "(?)")
+        r2 = _record(2, 20, "Arthropoda", "Insecta", "Coleoptera", "Rhadine", None)
+        r3 = _record(3, 30, "Arthropoda", "Insecta", "Coleoptera", "?", None)
+        r4 = _record(4, 40, "Arthropoda", "Insecta", "Coleoptera", None, None)
+        tree = TaxaTree([r1, r2, r3, r4])
+
+        assert tree.get_leaf(r1) is tree.get_leaf(r2)
+        assert tree.get_leaf(r1).taxon == "Rhadine sp."
+        assert tree.get_leaf(r3) is tree.get_leaf(r4)
+        assert tree.get_leaf(r3).taxon == NO_TAXON_STR
+
+
+class _Record:
+    def __init__(self, **kwargs: Any):
+        self.__dict__.update(kwargs)
+
+
+def _record(
+    id: int,
+    catalog_number: int,
+    phylum: str,
+    class_: Optional[str],
+    order: Optional[str],
+    genus: Optional[str],
+    species: Optional[str],
+    specimen_count: int = 1,
+) -> Any:
+    record = _Record(
+        id=id,
+        catalog_number=catalog_number,
+        phylum=phylum,
+        class_=class_,
+        subclass=None,
+        order=order,
+        suborder=None,
+        infraorder=None,
+        family=None,
+        subfamily=None,
+        genus=genus,
+        species=species,
+        subspecies=None,
+        specimen_count=specimen_count,
+    )
+    record.taxon_key = to_taxon_key(record)
+    return record
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from typing import Iterator
+from collections import deque
+
+
+class AhoCorasick:
+    """Automaton that finds all occurrences of a fixed set of strings in a single
+    scan of the text. Patterns are identified by their index in the list given
+    to the constructor. Empty patterns are never reported."""
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = patterns
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[list[int]] = [[]]
+
+        # Build a trie of the patterns.
+
+        for pattern_index, pattern in enumerate(patterns):
+            if pattern == "":
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._outputs[state].append(pattern_index)
+
+        # Link each state to the state of its longest proper suffix, breadth-first
+        # so that shorter suffixes are linked first, inheriting their outputs.
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail_state = self._fail[state]
+                while fail_state > 0 and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                suffix_state = self._goto[fail_state].get(char, 0)
+                self._fail[next_state] = suffix_state
+                self._outputs[next_state] += self._outputs[suffix_state]
+
+    def find_first_offsets(self, text: str) -> dict[int, int]:
+        """Returns a map of the index of each pattern occurring in the text to the
+        start offset of the pattern's first occurrence."""
+        first_offsets: dict[int, int] = {}
+        for start_offset, pattern_index in self.iter_matches(text):
+            if pattern_index not in first_offsets:
+                first_offsets[pattern_index] = start_offset
+        return first_offsets
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yields (start offset, pattern index) for every occurrence of every
+        pattern in the text, in order of the occurrences' end offsets."""
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        patterns = self.patterns
+        state = 0
+        for offset, char in enumerate(text):
+            while state > 0 and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_index in outputs[state]:
+                yield offset + 1 - len(patterns[pattern_index]), pattern_index
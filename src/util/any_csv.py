@@ -1,10 +1,44 @@
-from typing import Callable
+from typing import Any, Callable, Iterator, Optional
 import csv
+import hashlib
 
 RowReceiver = Callable[[dict[str, str]], bool]
 
+# Name given to the fields of a row beyond those of the header, which DictReader
+# keeps as a list under the key None.
+EXTRA_FIELDS_COLUMN = "\x00extra"
 
-def load_csv(filename: str, receive_row: RowReceiver) -> None:
+
+def get_column_name(column: Optional[str]) -> str:
+    """Returns the name of the column, naming the extra fields for column None."""
+    return EXTRA_FIELDS_COLUMN if column is None else column
+
+
+def get_row_value(row: dict[Any, Any], column: Optional[str]) -> str:
+    """Returns the row's value for the column, or for column None, its extra
+    fields joined by commas, or "" if the row has no value for the column."""
+    value = row.get(column)
+    if value is None:
+        return ""
+    if column is None:
+        return ",".join(value)
+    return value
+
+
+def hash_row(row: dict[str, str]) -> bytes:
+    """Returns a 16-byte hash of the row's non-empty values along with their column
+    names, so that neither column order nor columns lacking values affect it.
+    Fields beyond those of the header are hashed together as one value."""
+    row_hash = hashlib.blake2b(digest_size=16)
+    for column in sorted(row.keys(), key=get_column_name):
+        value = get_row_value(row, column)
+        if value:
+            name = get_column_name(column)
+            row_hash.update(("%s\x1e%s\x1f" % (name, value)).encode("utf-8"))
+    return row_hash.digest()
+
+
+def iter_csv(filename: str) -> Iterator[dict[str, str]]:
     with open(filename) as raw_file:
         first_line = raw_file.readline()
     with open(filename, newline="", encoding="utf-8-sig") as csv_file:
@@ -15,5 +49,10 @@ def load_csv(filename: str, receive_row: RowReceiver) -> None:
         else:
             reader = csv.DictReader(csv_file, dialect="excel")
         for row in reader:
-            if not receive_row(row):
-                break  # reached end of valid records
+            yield row
+
+
+def load_csv(filename: str, receive_row: RowReceiver) -> None:
+    for row in iter_csv(filename):
+        if not receive_row(row):
+            break  # reached end of valid records
@@ -17,11 +17,13 @@ def expand_filename(filename: str) -> str:
     return filename
 
 
-def parse_args(options: OptionsDict) -> None:
+def parse_args(options: OptionsDict, argv: Optional[list[str]] = None) -> None:
+    if argv is None:
+        argv = sys.argv
 
     # Handle the case where there are no command line arguments.
 
-    if len(sys.argv) == 1:
+    if len(argv) == 1:
         if None in options:
             options[None]("")
         return  # not necessary, but makes code clearer
@@ -29,7 +31,7 @@ def parse_args(options: OptionsDict) -> None:
     # Parse option arguments and collect filename arguments.
 
     nonswitch_args: list[str] = []
-    for i, arg in enumerate(sys.argv):
+    for i, arg in enumerate(argv):
         if i == 0:
             continue  # skip name of executing file
         if arg[0] == "-":
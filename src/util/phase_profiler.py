@@ -0,0 +1,103 @@
+from __future__ import annotations
+from typing import Iterator, Optional, TextIO
+from contextlib import contextmanager
+import cProfile
+import resource
+import sys
+import time
+import tracemalloc
+
+ALLOCATION_TRACE_DEPTH = 1  # number of frames kept per traced allocation
+
+
+class PhaseProfiler:
+    """Measures the wall time and the peak memory of the successive phases of a
+    run. The peak memory is the process' maximum resident set size as of the end
+    of each phase. Optionally also profiles the phases' calls with cProfile, for
+    saving to a pstats file, and traces their allocations with tracemalloc, for
+    showing the phase's peak of traced memory and the top allocation sites."""
+
+    class Phase:
+        def __init__(self, name: str, seconds: float):
+            self.name = name
+            self.seconds = seconds
+            self.max_rss_bytes = _get_max_rss_bytes()
+            self.traced_peak_bytes: Optional[int] = None
+
+    def __init__(self, pstats_file: Optional[str] = None, allocation_count: int = 0):
+        self._pstats_file = pstats_file
+        self._allocation_count = allocation_count
+        self._phases: list[PhaseProfiler.Phase] = []
+        self._profile: Optional[cProfile.Profile] = None
+        if pstats_file is not None:
+            self._profile = cProfile.Profile()
+        if allocation_count > 0:
+            tracemalloc.start(ALLOCATION_TRACE_DEPTH)
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        """Records a phase that was timed before profiling began."""
+        self._phases.append(self.Phase(name, seconds))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measures the phase that runs in the context."""
+        if self._allocation_count > 0:
+            tracemalloc.reset_peak()
+        if self._profile is not None:
+            self._profile.enable()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start_time
+            if self._profile is not None:
+                self._profile.disable()
+            phase = self.Phase(name, seconds)
+            if self._allocation_count > 0:
+                phase.traced_peak_bytes = tracemalloc.get_traced_memory()[1]
+            self._phases.append(phase)
+
+    def finish(self, out: TextIO) -> None:
+        """Writes the measurements of the phases to the given stream, saving the
+        cProfile stats and showing the top allocation sites, if requested."""
+
+        tracing = self._allocation_count > 0
+        header = "%-18s %10s %14s" % ("phase", "seconds", "peak RSS MB")
+        if tracing:
+            header += " %14s" % "traced MB"
+        print("\n" + header, file=out)
+        total_seconds = 0.0
+        for phase in self._phases:
+            total_seconds += phase.seconds
+            line = "%-18s %10.3f %14.1f" % (
+                phase.name,
+                phase.seconds,
+                phase.max_rss_bytes / 1e6,
+            )
+            if phase.traced_peak_bytes is not None:
+                line += " %14.1f" % (phase.traced_peak_bytes / 1e6)
+            print(line, file=out)
+        print("%-18s %10.3f" % ("total", total_seconds), file=out)
+
+        if self._profile is not None:
+            assert self._pstats_file is not None
+            self._profile.dump_stats(self._pstats_file)
+            print("\nWrote cProfile stats to %s" % self._pstats_file, file=out)
+
+        if tracing:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            print(
+                "\nTop %d allocation sites of memory still held:"
+                % self._allocation_count,
+                file=out,
+            )
+            for stat in snapshot.statistics("lineno")[: self._allocation_count]:
+                print("  %s" % stat, file=out)
+
+
+def _get_max_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return max_rss  # macOS reports bytes
+    return max_rss * 1024  # Linux reports kilobytes
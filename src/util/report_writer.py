@@ -0,0 +1,94 @@
+from __future__ import annotations
+from typing import Any, TextIO
+from abc import ABC, abstractmethod
+import gzip
+
+
+class ReportWriter(ABC):
+    """Text sink into which reports write, usually via print(..., file=writer).
+    Output is collected in memory and handed to the target in large chunks."""
+
+    BUFFER_SIZE: int = 1 << 16  # characters to collect before writing to target
+
+    def __init__(self):
+        self._chunks: list[str] = []
+        self._buffered_size = 0
+
+    def __enter__(self) -> ReportWriter:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.flush()
+
+    def flush(self) -> None:
+        if self._chunks:
+            self._write_chunk("".join(self._chunks))
+            self._chunks = []
+            self._buffered_size = 0
+
+    def write(self, text: str) -> int:
+        self._chunks.append(text)
+        self._buffered_size += len(text)
+        if self._buffered_size >= self.BUFFER_SIZE:
+            self.flush()
+        return len(text)
+
+    @abstractmethod
+    def _write_chunk(self, text: str) -> None:
+        pass
+
+
+class StreamReportWriter(ReportWriter):
+    """Writes to an already-open text stream, such as stdout, leaving it open."""
+
+    def __init__(self, stream: TextIO):
+        super().__init__()
+        self._stream = stream
+
+    def flush(self) -> None:
+        super().flush()
+        self._stream.flush()
+
+    def _write_chunk(self, text: str) -> None:
+        self._stream.write(text)
+
+
+class FileReportWriter(ReportWriter):
+    """Writes to a file, compressing it with gzip when requested."""
+
+    def __init__(self, filename: str, compress: bool = False):
+        super().__init__()
+        if compress:
+            self._file: TextIO = gzip.open(filename, "wt", encoding="utf-8")
+        else:
+            self._file = open(filename, "w", encoding="utf-8")
+
+    def close(self) -> None:
+        super().close()
+        self._file.close()
+
+    def _write_chunk(self, text: str) -> None:
+        self._file.write(text)
+
+
+class MemoryReportWriter(ReportWriter):
+    """Keeps the output in memory, for comparing it without spawning processes."""
+
+    def __init__(self):
+        super().__init__()
+        self._written: list[str] = []
+
+    def get_text(self) -> str:
+        self.flush()
+        return "".join(self._written)
+
+    def _write_chunk(self, text: str) -> None:
+        self._written.append(text)
+
+
+def open_report_writer(filename: str) -> ReportWriter:
+    """Returns a writer for the named file, gzip-compressed if it ends in '.gz'."""
+    return FileReportWriter(filename, filename.endswith(".gz"))
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from typing import Generic, Iterator, TypeVar
+import math
+
+_T = TypeVar("_T")
+
+EARTH_RADIUS_METERS = 6371000.0
+METERS_PER_DEGREE = EARTH_RADIUS_METERS * math.pi / 180  # along a meridian
+
+
+class SpatialGrid(Generic[_T]):
+    """Index of items located by latitude and longitude, for finding the items
+    within a given distance of each other without comparing every pair of items.
+    The items are binned into a uniform grid of cells at least the given distance
+    wide, so items within the distance of each other are in the same or adjacent
+    cells. Cells are sized for the highest latitude among the items, where degrees
+    of longitude are narrowest, so the grid suits items spanning a region."""
+
+    def __init__(self, points: list[tuple[float, float, _T]], max_meters: float):
+        assert max_meters > 0
+        self.max_meters = max_meters
+        self._latitude_cell_degrees = max_meters / METERS_PER_DEGREE
+        max_abs_latitude = max((abs(point[0]) for point in points), default=0.0)
+        # Degrees of longitude shrink toward the poles; avoid dividing by ~0.
+        min_cosine = max(math.cos(math.radians(max_abs_latitude)), 1e-6)
+        self._longitude_cell_degrees = self._latitude_cell_degrees / min_cosine
+        self._cells: dict[tuple[int, int], list[tuple[float, float, _T]]] = {}
+        for point in points:
+            self._cells.setdefault(self._to_cell(point[0], point[1]), []).append(point)
+
+    def iter_near(
+        self, latitude: float, longitude: float
+    ) -> Iterator[tuple[_T, float]]:
+        """Yields each item within the distance of the given location, along with
+        its distance in meters."""
+        row, column = self._to_cell(latitude, longitude)
+        for row_offset in (-1, 0, 1):
+            for column_offset in (-1, 0, 1):
+                cell = self._cells.get((row + row_offset, column + column_offset))
+                if cell is None:
+                    continue
+                for point in cell:
+                    meters = get_distance_meters(
+                        latitude, longitude, point[0], point[1]
+                    )
+                    if meters <= self.max_meters:
+                        yield (point[2], meters)
+
+    def iter_pairs(self) -> Iterator[tuple[_T, _T, float]]:
+        """Yields each pair of items within the distance of each other, once per
+        pair, along with their distance in meters."""
+        for (row, column), cell in self._cells.items():
+            # Pair each cell with itself and with the adjacent cells that follow
+            # it, so that each pair of cells is visited only once.
+            for row_offset, column_offset in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+                other_cell = self._cells.get((row + row_offset, column + column_offset))
+                if other_cell is None:
+                    continue
+                same_cell = row_offset == 0 and column_offset == 0
+                for i, point in enumerate(cell):
+                    others = other_cell[i + 1 :] if same_cell else other_cell
+                    for other in others:
+                        meters = get_distance_meters(
+                            point[0], point[1], other[0], other[1]
+                        )
+                        if meters <= self.max_meters:
+                            yield (point[2], other[2], meters)
+
+    def _to_cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+        return (
+            math.floor(latitude / self._latitude_cell_degrees),
+            math.floor(longitude / self._longitude_cell_degrees),
+        )
+
+
+def get_distance_meters(
+    latitude1: float, longitude1: float, latitude2: float, longitude2: float
+) -> float:
+    """Returns the great-circle distance between two locations in meters."""
+    phi1 = math.radians(latitude1)
+    phi2 = math.radians(latitude2)
+    half_delta_phi = (phi2 - phi1) / 2
+    half_delta_lambda = math.radians(longitude2 - longitude1) / 2
+    a = (
+        math.sin(half_delta_phi) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(half_delta_lambda) ** 2
+    )
+    return 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(min(a, 1.0)))
@@ -0,0 +1,39 @@
+from src.util.aho_corasick import AhoCorasick
+
+
+class TestAhoCorasick:
+    def test_matches(self):
+
+        matcher = AhoCorasick(["he", "she", "his", "hers", ""])
+        matches = list(matcher.iter_matches("ushers"))
+        assert matches == [(1, 1), (2, 0), (2, 3)]
+        assert matcher.find_first_offsets("ushers his") == {0: 2, 1: 1, 2: 7, 3: 2}
+        assert matcher.find_first_offsets("xyz") == {}
+
+    def test_overlapping_suffixes(self):
+
+        matcher = AhoCorasick(["a", "aa", "aaa", "B., J"])
+        assert list(matcher.iter_matches("aaa")) == [
+            (0, 0),
+            (0, 1),
+            (1, 0),
+            (0, 2),
+            (1, 1),
+            (2, 0),
+        ]
+        assert matcher.find_first_offsets("Smith; B., J") == {3: 7}
+
+    def test_agrees_with_find(self):
+
+        patterns = ["Reddell", "Reddell, J", "dell", "Elliott", "ll", "J. R"]
+        matcher = AhoCorasick(patterns)
+        for text in [
+            "Reddell, J.; Elliott, W.",
+            "Reddell, James R.; Mitchell",
+            "J. Reddell, W. Elliott",
+            "",
+        ]:
+            expected = {
+                i: text.find(p) for i, p in enumerate(patterns) if text.find(p) >= 0
+            }
+            assert matcher.find_first_offsets(text) == expected
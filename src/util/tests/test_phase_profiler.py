@@ -0,0 +1,32 @@
+import io
+import pstats
+from typing import Any
+
+from src.util.phase_profiler import PhaseProfiler
+
+
+class TestPhaseProfiler:
+    def test_phases(self, tmp_path: Any):
+
+        pstats_file = str(tmp_path / "run.pstats")
+        profiler = PhaseProfiler(pstats_file, 3)
+        profiler.add_phase("parse args", 0.25)
+        with profiler.phase("load"):
+            values = [str(i) for i in range(1000)]
+        with profiler.phase("sort"):
+            values.sort()
+
+        out = io.StringIO()
+        profiler.finish(out)
+        lines = out.getvalue().splitlines()
+        assert lines[1].split()[-2:] == ["traced", "MB"]
+        assert [line.split()[0] for line in lines[2:6]] == [
+            "parse",
+            "load",
+            "sort",
+            "total",
+        ]
+        assert lines[2].split()[2] == "0.250"
+        assert len(lines[3].split()) == 4
+        assert "Top 3 allocation sites of memory still held:" in lines
+        assert pstats.Stats(pstats_file).total_calls > 0
@@ -0,0 +1,39 @@
+import random
+
+from src.util.spatial_grid import SpatialGrid, get_distance_meters
+
+
+class TestSpatialGrid:
+    def test_distance(self):
+        assert get_distance_meters(30, -98, 30, -98) == 0
+        meters = get_distance_meters(30, -98, 31, -98)
+        assert 111000 < meters < 111400
+        assert get_distance_meters(60, 10, 60, 11) < meters / 1.9
+
+    def test_pairs_match_all_pairs(self):
+
+        generator = random.Random(1)
+        points = [
+            (generator.uniform(29, 29.05), generator.uniform(-98.05, -98), i)
+            for i in range(300)
+        ] + [(60.0, 10.0, 300), (60.0, 10.001, 301)]
+        grid = SpatialGrid(points, 200)
+
+        expected: set[tuple[int, int]] = set()
+        for i, point1 in enumerate(points):
+            for point2 in points[i + 1 :]:
+                meters = get_distance_meters(point1[0], point1[1], point2[0], point2[1])
+                if meters <= 200:
+                    expected.add((point1[2], point2[2]))
+        found = [tuple(sorted((item1, item2))) for item1, item2, _ in grid.iter_pairs()]
+        assert len(found) == len(set(found))  # each pair only once
+        assert set(found) == expected
+        assert (300, 301) in expected
+
+        near = {item for item, _ in grid.iter_near(points[0][0], points[0][1])}
+        assert near == {0} | {i for pair in expected if 0 in pair for i in pair}
+
+    def test_no_points(self):
+        grid = SpatialGrid([], 100)
+        assert list(grid.iter_pairs()) == []
+        assert list(grid.iter_near(30, -98)) == []